@@ -0,0 +1,37 @@
+import argparse
+
+from src.batch import find_videos, process_batch
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Extract signatures from a directory of recorded signing videos without the GUI")
+    parser.add_argument("directory", help="directory of video files")
+    parser.add_argument("--output", default="signatures", help="output directory (default: signatures)")
+    parser.add_argument("--workers", type=int, help="number of worker processes (default: CPU count)")
+    parser.add_argument("--no-strokes", action="store_true", help="do not write stroke JSON files")
+    parser.add_argument("--save-unconfirmed", action="store_true",
+                        help="also save a valid signature left on the board at the end of a video")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    videos = find_videos(args.directory)
+    if not videos:
+        print(f"[ERROR] No video files found in {args.directory}")
+        return
+
+    print(f"[INFO] Processing {len(videos)} videos")
+    results = process_batch(videos, args.output, export_strokes=not args.no_strokes,
+                            save_unconfirmed=args.save_unconfirmed, workers=args.workers)
+    for result in results:
+        if "error" in result:
+            print(f"[ERROR] {result['video']}: {result['error']} (after {result['frames']} frames, "
+                  f"{len(result['signatures'])} signatures saved)")
+        else:
+            print(f"[INFO] {result['video']}: {result['frames']} frames, {len(result['signatures'])} signatures")
+
+
+if __name__ == "__main__":
+    main()
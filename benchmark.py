@@ -0,0 +1,50 @@
+import argparse
+
+from src.benchmark import BenchmarkRunner, format_markdown, run_replay, write_results
+from src.capture.frame_source import ImageSequenceSource, SyntheticSource, VideoFileSource
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Replay a video file or a synthetic stream through the processing path without a display")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--video", metavar="PATH", help="video file to replay")
+    source.add_argument("--images", metavar="DIR", help="directory of images to replay in name order")
+    source.add_argument("--replay", metavar="LOG",
+                        help="session log recorded with main.py --record-session, replayed without MediaPipe")
+    source.add_argument("--synthetic", metavar="FRAMES", type=int, default=300,
+                        help="number of synthetic frames to generate (default: 300); they contain no hand, "
+                             "so only the pipeline overhead is measured")
+    parser.add_argument("--resolution", default="640x480", help="synthetic frame size (default: 640x480)")
+    parser.add_argument("--fps-cap", type=int, default=30, help="FPS setting used for frame skipping (default: 30)")
+    parser.add_argument("--repeat", type=int, default=1, help="number of times to replay a session log")
+    parser.add_argument("--max-frames", type=int, help="stop after this many frames")
+    parser.add_argument("--json", metavar="PATH", help="write results as JSON")
+    parser.add_argument("--markdown", metavar="PATH", help="write results as a markdown report")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    if args.replay:
+        results = run_replay(args.replay, args.repeat)
+        write_results(results, args.json, args.markdown)
+        print(format_markdown(results))
+        return
+
+    if args.video:
+        source, name = VideoFileSource(args.video), args.video
+    elif args.images:
+        source, name = ImageSequenceSource(args.images), args.images
+    else:
+        width, height = map(int, args.resolution.split('x'))
+        source, name = SyntheticSource(width, height, args.synthetic), f"synthetic ({args.synthetic} frames)"
+
+    results = BenchmarkRunner(source, name, fps_cap=args.fps_cap).run(max_frames=args.max_frames)
+    write_results(results, args.json, args.markdown)
+    print(format_markdown(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,27 @@
+import argparse
 import sys
 import os
+import time
 import traceback
+
+from src.utils.startup_profiler import startup_profiler
+
+# Heavy modules, imported one by one with --profile-startup so each gets its own import cost
+STARTUP_IMPORTS = ("PySide6.QtWidgets", "PySide6.QtMultimedia", "numpy", "cv2", "src.video_thread",
+                   "src.ui.main_window")
+if any(arg == "--profile-startup" or arg.startswith("--profile-startup=") for arg in sys.argv[1:]):
+    startup_profiler.enabled = True
+    startup_profiler.time_imports(STARTUP_IMPORTS)
+
 from PySide6.QtWidgets import QApplication, QMessageBox
 
+from src.capture.camera_probe import CameraProber
+from src.model.inference_pool import InferencePool
+from src.model.inference_process import InferenceProcess
+from src.model.recognizer_cache import recognizer_cache
+from src.model.warm_up import ModelWarmUp
 from src.ui.main_window import MainWindow
+from src.utils.tracer import ChromeTracer
 
 
 def exception_hook(exctype, value, tb):
@@ -26,19 +44,104 @@ def exception_hook(exctype, value, tb):
     msg.exec()
 
 
+def camera_indices(value):
+    """Parse a comma-separated list of camera indices such as "0,1"."""
+    try:
+        return [int(index) for index in value.split(",")]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid camera list: {value}")
+
+
+def parse_args():
+    """Parse application options, leaving Qt's own arguments untouched."""
+    parser = argparse.ArgumentParser(description="DeepSignus virtual signature")
+    parser.add_argument("--cameras", metavar="INDICES", type=camera_indices, default=[0],
+                        help="comma-separated camera indices shown side by side (default: 0)")
+    parser.add_argument("--inference-workers", metavar="N", type=int,
+                        help="recognize the frames of all cameras on N shared workers "
+                             "(default: one per camera up to the number of cores with several cameras, "
+                             "0 = one recognizer per camera)")
+    parser.add_argument("--inference-process", action="store_true",
+                        help="recognize gestures in a separate process, frames are passed through shared memory")
+    parser.add_argument("--trace", metavar="DIR",
+                        help="record video pipeline spans as Chrome trace JSON files in DIR")
+    parser.add_argument("--record-session", metavar="PATH",
+                        help="record every frame's gesture result to a session log for replay benchmarks")
+    parser.add_argument("--measure-latency", action="store_true",
+                        help="measure glass-to-glass and fingertip-to-ink latency and print it on exit")
+    parser.add_argument("--camera-probe", action="store_true",
+                        help="probe cameras without cached modes for their fastest mode (takes several seconds "
+                             "on the first start of each camera)")
+    parser.add_argument("--mjpeg-decode-workers", metavar="N", type=int, default=0,
+                        help="decode MJPG frames on N threads instead of the capture thread")
+    parser.add_argument("--decode-scale", type=int, choices=(1, 2, 4, 8), default=1,
+                        help="with --mjpeg-decode-workers, decode frames at 1/n size (default: 1)")
+    parser.add_argument("--profile-startup", metavar="PATH", nargs="?", const="startup_profile.md",
+                        help="time the startup phases and write a ranked report on exit "
+                             "(default: startup_profile.md)")
+    return parser.parse_known_args()
+
+
 def main():
     # Set up exception handling
     sys.excepthook = exception_hook
+    args, qt_args = parse_args()
 
     try:
         print("[INFO] Starting application")
-        app = QApplication(sys.argv)
+        with startup_profiler.phase("QApplication"):
+            app = QApplication(sys.argv[:1] + qt_args)
         print("[INFO] QApplication created")
-        window = MainWindow()
+        with startup_profiler.phase("MainWindow"):
+            window = MainWindow(args.cameras)
         print("[INFO] MainWindow created")
-        window.show()
-        print("[INFO] Window shown")
-        sys.exit(app.exec())
+        # Cached modes are always used, unknown cameras are only probed on request
+        prober = CameraProber(probe_new_devices=args.camera_probe)
+        tracer = ChromeTracer(args.trace) if args.trace else None
+        workers = args.inference_workers
+        if workers is None and len(args.cameras) > 1:
+            workers = min(len(args.cameras), os.cpu_count() or 1)
+        inference_pool = InferencePool(workers) if workers and not args.inference_process else None
+        # Started by the first capture, so the window does not wait for the process
+        inference_process = InferenceProcess() if args.inference_process else None
+        for thread in window.video_threads:
+            thread.inference_pool = inference_pool
+            thread.inference_process = inference_process
+            thread.camera_prober = prober
+            thread.mjpeg_decode_workers = args.mjpeg_decode_workers
+            thread.decode_reduction = args.decode_scale
+            if tracer is not None:
+                thread.set_tracer(tracer)
+            if args.measure_latency:
+                thread.latency.enabled = True
+        # A session log replays a single camera
+        if args.record_session:
+            window.VideoThread.record_session_path = args.record_session
+        with startup_profiler.phase("show window"):
+            window.show()
+        startup_profiler.mark("window shown")
+        print(f"[INFO] Window shown after {time.perf_counter() - startup_profiler.origin:.2f} s")
+        # mediapipe and the model are loaded while the window is already visible
+        warm_up = ModelWarmUp()
+        warm_up.start()
+        exit_code = app.exec()
+        # Recognizers stay open between capture runs, close them once on exit
+        warm_up.wait()
+        if inference_pool is not None:
+            inference_pool.stop()
+        if inference_process is not None:
+            inference_process.stop()
+        recognizer_cache.clear()
+        if tracer is not None:
+            tracer.close()
+        if args.measure_latency:
+            for thread in window.video_threads:
+                print(f"[INFO] Latency distributions of camera {thread.camera_index}:")
+                print(thread.latency.format_report())
+        if args.profile_startup:
+            startup_profiler.write(args.profile_startup)
+            print(startup_profiler.format_report())
+        sys.exit(exit_code)
     except Exception as e:
         print(f"[ERROR] Exception in main: {str(e)}")
         traceback.print_exc()
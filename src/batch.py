@@ -0,0 +1,117 @@
+import glob
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import cv2
+
+from src.capture.frame_source import VideoFileSource
+from src.model.signature import SignatureRecognition
+from src.utils.timers import ManualClock
+from src.video_thread import VideoThread
+
+VIDEO_EXTENSIONS = (".mp4", ".avi", ".mov", ".mkv", ".webm")
+
+# Recognizer state of the current worker process, set up once by init_worker
+_worker = {}
+
+
+def find_videos(directory):
+    """Video files of a directory in file name order"""
+    return sorted(path for path in glob.glob(os.path.join(directory, "*"))
+                  if path.lower().endswith(VIDEO_EXTENSIONS))
+
+
+def init_worker():
+    """Create the VIDEO mode recognizer of a worker process"""
+    sign_model = SignatureRecognition("VIDEO")
+    _worker["sign_model"] = sign_model
+    _worker["recognizer"] = sign_model.setup_recognizer()
+    # VIDEO mode requires increasing timestamps for the lifetime of the recognizer,
+    # so every video continues after the last timestamp of the previous one
+    _worker["timestamp_ms"] = 0
+
+
+def reset_thread(thread, output_dir, export_strokes):
+    """Reset the drawing and gesture state left over from the previous video"""
+    thread.signatures_dir = output_dir
+    thread.export_strokes = export_strokes
+    thread.saved_signatures = []
+    thread.reset_strokes()
+    thread.timers.reset()
+    thread.gesture_state.reset()
+
+
+def process_video(path, output_dir, export_strokes=True, save_unconfirmed=False):
+    """
+    Run a video through the recognizer of this worker and the gesture rules of
+    VideoThread.handle_gestures. Signatures confirmed with Thumb_Up are saved to
+    `output_dir/<video name>/`; with `save_unconfirmed` a valid signature still on
+    the board at the end of the video is saved as well.
+    """
+    sign_model = _worker["sign_model"]
+    recognizer = _worker["recognizer"]
+
+    source = VideoFileSource(path)
+    if not source.open():
+        return {"video": path, "frames": 0, "signatures": [], "error": "cannot open video"}
+    fps = source.cap.get(cv2.CAP_PROP_FPS) or 30.0
+
+    thread = VideoThread()
+    thread.sign_model = sign_model
+    thread.init_drawing_board(*source.frame_size)
+    reset_thread(thread, os.path.join(output_dir, os.path.splitext(os.path.basename(path))[0]), export_strokes)
+
+    # Gesture timers (thumb up hold, cooldowns, message durations) run on the video time
+    video_time = ManualClock()
+    thread.timers.clock = video_time
+
+    base_ms = _worker["timestamp_ms"]
+    timestamp_ms = base_ms
+    frames = 0
+    try:
+        while True:
+            ret, frame = source.read()
+            if not ret:
+                break
+            video_time.set(frames / fps)
+            timestamp_ms = max(timestamp_ms + 1, base_ms + int(video_time() * 1000))
+
+            frame = cv2.flip(frame, 1)
+            result = sign_model.recognize_for_video(recognizer, frame, timestamp_ms)
+            if result:
+                thread.show_wireframe(frame, result)
+                thread.handle_gestures(frame, result)
+            frames += 1
+
+        if save_unconfirmed and thread.is_signature_valid():
+            thread.save_signature()
+    except Exception as e:
+        # One broken video does not cost the results of the others
+        return {"video": path, "frames": frames, "signatures": list(thread.saved_signatures), "error": str(e)}
+    finally:
+        source.release()
+        _worker["timestamp_ms"] = timestamp_ms + 1
+
+    return {"video": path, "frames": frames, "signatures": list(thread.saved_signatures)}
+
+
+def process_batch(videos, output_dir, export_strokes=True, save_unconfirmed=False, workers=None):
+    """
+    Process video files with one recognizer per worker process and return the
+    results of process_video in input order. With `workers=1` everything runs in
+    this process.
+    """
+    workers = workers or os.cpu_count() or 1
+    workers = min(workers, max(1, len(videos)))
+
+    if workers == 1:
+        init_worker()
+        return [process_video(path, output_dir, export_strokes, save_unconfirmed) for path in videos]
+
+    # Spawned workers behave the same on every platform and start without the parent's Qt state
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=init_worker) as executor:
+        futures = [executor.submit(process_video, path, output_dir, export_strokes, save_unconfirmed)
+                   for path in videos]
+        return [future.result() for future in futures]
@@ -0,0 +1,159 @@
+import json
+import platform
+import time
+
+import cv2
+from src.model.session_log import SessionLog, replay_session
+from src.model.signature import SignatureRecognition
+from src.utils.utils import get_memory_usage_mb
+from src.video_thread import VideoThread
+
+
+class BenchmarkRunner:
+    """
+    Pushes the frames of a FrameSource through VideoThread's real processing path
+    (SignatureRecognition + process_frame) without a Qt display. Recognition runs in
+    LIVE_STREAM mode, so the run waits up to `result_timeout` seconds for the results
+    of the frames still in the recognizer before the clock stops.
+    """
+
+    def __init__(self, source, source_name, fps_cap=30, result_timeout=2.0):
+        self.source = source
+        self.source_name = source_name
+        self.fps_cap = fps_cap
+        self.result_timeout = result_timeout
+
+    def run(self, max_frames=None):
+        """Process the frames and return the results as a dict"""
+        thread = VideoThread()
+        thread.fps_cap = self.fps_cap
+        thread.profiler.enabled = True
+        thread.profiler.reset()
+        thread.signature_points = []
+
+        memory_start = get_memory_usage_mb()
+        thread.sign_model = SignatureRecognition()
+
+        if not self.source.open():
+            raise IOError(f"Cannot open {self.source_name}")
+        thread.init_drawing_board(*self.source.frame_size)
+        thread.prepare_processing()
+
+        count = 0
+        start = time.perf_counter()
+        with thread.sign_model.recognizer_context_manager() as recognizer:
+            while max_frames is None or count < max_frames:
+                frame_start = time.perf_counter()
+                with thread.profiler.stage("read"):
+                    ret, frame = self.source.read()
+                if not ret:
+                    break
+
+                pic = thread.process_frame(frame, recognizer, frame_start)
+                with thread.profiler.stage("emit"):
+                    thread.ImageUpdate.emit(pic)
+                thread.profiler.add("frame", frame_start, time.perf_counter())
+                count += 1
+
+            # Timestamps of a run start at 0, the last submitted frame has timestamp_ms - 1
+            if thread.timestamp_ms > 0 and not thread.sign_model.wait_for_result(thread.timestamp_ms - 1,
+                                                                                  self.result_timeout):
+                print(f"[WARNING] No result for the last frame after {self.result_timeout} s")
+        duration = time.perf_counter() - start
+        self.source.release()
+        results = thread.sign_model.completed_results
+
+        return {
+            "source": self.source_name,
+            "resolution": f"{thread.window_width}x{thread.window_height}",
+            "fps_cap": self.fps_cap,
+            "frames": count,
+            "duration_s": duration,
+            "fps": count / duration if duration > 0 else 0.0,
+            "results": results,
+            "results_per_s": results / duration if duration > 0 else 0.0,
+            "stages": thread.profiler.snapshot(),
+            "signature_points": len(thread.signature_points),
+            "dropped_frames": thread.sign_model.dropped_frames,
+            "memory_start_mb": memory_start,
+            "memory_end_mb": get_memory_usage_mb(),
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "opencv": cv2.__version__,
+        }
+
+
+def run_replay(path, repeat=1):
+    """
+    Replay a recorded session through the gesture and drawing path without MediaPipe
+    and return results in the same format as BenchmarkRunner.run()
+    """
+    log = SessionLog(path)
+    thread = VideoThread()
+    thread.profiler.enabled = True
+    thread.profiler.reset()
+    thread.signature_points = []
+
+    memory_start = get_memory_usage_mb()
+    thread.sign_model = SignatureRecognition()
+
+    count = 0
+    start = time.perf_counter()
+    for _ in range(repeat):
+        count += replay_session(log, thread)
+    duration = time.perf_counter() - start
+
+    return {
+        "source": f"replay of {path} x{repeat}",
+        "resolution": f"{log.width}x{log.height}",
+        "fps_cap": thread.fps_cap,
+        "frames": count,
+        "duration_s": duration,
+        "fps": count / duration if duration > 0 else 0.0,
+        # Every replayed frame carries its recorded result
+        "results": count,
+        "results_per_s": count / duration if duration > 0 else 0.0,
+        "stages": thread.profiler.snapshot(),
+        "signature_points": len(thread.signature_points),
+        "dropped_frames": 0,
+        "memory_start_mb": memory_start,
+        "memory_end_mb": get_memory_usage_mb(),
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "opencv": cv2.__version__,
+    }
+
+
+def format_markdown(results):
+    """Format benchmark results as a markdown report"""
+    def mb(value):
+        return f"{value:.0f}" if value is not None else "n/a"
+
+    report = "# Benchmark Results\n\n"
+    report += f"**Source:** {results['source']} ({results['resolution']}, fps cap {results['fps_cap']})\n\n"
+    report += f"**Platform:** {results['platform']}, Python {results['python']}, OpenCV {results['opencv']}\n\n"
+    report += ("| Frames | Duration (s) | FPS | Results | Results/s | Signature Points | Dropped "
+               "| Memory Start (MB) | Memory End (MB) |\n")
+    report += ("|--------|--------------|-----|---------|-----------|------------------|---------"
+               "|-------------------|-----------------|\n")
+    report += (f"| {results['frames']} | {results['duration_s']:.2f} | {results['fps']:.1f} | "
+               f"{results['results']} | {results['results_per_s']:.1f} | "
+               f"{results['signature_points']} | {results['dropped_frames']} | "
+               f"{mb(results['memory_start_mb'])} | {mb(results['memory_end_mb'])} |\n\n")
+
+    report += "| Stage | Count | Mean (ms) | p50 | p95 | p99 | Max |\n"
+    report += "|-------|-------|-----------|-----|-----|-----|-----|\n"
+    for name, s in results["stages"].items():
+        report += (f"| {name} | {s['count']} | {s['mean']:.2f} | {s['p50']:.2f} | {s['p95']:.2f} | "
+                   f"{s['p99']:.2f} | {s['max']:.2f} |\n")
+    return report
+
+
+def write_results(results, json_path=None, markdown_path=None):
+    """Write results as JSON and/or markdown"""
+    if json_path:
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    if markdown_path:
+        with open(markdown_path, "w", encoding="utf-8") as f:
+            f.write(format_markdown(results))
@@ -0,0 +1,34 @@
+from PySide6.QtCore import QThread, Signal
+from PySide6.QtMultimedia import QMediaDevices
+
+from src.utils.startup_profiler import startup_profiler
+
+# Interval of the camera polling used until the platform reports device changes
+POLL_INTERVAL_MS = 5000
+
+
+def camera_modes(camera):
+    """(width, height, max fps) combinations a QCameraDevice reports, largest first"""
+    modes = {(video_format.resolution().width(), video_format.resolution().height(),
+              int(video_format.maxFrameRate())) for video_format in camera.videoFormats()}
+    return sorted(modes, reverse=True)
+
+
+class CameraEnumerator(QThread):
+    """
+    Lists the video inputs on a worker thread, since enumeration can block for a while.
+    The video formats of a device are read the first time it is seen and cached by
+    device id, so later enumerations only pay for the device list.
+    """
+    CamerasFound = Signal(list)
+    # Device id -> camera_modes(), shared by all enumerations
+    capabilities = {}
+
+    def run(self):
+        with startup_profiler.once("first QMediaDevices.videoInputs"):
+            cameras = list(QMediaDevices.videoInputs())
+        for camera in cameras:
+            device_id = bytes(camera.id())
+            if device_id not in self.capabilities:
+                self.capabilities[device_id] = camera_modes(camera)
+        self.CamerasFound.emit(cameras)
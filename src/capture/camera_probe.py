@@ -0,0 +1,153 @@
+import json
+import os
+import threading
+import time
+from collections import namedtuple
+
+import cv2
+
+# Formats offered in the camera settings dock
+CODECS = ("MJPG", "YUYV")
+RESOLUTIONS = ((640, 480), (1280, 720), (1920, 1080))
+FPS_OPTIONS = (30, 60)
+
+# Names drivers report for the same format
+CODEC_ALIASES = {"YUYV": ("YUYV", "YUY2")}
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".virtual_signature", "camera_modes.json")
+
+# udev links named after the model and serial number of each camera
+V4L_BY_ID = "/dev/v4l/by-id"
+
+CameraMode = namedtuple("CameraMode", "codec width height fps measured_fps")
+
+
+def fourcc_name(value):
+    """Decode a CAP_PROP_FOURCC value into its four characters"""
+    value = int(value)
+    return "".join(chr((value >> 8 * i) & 0xFF) for i in range(4))
+
+
+def codec_matches(codec, value):
+    """True if a CAP_PROP_FOURCC read-back means `codec` is in use"""
+    return fourcc_name(value) in CODEC_ALIASES.get(codec, (codec,))
+
+
+def camera_device_id(camera_index):
+    """
+    Name of a camera that stays the same when cameras are re-plugged in another order:
+    its /dev/v4l/by-id link on Linux. Other platforms only expose the index to OpenCV.
+    """
+    device = f"/dev/video{camera_index}"
+    try:
+        for name in sorted(os.listdir(V4L_BY_ID)):
+            if os.path.realpath(os.path.join(V4L_BY_ID, name)) == device:
+                return name
+    except OSError:
+        pass
+    return str(camera_index)
+
+
+class CameraProber:
+    """
+    Finds the format, resolution and FPS combinations a camera really delivers by
+    setting each one, reading it back and timing a few frames. Results are cached
+    on disk per device, since probing a camera takes several seconds. With
+    `probe_new_devices` off only cached modes are used and unknown cameras open
+    with the default settings.
+    """
+
+    def __init__(self, cache_path: str = DEFAULT_CACHE_PATH, sample_frames: int = 20, warmup_frames: int = 3,
+                 probe_new_devices: bool = True):
+        self.cache_path = cache_path
+        self.sample_frames = sample_frames
+        self.warmup_frames = warmup_frames
+        self.probe_new_devices = probe_new_devices
+        # Shared by the sessions of all cameras, which may open at the same time
+        self.lock = threading.Lock()
+        self.cache = self.load()
+
+    def load(self):
+        """Read the cache file, an empty cache if it is missing or damaged"""
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                data = json.load(f)
+            return {device: [CameraMode(**mode) for mode in modes] for device, modes in data.items()}
+        except (OSError, ValueError, TypeError) as e:
+            if os.path.exists(self.cache_path):
+                print(f"[WARNING] Ignoring camera mode cache {self.cache_path}: {e}")
+            return {}
+
+    def save(self):
+        directory = os.path.dirname(self.cache_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        with open(self.cache_path, "w", encoding="utf-8") as f:
+            json.dump({device: [mode._asdict() for mode in modes] for device, modes in self.cache.items()}, f,
+                      indent=2)
+
+    def modes(self, cap, device_id, refresh=False):
+        """Modes of the open camera `cap`, probed on first use of `device_id` and cached"""
+        with self.lock:
+            if refresh or device_id not in self.cache:
+                if not self.probe_new_devices:
+                    return []
+                print(f"[INFO] Probing camera modes of {device_id}")
+                self.cache[device_id] = self.probe(cap)
+                self.save()
+            return self.cache[device_id]
+
+    def probe(self, cap):
+        """Try every codec, resolution and FPS on `cap` and return the modes it accepts"""
+        modes = []
+        seen = set()
+        for codec in CODECS:
+            for width, height in RESOLUTIONS:
+                for fps in FPS_OPTIONS:
+                    cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*codec))
+                    cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+                    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+                    cap.set(cv2.CAP_PROP_FPS, fps)
+
+                    # Drivers silently fall back to another mode, only read-back values count
+                    if not codec_matches(codec, cap.get(cv2.CAP_PROP_FOURCC)):
+                        continue
+                    if (int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)), int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))) != \
+                            (width, height):
+                        continue
+                    actual_fps = round(cap.get(cv2.CAP_PROP_FPS)) or fps
+                    if (codec, width, height, actual_fps) in seen:
+                        continue
+                    seen.add((codec, width, height, actual_fps))
+
+                    measured = self.measure_throughput(cap)
+                    if measured > 0:
+                        modes.append(CameraMode(codec, width, height, actual_fps, round(measured, 1)))
+        print(f"[INFO] Camera modes found: {len(modes)}")
+        return modes
+
+    def measure_throughput(self, cap):
+        """Frames per second actually delivered in the current mode, 0 if frames cannot be read"""
+        for _ in range(self.warmup_frames):
+            if not cap.read()[0]:
+                return 0.0
+        start = time.perf_counter()
+        for _ in range(self.sample_frames):
+            if not cap.read()[0]:
+                return 0.0
+        duration = time.perf_counter() - start
+        return self.sample_frames / duration if duration > 0 else 0.0
+
+    @staticmethod
+    def best_mode(modes, resolution, fps):
+        """
+        Fastest mode with at least the requested resolution. The smallest fitting
+        resolution is preferred; throughput above the requested FPS does not count.
+        """
+        width, height = resolution
+        fitting = [mode for mode in modes if mode.width >= width and mode.height >= height]
+        if not fitting:
+            return None
+        smallest = min(mode.width * mode.height for mode in fitting)
+        return max((mode for mode in fitting if mode.width * mode.height == smallest),
+                   key=lambda mode: (min(mode.measured_fps, fps), mode.measured_fps))
@@ -0,0 +1,421 @@
+import glob
+import os
+import platform
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2
+import numpy as np
+
+from src.capture.camera_probe import CameraProber, camera_device_id, codec_matches, fourcc_name
+from src.utils.startup_profiler import startup_profiler
+
+
+class FrameSource:
+    """
+    Interface of everything VideoThread can read frames from.
+    Implementations return BGR frames from `read()` with the same (ret, frame)
+    contract as cv2.VideoCapture.read().
+    """
+
+    def open(self) -> bool:
+        """Open the source, returns True on success"""
+        raise NotImplementedError
+
+    def read(self):
+        """Return (ret, frame) for the next frame"""
+        raise NotImplementedError
+
+    def release(self):
+        """Release the underlying resources"""
+
+    def is_opened(self) -> bool:
+        raise NotImplementedError
+
+    @property
+    def frame_size(self) -> tuple[int, int]:
+        """Size (width, height) of the frames delivered by read()"""
+        raise NotImplementedError
+
+    def timestamp_msec(self) -> float:
+        """Timestamp of the last frame in milliseconds, 0 if unknown"""
+        return 0.0
+
+    def configure(self, fps: int, resolution: tuple[int, int]) -> bool:
+        """Apply a new FPS and resolution to the open source, returns False if it has to be reopened"""
+        return False
+
+    def show_settings(self):
+        """Open the driver settings dialog if the source has one"""
+        print("[ERROR] This frame source has no settings dialog")
+
+
+class CameraSource(FrameSource):
+    """Live camera read through cv2.VideoCapture"""
+
+    def __init__(self, camera_index: int = 0, fps: int = 30, resolution: tuple[int, int] = (640, 480),
+                 prober: CameraProber = None):
+        self.camera_index = camera_index
+        self.fps = fps
+        self.resolution = resolution
+        # Optional CameraProber used to pick the fastest mode the camera really delivers
+        self.prober = prober
+        self.cap = None
+
+    def open(self):
+        """Open the camera with the specified settings in a cross-platform way"""
+        print(f"[INFO] Initializing camera {self.camera_index}")
+        with startup_profiler.once("camera open"):
+            opened = self.open_capture()
+        if not opened:
+            return False
+        with startup_profiler.once("codec negotiation"):
+            self.negotiate_codec()
+        return True
+
+    def open_capture(self):
+        """Open the capture device, falling back to camera 0"""
+        # Choose backend depending on OS
+        system_platform = platform.system()
+        if system_platform == "Windows":
+            self.cap = cv2.VideoCapture(self.camera_index, cv2.CAP_DSHOW)
+            print("[INFO] Using backend: CAP_DSHOW (Windows)")
+        else:
+            self.cap = cv2.VideoCapture(self.camera_index)  # Default backend for Linux/macOS
+            print("[INFO] Using default backend (non-Windows)")
+
+        # Retry logic
+        if not self.cap.isOpened():
+            print(f"[WARNING] Failed to open camera {self.camera_index}. Trying default index 0.")
+            self.cap.release()
+            self.cap = cv2.VideoCapture(0)
+
+        if not self.cap.isOpened():
+            print("[ERROR] Failed to open any camera")
+            return False
+
+        print("[INFO] Camera opened successfully")
+
+        # Set camera properties
+        self.set_capture_properties()
+        return True
+
+    @property
+    def device_id(self):
+        """Key of the camera in the mode cache"""
+        return f"{self.cap.getBackendName()}:{camera_device_id(self.camera_index)}"
+
+    def negotiate_codec(self):
+        """Select the capture format and report the codec in use"""
+        if self.prober is not None and self.apply_best_mode():
+            return
+
+        # Check if MJPG is supported
+        print("[INFO] Checking supported codecs...")
+
+        available_codecs = self.check_supported_codecs()
+
+        if "MJPG" in available_codecs:
+            print("[INFO] MJPG codec is supported, setting MJPG codec.")
+            fourcc = cv2.VideoWriter_fourcc(*"MJPG")
+            self.cap.set(cv2.CAP_PROP_FOURCC, fourcc)
+        else:
+            print("[WARNING] MJPG not supported, trying YUYV codec.")
+            if "YUYV" in available_codecs:
+                fourcc = cv2.VideoWriter_fourcc(*"YUYV")
+                self.cap.set(cv2.CAP_PROP_FOURCC, fourcc)
+            else:
+                print("[ERROR] Neither MJPG nor YUYV codecs are supported. Using default settings.")
+        # The format can reset the resolution on some drivers
+        self.set_capture_properties()
+
+        # Check if the codec was actually applied
+        print(f"[INFO] Camera FOURCC codec in use: {fourcc_name(self.cap.get(cv2.CAP_PROP_FOURCC))}")
+
+    def apply_best_mode(self):
+        """Apply the fastest probed mode meeting the requested resolution, returns False if there is none"""
+        for refresh in (False, True):
+            modes = self.prober.modes(self.cap, self.device_id, refresh=refresh)
+            mode = self.prober.best_mode(modes, self.resolution, self.fps)
+            if mode is None:
+                return False
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*mode.codec))
+            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, mode.width)
+            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, mode.height)
+            self.cap.set(cv2.CAP_PROP_FPS, mode.fps)
+            # A different device can appear under a cached index, probe it again then
+            if codec_matches(mode.codec, self.cap.get(cv2.CAP_PROP_FOURCC)) and self.frame_size == (mode.width,
+                                                                                                  mode.height):
+                print(f"[INFO] Using camera mode {mode.codec} {mode.width}x{mode.height} @ {mode.fps} FPS "
+                      f"(measured {mode.measured_fps} FPS)")
+                return True
+        return False
+
+    def check_supported_codecs(self):
+        """
+        Check which codecs the open camera accepts by setting each one and reading it back.
+        Returns a list of supported codec names (as strings).
+        """
+        supported_codecs = []
+        original_fourcc = self.cap.get(cv2.CAP_PROP_FOURCC)
+        for codec in ("MJPG", "YUYV", "H264"):
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*codec))
+            if codec_matches(codec, self.cap.get(cv2.CAP_PROP_FOURCC)):
+                supported_codecs.append(codec)
+        self.cap.set(cv2.CAP_PROP_FOURCC, original_fourcc)
+
+        print(f"[INFO] Available codecs: {supported_codecs}")
+        return supported_codecs
+
+    def set_capture_properties(self):
+        """Request the configured FPS and resolution from the driver"""
+        self.cap.set(cv2.CAP_PROP_FPS, self.fps)
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.resolution[0])
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.resolution[1])
+
+    def configure(self, fps, resolution):
+        """Change FPS and resolution of the open camera without releasing it, choosing the mode as open() does"""
+        self.fps = fps
+        self.resolution = resolution
+        self.negotiate_codec()
+        return True
+
+    def read(self):
+        return self.cap.read()
+
+    def release(self):
+        if self.cap is not None:
+            self.cap.release()
+
+    def is_opened(self):
+        return self.cap is not None and self.cap.isOpened()
+
+    @property
+    def frame_size(self):
+        return int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)), int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+
+    def timestamp_msec(self):
+        return self.cap.get(cv2.CAP_PROP_POS_MSEC)
+
+    def show_settings(self):
+        self.cap.set(cv2.CAP_PROP_SETTINGS, 1)
+
+
+class MjpegCameraSource(CameraSource):
+    """
+    Camera delivering undecoded MJPG buffers (CAP_PROP_CONVERT_RGB=0) that are decoded
+    on a thread pool, so JPEG decoding is not limited to the capture thread. Up to
+    `decode_workers` frames are decoded ahead and returned in capture order. With a
+    `reduction` of 2, 4 or 8 the JPEG is decoded directly at 1/n size.
+    """
+    DECODE_FLAGS = {1: cv2.IMREAD_COLOR, 2: cv2.IMREAD_REDUCED_COLOR_2, 4: cv2.IMREAD_REDUCED_COLOR_4,
+                    8: cv2.IMREAD_REDUCED_COLOR_8}
+
+    def __init__(self, camera_index: int = 0, fps: int = 30, resolution: tuple[int, int] = (640, 480),
+                 decode_workers: int = 3, reduction: int = 1):
+        super().__init__(camera_index, fps, resolution)
+        if reduction not in self.DECODE_FLAGS:
+            raise ValueError(f"Unsupported reduction {reduction}, use one of {sorted(self.DECODE_FLAGS)}")
+        self.decode_workers = decode_workers
+        self.reduction = reduction
+        self.executor = None
+        self.pending = deque()
+        self._timestamp = 0.0
+
+    def open(self):
+        if not super().open():
+            return False
+        # Compressed buffers are only delivered when the backend skips its own conversion
+        if not self.cap.set(cv2.CAP_PROP_CONVERT_RGB, 0):
+            print("[WARNING] Backend does not deliver raw MJPG buffers, frames arrive decoded")
+        self.executor = ThreadPoolExecutor(max_workers=self.decode_workers, thread_name_prefix="mjpeg-decode")
+        self.pending.clear()
+        print(f"[INFO] Decoding MJPG on {self.decode_workers} threads at 1/{self.reduction} size")
+        return True
+
+    def negotiate_codec(self):
+        """The decode path needs MJPG"""
+        self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
+        self.set_capture_properties()
+        print(f"[INFO] Camera FOURCC codec in use: {fourcc_name(self.cap.get(cv2.CAP_PROP_FOURCC))}")
+
+    def configure(self, fps, resolution):
+        # Frames decoded ahead have the old size
+        self.discard_pending()
+        return super().configure(fps, resolution)
+
+    def decode(self, buffer):
+        if buffer.ndim == 3:
+            # The backend ignored CAP_PROP_CONVERT_RGB and decoded the frame itself
+            if self.reduction == 1:
+                return buffer
+            return cv2.resize(buffer, None, fx=1 / self.reduction, fy=1 / self.reduction,
+                              interpolation=cv2.INTER_AREA)
+        return cv2.imdecode(buffer.reshape(-1), self.DECODE_FLAGS[self.reduction])
+
+    def read(self):
+        # Keep every decode worker busy; frames leave in the order they were captured
+        while len(self.pending) < self.decode_workers:
+            ret, buffer = self.cap.read()
+            if not ret:
+                break
+            self.pending.append((self.executor.submit(self.decode, buffer), self.cap.get(cv2.CAP_PROP_POS_MSEC)))
+        if not self.pending:
+            return False, None
+        future, self._timestamp = self.pending.popleft()
+        frame = future.result()
+        return frame is not None, frame
+
+    def discard_pending(self):
+        while self.pending:
+            self.pending.popleft()[0].result()
+
+    def release(self):
+        if self.executor is not None:
+            self.discard_pending()
+            self.executor.shutdown(wait=True)
+            self.executor = None
+        super().release()
+
+    @property
+    def frame_size(self):
+        width, height = super().frame_size
+        return -(-width // self.reduction), -(-height // self.reduction)
+
+    def timestamp_msec(self):
+        return self._timestamp
+
+
+class VideoFileSource(FrameSource):
+    """Frames of a recorded video file, optionally looping at the end"""
+
+    def __init__(self, path: str, loop: bool = False):
+        self.path = path
+        self.loop = loop
+        self.cap = None
+
+    def open(self):
+        self.cap = cv2.VideoCapture(self.path)
+        if not self.cap.isOpened():
+            print(f"[ERROR] Cannot open video file {self.path}")
+            return False
+        print(f"[INFO] Opened video file {self.path}")
+        return True
+
+    def read(self):
+        ret, frame = self.cap.read()
+        if not ret and self.loop:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ret, frame = self.cap.read()
+        return ret, frame
+
+    def release(self):
+        if self.cap is not None:
+            self.cap.release()
+
+    def is_opened(self):
+        return self.cap is not None and self.cap.isOpened()
+
+    @property
+    def frame_size(self):
+        return int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)), int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+
+    def timestamp_msec(self):
+        return self.cap.get(cv2.CAP_PROP_POS_MSEC)
+
+
+class ImageSequenceSource(FrameSource):
+    """Image files of a directory, read in file name order"""
+    EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+
+    def __init__(self, directory: str, fps: float = 30.0, loop: bool = False):
+        self.directory = directory
+        self.fps = fps
+        self.loop = loop
+        self.paths = []
+        self.index = 0
+        self._size = (0, 0)
+
+    def open(self):
+        self.paths = sorted(path for path in glob.glob(os.path.join(self.directory, "*"))
+                            if path.lower().endswith(self.EXTENSIONS))
+        self.index = 0
+        if not self.paths:
+            print(f"[ERROR] No images found in {self.directory}")
+            return False
+        first = cv2.imread(self.paths[0])
+        if first is None:
+            print(f"[ERROR] Cannot read image {self.paths[0]}")
+            return False
+        self._size = (first.shape[1], first.shape[0])
+        print(f"[INFO] Found {len(self.paths)} images in {self.directory}")
+        return True
+
+    def read(self):
+        if self.index >= len(self.paths):
+            if not self.loop or not self.paths:
+                return False, None
+            self.index = 0
+        frame = cv2.imread(self.paths[self.index])
+        self.index += 1
+        return frame is not None, frame
+
+    def is_opened(self):
+        return bool(self.paths)
+
+    @property
+    def frame_size(self):
+        return self._size
+
+    def timestamp_msec(self):
+        return self.index * 1000.0 / self.fps
+
+
+class SyntheticSource(FrameSource):
+    """
+    Generated frames with a skin-coloured fingertip moving along a figure-eight.
+    Deterministic, so it is suitable for load tests on machines without a camera. The
+    recognizer finds no hand in it, so it exercises only the pipeline overhead
+    (capture, conversion, recognition and compositing) and never draws ink.
+    """
+
+    def __init__(self, width: int = 640, height: int = 480, count: int = None, fps: float = 30.0):
+        self.width = width
+        self.height = height
+        self.count = count
+        self.fps = fps
+        self.index = 0
+        self.background = None
+
+    def open(self):
+        self.index = 0
+        self.background = np.full((self.height, self.width, 3), (60, 50, 40), dtype=np.uint8)
+        return True
+
+    def fingertip_position(self, index):
+        """Position of the synthetic fingertip in frame `index`"""
+        t = 2 * np.pi * index / 120
+        x = int(self.width / 2 + self.width / 3 * np.sin(t))
+        y = int(self.height / 2 + self.height / 4 * np.sin(2 * t))
+        return x, y
+
+    def read(self):
+        if self.count is not None and self.index >= self.count:
+            return False, None
+        frame = self.background.copy()
+        cv2.circle(frame, self.fingertip_position(self.index), 18, (140, 170, 220), -1)
+        self.index += 1
+        return True, frame
+
+    def release(self):
+        self.background = None
+
+    def is_opened(self):
+        return self.background is not None
+
+    @property
+    def frame_size(self):
+        return self.width, self.height
+
+    def timestamp_msec(self):
+        return self.index * 1000.0 / self.fps
@@ -0,0 +1,100 @@
+from src.model.landmarks import GESTURE_IDS
+
+NONE = GESTURE_IDS["None"]
+POINTING_UP = GESTURE_IDS["Pointing_Up"]
+THUMB_UP = GESTURE_IDS["Thumb_Up"]
+THUMB_DOWN = GESTURE_IDS["Thumb_Down"]
+VICTORY = GESTURE_IDS["Victory"]
+
+
+def is_pointing_pose(landmarks):
+    """True if only the index finger of the hand is extended upwards"""
+    # Tip above its base for the index finger, below it for middle, ring and pinky
+    return (landmarks[8].y < landmarks[5].y and
+            landmarks[12].y > landmarks[9].y and
+            landmarks[16].y > landmarks[13].y and
+            landmarks[20].y > landmarks[17].y)
+
+
+def observe_gesture(result):
+    """
+    Gesture id and score of the first hand of a recognizer result. A hand the canned
+    classifier reports as "None" but holds in the pointing pose counts as Pointing_Up.
+    """
+    if not result or not result.gestures or not result.hand_landmarks:
+        return NONE, 0.0
+    category = result.gestures[0][0]
+    gesture_id = GESTURE_IDS.get(category.category_name, NONE)
+    if gesture_id == NONE and len(result.hand_landmarks) == 1 and is_pointing_pose(result.hand_landmarks[0]):
+        return POINTING_UP, 1.0
+    return gesture_id, category.score
+
+
+class GestureStateMachine:
+    """
+    Turns per-frame recognizer results into a stable gesture. A gesture is entered
+    once its score stays at or above its enter threshold for its enter time, and left
+    only after frames stop supporting it (score below the lower exit threshold, another
+    gesture or no hand) for its exit time. Times are measured on the frame clock, so a
+    single misclassified frame neither breaks a stroke nor restarts the save timer.
+    """
+    # Entering is quick for drawing and slower for clearing the board or undoing a stroke
+    ENTER_THRESHOLDS = {POINTING_UP: 0.5, THUMB_UP: 0.6, THUMB_DOWN: 0.7, VICTORY: 0.7}
+    EXIT_THRESHOLDS = {POINTING_UP: 0.3, THUMB_UP: 0.4, THUMB_DOWN: 0.5, VICTORY: 0.5}
+    ENTER_TIMES = {POINTING_UP: 0.0, THUMB_UP: 0.1, THUMB_DOWN: 0.2, VICTORY: 0.2}
+    EXIT_TIMES = {POINTING_UP: 0.15, THUMB_UP: 0.3, THUMB_DOWN: 0.1, VICTORY: 0.1}
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.gesture = NONE
+        # True only for the update that entered the current gesture, for actions done once per gesture
+        self.entered = False
+        self.candidate = NONE
+        self.candidate_since = None
+        self.unsupported_since = None
+
+    @property
+    def holding(self):
+        """True while the current gesture is only kept by its exit time, the last frame did not show it"""
+        return self.unsupported_since is not None
+
+    def supports(self, gesture_id, score, gesture):
+        """True if a frame showing `gesture_id` with `score` keeps `gesture` active"""
+        return gesture_id == gesture and score >= self.EXIT_THRESHOLDS.get(gesture, 0.0)
+
+    def update(self, gesture_id, score, now):
+        """Feed the gesture of a frame seen at `now` (seconds) and return the stable gesture id"""
+        self.entered = False
+        # Gestures without thresholds (fists, open palms...) only end the current one
+        if gesture_id not in self.ENTER_THRESHOLDS or score < self.ENTER_THRESHOLDS[gesture_id]:
+            observed = NONE
+        else:
+            observed = gesture_id
+
+        if self.gesture != NONE:
+            if self.supports(gesture_id, score, self.gesture):
+                self.unsupported_since = None
+                self.candidate = NONE
+                return self.gesture
+            if self.unsupported_since is None:
+                self.unsupported_since = now
+            if now - self.unsupported_since < self.EXIT_TIMES[self.gesture]:
+                self.track_candidate(observed, now)
+                return self.gesture
+            self.gesture = NONE
+            self.unsupported_since = None
+
+        self.track_candidate(observed, now)
+        if self.candidate != NONE and now - self.candidate_since >= self.ENTER_TIMES[self.candidate]:
+            self.gesture = self.candidate
+            self.candidate = NONE
+            self.entered = True
+        return self.gesture
+
+    def track_candidate(self, observed, now):
+        """Remember since when the gesture waiting to be entered has been seen without interruption"""
+        if observed != self.candidate:
+            self.candidate = observed
+            self.candidate_since = now
@@ -0,0 +1,195 @@
+import os
+import threading
+import time
+from collections import deque
+
+from src.model.signature import SignatureRecognition
+from src.utils.profiler import LatencyHistogram
+
+
+class PoolSession:
+    """
+    Connection of one capture session to an InferencePool, used like a RecognizerLease.
+    Frames passed to recognize_async wait in the session's queue for the next free
+    worker; results are delivered to `listener(result, output_image, timestamp_ms)`
+    on the worker thread, the same callback a LIVE_STREAM recognizer would call.
+    """
+
+    def __init__(self, pool, name, listener, max_pending):
+        self.pool = pool
+        self.name = name
+        self.listener = listener
+        self.max_pending = max_pending
+        self.pending = deque()
+        # A frame of this session is being recognized, its next frame waits so results stay in order
+        self.in_flight = False
+        self.submitted = 0
+        self.processed = 0
+        self.dropped = 0
+        self.queue_latency = LatencyHistogram()
+        self.inference_time = LatencyHistogram()
+        self.start_time = time.perf_counter()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def recognize_async(self, image, timestamp_ms):
+        self.pool.submit(self, image, timestamp_ms)
+
+    def close(self):
+        self.pool.unregister(self)
+
+    def stats(self):
+        """Throughput and queue latency of this session, times in milliseconds"""
+        with self.pool.condition:
+            elapsed = time.perf_counter() - self.start_time
+            return {
+                "submitted": self.submitted,
+                "processed": self.processed,
+                "dropped": self.dropped,
+                "throughput_fps": self.processed / elapsed if elapsed > 0 else 0.0,
+                "queue": self.queue_latency.summary(),
+                "inference": self.inference_time.summary(),
+            }
+
+
+class InferencePool:
+    """
+    Gesture recognizer workers shared by the capture sessions of several cameras,
+    so inference scales with the number of cores instead of the number of cameras.
+    Each worker thread owns one MediaPipe graph in IMAGE mode: frames of different
+    cameras go to whichever worker is free without mixing their hand tracking.
+    Workers take frames from the sessions in turn, and every session keeps at most
+    `max_pending` frames queued (older ones are dropped), so a fast camera cannot
+    starve a slow one and results never lag behind the camera. Only one frame per
+    session is recognized at a time, so its results are delivered in frame order.
+    """
+
+    def __init__(self, workers: int = None, max_pending: int = 1, recognizer_factory=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending
+        self.recognizer_factory = recognizer_factory or self.create_recognizer
+        self.condition = threading.Condition()
+        self.sessions = []
+        self.next_session = 0
+        self.threads = []
+        self.running = False
+
+    @staticmethod
+    def create_recognizer():
+        """IMAGE mode recognizer of a worker, warmed up before it takes frames"""
+        sign_model = SignatureRecognition("IMAGE")
+        recognizer = sign_model.setup_recognizer()
+        sign_model.warm_up(recognizer)
+        return recognizer
+
+    def start(self):
+        with self.condition:
+            if self.running:
+                return
+            self.running = True
+        self.threads = [threading.Thread(target=self._work, name=f"InferencePool-{i}", daemon=True)
+                        for i in range(self.workers)]
+        for thread in self.threads:
+            thread.start()
+        print(f"[INFO] Inference pool started with {self.workers} workers")
+
+    def stop(self):
+        """Stop the workers; queued frames are discarded"""
+        with self.condition:
+            self.running = False
+            for session in self.sessions:
+                session.pending.clear()
+            self.condition.notify_all()
+        for thread in self.threads:
+            thread.join()
+        self.threads = []
+
+    def session(self, listener, name=None):
+        """Register a capture session, starting the workers on first use"""
+        self.start()
+        with self.condition:
+            session = PoolSession(self, name or f"session {len(self.sessions)}", listener, self.max_pending)
+            self.sessions.append(session)
+        return session
+
+    def unregister(self, session):
+        with self.condition:
+            if session in self.sessions:
+                self.sessions.remove(session)
+            session.pending.clear()
+            session.listener = None
+
+    def submit(self, session, image, timestamp_ms):
+        with self.condition:
+            if len(session.pending) >= session.max_pending:
+                session.pending.popleft()
+                session.dropped += 1
+            session.pending.append((image, timestamp_ms, time.perf_counter()))
+            session.submitted += 1
+            self.condition.notify()
+
+    def _next_frame(self):
+        """Oldest frame of the next session in turn that has one and none in flight, called with the lock held"""
+        count = len(self.sessions)
+        for i in range(count):
+            index = (self.next_session + i) % count
+            session = self.sessions[index]
+            if session.pending and not session.in_flight:
+                self.next_session = index + 1
+                session.in_flight = True
+                return session, session.pending.popleft()
+        return None
+
+    def _work(self):
+        try:
+            recognizer = self.recognizer_factory()
+        except Exception as e:
+            print(f"[ERROR] Inference worker could not create a recognizer: {e}")
+            return
+        try:
+            while True:
+                with self.condition:
+                    job = self._next_frame()
+                    while self.running and job is None:
+                        self.condition.wait()
+                        job = self._next_frame()
+                    if not self.running:
+                        return
+                session, (image, timestamp_ms, submitted_at) = job
+
+                try:
+                    self._recognize(recognizer, session, image, timestamp_ms, submitted_at)
+                finally:
+                    with self.condition:
+                        session.in_flight = False
+                        # The next frame of the session may be waiting for this one
+                        self.condition.notify()
+        finally:
+            recognizer.close()
+
+    def _recognize(self, recognizer, session, image, timestamp_ms, submitted_at):
+        start = time.perf_counter()
+        try:
+            result = recognizer.recognize(image)
+        except Exception as e:
+            print(f"[ERROR] Inference of {session.name} failed: {e}")
+            return
+        end = time.perf_counter()
+
+        with self.condition:
+            session.processed += 1
+            session.queue_latency.record(start - submitted_at)
+            session.inference_time.record(end - start)
+            listener = session.listener
+        if listener is not None:
+            listener(result, image, timestamp_ms)
+
+    def stats(self):
+        """{session name: stats} of the registered sessions"""
+        with self.condition:
+            sessions = list(self.sessions)
+        return {session.name: session.stats() for session in sessions}
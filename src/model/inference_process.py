@@ -0,0 +1,271 @@
+import multiprocessing
+import queue
+import threading
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from src.model.landmarks import LandmarkResult, NUM_LANDMARKS
+from src.model.signature import SignatureRecognition
+
+
+class InferenceProcessDied(RuntimeError):
+    """The inference process exited while capture sessions were still using it"""
+
+
+class ProcessRecognizer:
+    """VIDEO mode recognizer of one capture session, living in the inference process"""
+
+    def __init__(self):
+        self.sign_model = SignatureRecognition("VIDEO")
+        self.recognizer = self.sign_model.setup_recognizer()
+        self.sign_model.warm_up(self.recognizer)
+
+    def recognize(self, frame, timestamp_ms):
+        """Recognize a BGR frame and return the result as (gesture_id, score, landmarks)"""
+        result = self.sign_model.recognize_for_video(self.recognizer, frame, timestamp_ms)
+        return LandmarkResult.to_arrays(result)
+
+    def close(self):
+        self.recognizer.close()
+
+
+def inference_main(memory_name, slot_shape, requests, results, recognizer_factory):
+    """
+    Entry point of the inference process: recognize the frames announced on `requests`.
+    Every capture session gets its own VIDEO mode recognizer, fed with the timestamps
+    of its own frames, so hand tracking never carries over from one camera to another.
+    """
+    # Spawned processes share the parent's resource tracker, which unlinks the block with the parent
+    memory = shared_memory.SharedMemory(name=memory_name)
+    slots = np.ndarray(slot_shape, dtype=np.uint8, buffer=memory.buf)
+    try:
+        # Created up front to report a broken model before the first frame, used by the first session
+        idle = [recognizer_factory()]
+    except Exception as e:
+        # Reported to the parent instead of the ready message
+        results.put(str(e))
+        del slots
+        memory.close()
+        return
+    # Session id -> [recognizer, last timestamp], VIDEO mode needs increasing timestamps
+    # per recognizer and 0 was used by the warm-up frame
+    recognizers = {}
+    results.put(None)
+    try:
+        while True:
+            request = requests.get()
+            if request is None:
+                break
+            if len(request) == 1:
+                # The session was closed, its tracking state is of no use to another camera
+                entry = recognizers.pop(request[0], None)
+                if entry is not None and entry[0] is not None:
+                    entry[0].close()
+                continue
+
+            session_id, slot, height, width, frame_timestamp_ms = request
+            entry = recognizers.get(session_id)
+            if entry is None:
+                try:
+                    recognizer = idle.pop() if idle else recognizer_factory()
+                except Exception as e:
+                    print(f"[ERROR] Cannot create a recognizer for session {session_id}: {e}")
+                    recognizer = None
+                entry = recognizers[session_id] = [recognizer, 0]
+            recognizer, last_timestamp_ms = entry
+            if recognizer is None:
+                gesture_id, score, landmarks = 0, 0.0, None
+            else:
+                entry[1] = max(frame_timestamp_ms, last_timestamp_ms + 1)
+                gesture_id, score, landmarks = recognizer.recognize(slots[slot, :height, :width], entry[1])
+            results.put((session_id, slot, frame_timestamp_ms, gesture_id, score,
+                         landmarks.tobytes() if landmarks is not None else None))
+    finally:
+        for recognizer in idle + [entry[0] for entry in recognizers.values()]:
+            if recognizer is not None:
+                recognizer.close()
+        del slots
+        memory.close()
+
+
+class ProcessSession:
+    """
+    Connection of one capture session to an InferenceProcess, used like a RecognizerLease.
+    Frames are passed as BGR arrays (convert_frame keeps them as they are, the inference
+    process converts them); results arrive as LandmarkResult on the result thread.
+    """
+
+    def __init__(self, process, session_id, listener):
+        self.process = process
+        self.session_id = session_id
+        self.listener = listener
+        self.submitted = 0
+        self.dropped = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @staticmethod
+    def convert_frame(frame):
+        return frame
+
+    def recognize_async(self, frame, timestamp_ms):
+        self.process.submit(self, frame, timestamp_ms)
+
+    def close(self):
+        self.process.unregister(self)
+
+
+class InferenceProcess:
+    """
+    Runs gesture recognition in a separate process so MediaPipe and its result
+    handling do not compete with the GUI and capture threads for the GIL.
+    Frames are copied into a ring of `slots` shared-memory slots of up to
+    `max_width` x `max_height` and only the slot index travels through the request
+    queue; the process sends back the gesture id, score and landmark array. When all
+    slots are still being recognized a frame is dropped instead of waiting, unless
+    the process has died and will never free them: submit() raises InferenceProcessDied.
+    """
+
+    def __init__(self, slots: int = 4, max_width: int = 1920, max_height: int = 1080,
+                 recognizer_factory=ProcessRecognizer, start_timeout: float = 60.0):
+        self.slot_shape = (slots, max_height, max_width, 3)
+        self.recognizer_factory = recognizer_factory
+        # Seconds to wait for the recognizer of the process to load
+        self.start_timeout = start_timeout
+        self.lock = threading.Lock()
+        self.start_lock = threading.Lock()
+        self.memory = None
+        self.slots = None
+        self.free_slots = []
+        self.sessions = {}
+        self.next_session_id = 0
+        self.process = None
+        self.requests = None
+        self.results = None
+        self.result_thread = None
+
+    def start(self, timeout=None):
+        """Start the inference process and wait until its recognizer is ready, at most `timeout` seconds"""
+        with self.start_lock:
+            if self.process is None:
+                self._start(self.start_timeout if timeout is None else timeout)
+
+    def allocate(self):
+        """Create the shared-memory ring of frame slots"""
+        self.memory = shared_memory.SharedMemory(create=True, size=int(np.prod(self.slot_shape)))
+        self.slots = np.ndarray(self.slot_shape, dtype=np.uint8, buffer=self.memory.buf)
+        self.free_slots = list(range(self.slot_shape[0]))
+
+    def release(self):
+        """Free the shared-memory ring"""
+        self.slots = None
+        self.memory.close()
+        self.memory.unlink()
+        self.memory = None
+
+    def _start(self, timeout):
+        self.allocate()
+        # Spawned like the batch workers, so the process starts without the parent's Qt state
+        context = multiprocessing.get_context("spawn")
+        self.requests = context.Queue()
+        self.results = context.Queue()
+        self.process = context.Process(target=inference_main, name="Inference",
+                                       args=(self.memory.name, self.slot_shape, self.requests, self.results,
+                                             self.recognizer_factory),
+                                       daemon=True)
+        start = time.perf_counter()
+        self.process.start()
+        try:
+            error = self.wait_ready(start + timeout)
+        except RuntimeError:
+            self.process.terminate()
+            self.process.join()
+            self.process = None
+            self.release()
+            raise
+        if error is not None:
+            self.process.join()
+            self.process = None
+            self.release()
+            raise RuntimeError(f"Inference process failed to start: {error}")
+        print(f"[INFO] Inference process ready after {time.perf_counter() - start:.2f} s")
+
+        self.result_thread = threading.Thread(target=self._receive, name="InferenceResults", daemon=True)
+        self.result_thread.start()
+
+    def wait_ready(self, deadline):
+        """Ready message of the process (None, or its error), raises RuntimeError if it dies or takes too long"""
+        while True:
+            try:
+                return self.results.get(timeout=0.5)
+            except queue.Empty:
+                pass
+            if not self.process.is_alive():
+                raise RuntimeError(f"Inference process exited with code {self.process.exitcode} before it was ready")
+            if time.perf_counter() > deadline:
+                raise RuntimeError("Inference process did not get ready in time")
+
+    def stop(self):
+        """Stop the inference process and free the shared memory"""
+        if self.process is None:
+            return
+        self.requests.put(None)
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self.results.put(None)
+        self.result_thread.join()
+        self.process = None
+        self.release()
+
+    def session(self, listener):
+        """Register a capture session, starting the process on first use"""
+        self.start()
+        with self.lock:
+            session = ProcessSession(self, self.next_session_id, listener)
+            self.sessions[session.session_id] = session
+            self.next_session_id += 1
+        return session
+
+    def unregister(self, session):
+        with self.lock:
+            if self.sessions.pop(session.session_id, None) is None:
+                return
+        # The process closes the recognizer of the session
+        self.requests.put((session.session_id,))
+
+    def submit(self, session, frame, timestamp_ms):
+        height, width = frame.shape[:2]
+        with self.lock:
+            session.submitted += 1
+            if not self.free_slots and not self.process.is_alive():
+                raise InferenceProcessDied(f"Inference process exited with code {self.process.exitcode}")
+            if not self.free_slots or height > self.slot_shape[1] or width > self.slot_shape[2]:
+                session.dropped += 1
+                return
+            slot = self.free_slots.pop(0)
+        np.copyto(self.slots[slot, :height, :width], frame)
+        self.requests.put((session.session_id, slot, height, width, timestamp_ms))
+
+    def _receive(self):
+        """Result thread: frees the slot of every recognized frame and routes its result"""
+        while True:
+            message = self.results.get()
+            if message is None:
+                return
+            session_id, slot, timestamp_ms, gesture_id, score, landmarks = message
+            with self.lock:
+                self.free_slots.append(slot)
+                session = self.sessions.get(session_id)
+            if session is None:
+                continue
+            if landmarks is not None:
+                landmarks = np.frombuffer(landmarks, dtype=np.float32).reshape(NUM_LANDMARKS, 3)
+            session.listener(LandmarkResult.from_arrays(gesture_id, score, landmarks), None, timestamp_ms)
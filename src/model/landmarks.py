@@ -0,0 +1,57 @@
+from collections import namedtuple
+
+import numpy as np
+
+# Canned MediaPipe gestures and the integer ids used for compact storage
+GESTURE_NAMES = ("None", "Pointing_Up", "Thumb_Up", "Thumb_Down", "Closed_Fist", "Open_Palm", "Victory", "ILoveYou")
+GESTURE_IDS = {name: index for index, name in enumerate(GESTURE_NAMES)}
+
+NUM_LANDMARKS = 21
+
+# Same as mediapipe.solutions.hands.HAND_CONNECTIONS, without importing mediapipe
+HAND_CONNECTIONS = frozenset([
+    (0, 1), (1, 2), (2, 3), (3, 4),  # Thumb
+    (0, 5), (5, 6), (6, 7), (7, 8),  # Index finger
+    (5, 9), (9, 10), (10, 11), (11, 12),  # Middle finger
+    (9, 13), (13, 14), (14, 15), (15, 16),  # Ring finger
+    (13, 17), (0, 17), (17, 18), (18, 19), (19, 20),  # Pinky and palm
+])
+
+Landmark = namedtuple("Landmark", "x y z")
+Category = namedtuple("Category", "category_name score")
+
+
+class LandmarkResult(namedtuple("LandmarkResult", "gestures hand_landmarks")):
+    """
+    Lightweight stand-in for GestureRecognizerResult with the attributes the
+    drawing code uses: gestures[0][0].category_name and hand_landmarks[0][i].x/y/z.
+    Used for replayed sessions and for results coming from other processes.
+    """
+    __slots__ = ()
+
+    @classmethod
+    def empty(cls):
+        """Result of a frame without a hand"""
+        return cls([], [])
+
+    @classmethod
+    def from_arrays(cls, gesture_id, score, landmarks):
+        """Build a result from a gesture id, its score and a (21, 3) landmark array (or None)"""
+        if landmarks is None:
+            return cls.empty()
+        points = [Landmark(float(x), float(y), float(z)) for x, y, z in landmarks]
+        return cls([[Category(GESTURE_NAMES[gesture_id], float(score))]], [points])
+
+    @staticmethod
+    def to_arrays(result):
+        """
+        Convert a GestureRecognizerResult or LandmarkResult of the first hand into
+        (gesture_id, score, landmarks) where landmarks is a (21, 3) float32 array or None.
+        """
+        if result is None or not result.hand_landmarks:
+            return 0, 0.0, None
+        landmarks = np.array([(p.x, p.y, p.z) for p in result.hand_landmarks[0]], dtype=np.float32)
+        if result.gestures:
+            category = result.gestures[0][0]
+            return GESTURE_IDS.get(category.category_name, 0), category.score, landmarks
+        return 0, 0.0, landmarks
@@ -0,0 +1,160 @@
+import threading
+
+import numpy as np
+
+
+class RecognizerLease:
+    """
+    A cached recognizer handed out to one user at a time. Timestamps passed in start
+    from 0 for every lease; the lease shifts them past everything the recognizer saw
+    before, since MediaPipe requires them to increase for the recognizer's lifetime.
+    Leaving the `with` block returns the recognizer to the cache without closing it.
+    """
+
+    def __init__(self, cache, entry, key):
+        self.cache = cache
+        self.entry = entry
+        self.key = key
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+    @property
+    def recognizer(self):
+        return self.entry.recognizer
+
+    def recognize_async(self, image, timestamp_ms):
+        timestamp_ms += self.entry.offset
+        self.entry.last_timestamp_ms = timestamp_ms
+        self.entry.recognizer.recognize_async(image, timestamp_ms)
+
+    def recognize_for_video(self, image, timestamp_ms):
+        timestamp_ms += self.entry.offset
+        self.entry.last_timestamp_ms = timestamp_ms
+        return self.entry.recognizer.recognize_for_video(image, timestamp_ms)
+
+    def recognize(self, image):
+        return self.entry.recognizer.recognize(image)
+
+    def release(self):
+        if self.entry is not None:
+            self.cache.release(self.key, self.entry)
+            self.entry = None
+
+
+class _CacheEntry:
+    """A recognizer with the listener its LIVE_STREAM results are dispatched to"""
+
+    def __init__(self):
+        self.recognizer = None
+        self.listener = None
+        self.offset = 0
+        self.last_timestamp_ms = -1
+
+    def dispatch(self, result, output_image, timestamp_ms):
+        """result_callback of the recognizer, forwards results in the timestamps of the current lease"""
+        listener = self.listener
+        # Results of frames submitted by a previous lease are dropped
+        if listener is not None and timestamp_ms >= self.offset:
+            listener(result, output_image, timestamp_ms - self.offset)
+
+
+class RecognizerCache:
+    """
+    Process-wide cache of model files and GestureRecognizer instances keyed by their
+    options, so starting capture again does not reload the model from disk.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.paths = {}
+        self.models = {}
+        self.idle = {}
+        self.creation_locks = {}
+        self.created = 0
+
+    def resource_path(self, relative_path, resolver):
+        """Resolve a resource path once with `resolver` and remember it"""
+        with self.lock:
+            if relative_path not in self.paths:
+                self.paths[relative_path] = resolver(relative_path)
+            return self.paths[relative_path]
+
+    def model_bytes(self, path):
+        """Contents of the model file at `path`, read once. None if it cannot be read."""
+        with self.lock:
+            if path not in self.models:
+                try:
+                    with open(path, "rb") as f:
+                        self.models[path] = f.read()
+                except OSError as e:
+                    print(f"[ERROR] Cannot read model {path}: {e}")
+                    return None
+            return self.models[path]
+
+    def _create(self, key, factory, warm_up):
+        entry = _CacheEntry()
+        entry.recognizer = factory(entry.dispatch)
+        if warm_up is not None:
+            warm_up(RecognizerLease(self, entry, key))
+        self.created += 1
+        return entry
+
+    def _creation_lock(self, key):
+        with self.lock:
+            return self.creation_locks.setdefault(key, threading.Lock())
+
+    def acquire(self, key, factory, listener=None, warm_up=None):
+        """
+        Lease an idle recognizer created with the options identified by `key`, creating
+        one with `factory(result_callback)` if none is idle. `listener` receives the
+        results of a LIVE_STREAM recognizer, `warm_up(lease)` runs once after creation.
+        """
+        # Waits for a recognizer being preloaded with the same options instead of creating another
+        with self._creation_lock(key):
+            with self.lock:
+                idle = self.idle.get(key)
+                entry = idle.pop() if idle else None
+            if entry is None:
+                entry = self._create(key, factory, warm_up)
+
+        entry.offset = entry.last_timestamp_ms + 1
+        entry.listener = listener
+        return RecognizerLease(self, entry, key)
+
+    def preload(self, key, factory, warm_up=None):
+        """Create an idle recognizer for `key` unless one exists already"""
+        with self._creation_lock(key):
+            with self.lock:
+                if self.idle.get(key):
+                    return
+            entry = self._create(key, factory, warm_up)
+            with self.lock:
+                self.idle.setdefault(key, []).append(entry)
+
+    def release(self, key, entry):
+        """Return a leased recognizer to the cache"""
+        entry.listener = None
+        with self.lock:
+            self.idle.setdefault(key, []).append(entry)
+
+    def clear(self):
+        """Close all idle recognizers and forget the cached models"""
+        with self.lock:
+            entries = [entry for idle in self.idle.values() for entry in idle]
+            self.idle.clear()
+            self.models.clear()
+            self.paths.clear()
+        for entry in entries:
+            entry.recognizer.close()
+
+
+def warm_up_frame(width=64, height=64):
+    """Blank frame pushed through a new recognizer so its first real frame is not slow"""
+    return np.zeros((height, width, 3), dtype=np.uint8)
+
+
+recognizer_cache = RecognizerCache()
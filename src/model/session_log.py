@@ -0,0 +1,120 @@
+import struct
+
+import numpy as np
+
+from src.model.landmarks import LandmarkResult, NUM_LANDMARKS
+from src.utils.timers import ManualClock
+
+MAGIC = b"VSL1"
+HEADER = struct.Struct("<4sHH")  # magic, frame width, frame height
+RECORD = struct.Struct("<IdBBf")  # result timestamp, frame time, flags, gesture id, score
+LANDMARKS_SIZE = NUM_LANDMARKS * 3 * 4  # float32 x, y, z
+
+# Record flags
+NO_RESULT = 0
+SAME_RESULT = 1  # Same result object as the previous frame, no payload
+EMPTY_RESULT = 2  # Result without a hand, no payload
+HAND_RESULT = 3  # Result with landmarks, followed by the landmark payload
+
+
+class SessionRecorder:
+    """
+    Records, per processed video frame, the gesture result the drawing code saw
+    to a compact binary log: 18 bytes per frame plus 252 bytes of landmarks
+    whenever the recognizer delivers a new result with a hand.
+    """
+
+    def __init__(self, path: str, width: int, height: int):
+        self.path = path
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, width, height))
+        self.frames = 0
+        self._previous = None
+        self._start = None
+        print(f"[INFO] Recording session to {path}")
+
+    def record(self, capture_time, result, timestamp_ms=None):
+        """Append the result used for the frame captured at `capture_time` (time.perf_counter())"""
+        if self._start is None:
+            self._start = capture_time
+        frame_time = capture_time - self._start
+        timestamp_ms = timestamp_ms or 0
+        if result is None:
+            self.file.write(RECORD.pack(timestamp_ms, frame_time, NO_RESULT, 0, 0.0))
+        elif result is self._previous:
+            self.file.write(RECORD.pack(timestamp_ms, frame_time, SAME_RESULT, 0, 0.0))
+        else:
+            gesture_id, score, landmarks = LandmarkResult.to_arrays(result)
+            if landmarks is None:
+                self.file.write(RECORD.pack(timestamp_ms, frame_time, EMPTY_RESULT, 0, 0.0))
+            else:
+                self.file.write(RECORD.pack(timestamp_ms, frame_time, HAND_RESULT, gesture_id, score))
+                self.file.write(landmarks.tobytes())
+        self._previous = result
+        self.frames += 1
+
+    def close(self):
+        self.file.close()
+        print(f"[INFO] Recorded {self.frames} frames to {self.path}")
+
+
+class SessionLog:
+    """Reader of session logs written by SessionRecorder"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self.data = f.read()
+        magic, self.width, self.height = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a session log")
+
+    def __iter__(self):
+        """Yield (frame_time, result, timestamp_ms) for every recorded frame, frame_time in seconds"""
+        offset = HEADER.size
+        previous = None
+        while offset < len(self.data):
+            timestamp_ms, frame_time, flags, gesture_id, score = RECORD.unpack_from(self.data, offset)
+            offset += RECORD.size
+            if flags == NO_RESULT:
+                previous = None
+            elif flags == EMPTY_RESULT:
+                previous = LandmarkResult.empty()
+            elif flags == HAND_RESULT:
+                landmarks = np.frombuffer(self.data, np.float32, NUM_LANDMARKS * 3, offset).reshape(NUM_LANDMARKS, 3)
+                offset += LANDMARKS_SIZE
+                previous = LandmarkResult.from_arrays(gesture_id, score, landmarks)
+            yield frame_time, previous, timestamp_ms
+
+
+def replay_session(log, thread, frame=None):
+    """
+    Feed a recorded session through VideoThread.show_wireframe and handle_gestures
+    without running MediaPipe. Returns the number of replayed frames.
+    """
+    if frame is None:
+        frame = np.zeros((log.height, log.width, 3), dtype=np.uint8)
+    thread.init_drawing_board(log.width, log.height)
+    thread.reset_strokes()
+    thread.gesture_state.reset()
+    # Timers follow the recorded frame times, so replays run faster than real time
+    thread.timers.reset()
+    frame_clock = ManualClock()
+    thread.timers.clock = frame_clock
+    sign_model = thread.sign_model
+    profiler = thread.profiler
+
+    count = 0
+    for frame_time, result, timestamp_ms in log:
+        frame_clock.set(frame_time)
+        # handle_gestures() gets the result directly; the model is left as the live callback
+        # leaves it, result_timestamp_ms is what the ink latency is recorded against
+        sign_model.gesture_result = result
+        sign_model.result_timestamp_ms = timestamp_ms
+        if result:
+            with profiler.stage("wireframe"):
+                thread.show_wireframe(frame, result)
+            with profiler.stage("gestures"):
+                thread.handle_gestures(frame, result)
+        count += 1
+    return count
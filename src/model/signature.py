@@ -1,11 +1,34 @@
 import cv2
-import mediapipe as mp
-from mediapipe.tasks.python import BaseOptions
-from mediapipe.tasks.python.components.processors import ClassifierOptions
-from mediapipe.tasks.python.vision import GestureRecognizerResult, GestureRecognizerOptions, GestureRecognizer, \
-    RunningMode as VisionRunningMode
 import os
 import sys
+import threading
+import time
+from collections import deque
+
+from src.model.gesture_state import is_pointing_pose
+from src.model.landmarks import HAND_CONNECTIONS
+from src.model.recognizer_cache import recognizer_cache, warm_up_frame
+
+# mediapipe takes seconds to import, it is imported on first use by load_mediapipe()
+mp = None
+vision = None
+BaseOptions = None
+ClassifierOptions = None
+_mediapipe_lock = threading.Lock()
+
+
+def load_mediapipe():
+    """Import mediapipe and the task classes used by SignatureRecognition, returns the mediapipe module"""
+    global mp, vision, BaseOptions, ClassifierOptions
+    if mp is None:
+        with _mediapipe_lock:
+            if mp is None:
+                import mediapipe
+                from mediapipe.tasks.python import BaseOptions as base_options, vision as vision_tasks
+                from mediapipe.tasks.python.components.processors import ClassifierOptions as classifier_options
+                vision, BaseOptions, ClassifierOptions = vision_tasks, base_options, classifier_options
+                mp = mediapipe
+    return mp
 
 
 class SignatureRecognition:
@@ -13,12 +36,29 @@ class SignatureRecognition:
     Class responsible for hand gesture recognition using MediaPipe.
     This class only handles the gesture recognition functionality.
     """
+    # Canned gestures the recognizer may report, the gestures handled by VideoThread.handle_gestures
+    GESTURE_ALLOWLIST = ("Pointing_Up", "Thumb_Up", "Thumb_Down", "Victory", "None")
 
-    def __init__(self):
-        """Initialize the SignatureRecognition class."""
-        self.model_path = self.get_resource_path('models/gesture_recognizer.task')
+    def __init__(self, running_mode="LIVE_STREAM"):
+        """
+        Initialize the SignatureRecognition class.
+        LIVE_STREAM delivers results through set_gesture_result, VIDEO mode is used for
+        offline processing with recognize_for_video and IMAGE mode by the workers of an
+        InferencePool. The mode is a RunningMode or its name.
+        """
+        self.running_mode = getattr(running_mode, "name", running_mode)
+        self.model_path = recognizer_cache.resource_path('models/gesture_recognizer.task', self.get_resource_path)
         self.gesture_result = None
-        self.hand_connections = mp.solutions.hands.HAND_CONNECTIONS
+        self.result_timestamp_ms = None
+        self.hand_connections = HAND_CONNECTIONS
+
+        # Optional StageProfiler for measuring callback latency
+        self.profiler = None
+        self.pending_frames = deque(maxlen=256)
+        self.dropped_frames = 0
+        # Results delivered by the recognizer, notified to wait_for_result()
+        self.completed_results = 0
+        self.result_arrived = threading.Condition()
 
     def get_resource_path(self, relative_path):
         """Get absolute path to resource with fallbacks"""
@@ -47,32 +87,98 @@ class SignatureRecognition:
         print(f"ERROR: Could not find {relative_path} in any of the expected locations")
         return possible_paths[0]  # Return the first path anyway as a fallback
 
-    def set_gesture_result(self, result: GestureRecognizerResult, output_image: mp.Image, timestamp_ms: int):
+    def set_gesture_result(self, result: "GestureRecognizerResult", output_image: "mp.Image", timestamp_ms: int):
         """Callback function for the gesture recognizer"""
-        self.gesture_result = result
+        with self.result_arrived:
+            self.result_timestamp_ms = timestamp_ms
+            self.gesture_result = result
+            self.completed_results += 1
+            self.result_arrived.notify_all()
+
+        profiler = self.profiler
+        if profiler is not None and (profiler.enabled or profiler.tracer is not None):
+            now = time.perf_counter()
+            if profiler.tracer is not None:
+                profiler.tracer.name_thread("MediaPipe callback")
+            # Frames submitted before this one that never got a callback were dropped by MediaPipe
+            while self.pending_frames and self.pending_frames[0][0] < timestamp_ms:
+                self.pending_frames.popleft()
+                self.dropped_frames += 1
+            if self.pending_frames and self.pending_frames[0][0] == timestamp_ms:
+                # The span covers submit -> callback and is drawn on the callback thread
+                profiler.add("callback", self.pending_frames.popleft()[1], now)
+
+    def wait_for_result(self, timestamp_ms: int, timeout: float):
+        """
+        Wait until the result of the frame submitted at `timestamp_ms` or of a later one
+        has arrived. Returns False after `timeout` seconds, MediaPipe may drop that frame.
+        """
+        with self.result_arrived:
+            return self.result_arrived.wait_for(
+                lambda: self.result_timestamp_ms is not None and self.result_timestamp_ms >= timestamp_ms, timeout)
+
+    def mark_submitted(self, timestamp_ms: int):
+        """Remember when a frame was submitted to measure its callback latency"""
+        profiler = self.profiler
+        if profiler is not None and (profiler.enabled or profiler.tracer is not None):
+            self.pending_frames.append((timestamp_ms, time.perf_counter()))
 
-    def setup_recognizer(self):
+    def recognizer_options(self):
+        """Options of the recognizer, also used as its cache key"""
+        return (self.model_path, self.running_mode, 1, 0.1, self.GESTURE_ALLOWLIST)
+
+    def setup_recognizer(self, result_callback=None):
         """Setup the gesture recognizer with options"""
-        options = GestureRecognizerOptions(
-            base_options=BaseOptions(model_asset_path=self.model_path),
-            running_mode=VisionRunningMode.LIVE_STREAM,
-            result_callback=self.set_gesture_result,
-            num_hands=1,
-            min_hand_detection_confidence=0.1,
+        load_mediapipe()
+        model_path, running_mode, num_hands, min_confidence, allowlist = self.recognizer_options()
+        # The model is kept in memory, MediaPipe reports a missing file itself when given the path
+        model = recognizer_cache.model_bytes(model_path)
+        if model is not None:
+            base_options = BaseOptions(model_asset_buffer=model)
+        else:
+            base_options = BaseOptions(model_asset_path=model_path)
+
+        if running_mode == "LIVE_STREAM":
+            result_callback = result_callback or self.set_gesture_result
+        else:
+            result_callback = None
+        options = vision.GestureRecognizerOptions(
+            base_options=base_options,
+            running_mode=vision.RunningMode[running_mode],
+            result_callback=result_callback,
+            num_hands=num_hands,
+            min_hand_detection_confidence=min_confidence,
             canned_gesture_classifier_options=ClassifierOptions(
-                category_allowlist=["Pointing_Up", "Thumb_Up", "Thumb_Down", "None"]
+                category_allowlist=list(allowlist)
             )
         )
-
-        return GestureRecognizer.create_from_options(options)
+        return vision.GestureRecognizer.create_from_options(options)
+
+    def warm_up(self, recognizer):
+        """Run a blank frame through a new recognizer so the first camera frame is not delayed"""
+        mp_image = self.convert_frame_to_mediapipe_image(warm_up_frame())
+        if self.running_mode == "LIVE_STREAM":
+            recognizer.recognize_async(mp_image, 0)
+        elif self.running_mode == "IMAGE":
+            recognizer.recognize(mp_image)
+        else:
+            recognizer.recognize_for_video(mp_image, 0)
 
     @staticmethod
     def convert_frame_to_mediapipe_image(frame):
         """Convert OpenCV frame to MediaPipe image format"""
         rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_frame)
+        mediapipe = load_mediapipe()
+        mp_image = mediapipe.Image(image_format=mediapipe.ImageFormat.SRGB, data=rgb_frame)
         return mp_image
 
+    def recognize_for_video(self, recognizer, frame, timestamp_ms: int):
+        """Synchronously recognize a frame of a video (VIDEO running mode) and store the result"""
+        result = recognizer.recognize_for_video(self.convert_frame_to_mediapipe_image(frame), timestamp_ms)
+        self.result_timestamp_ms = timestamp_ms
+        self.gesture_result = result
+        return result
+
     def get_result(self):
         """Return the current gesture recognition result"""
         return self.gesture_result
@@ -88,30 +194,17 @@ class SignatureRecognition:
                                                                                      0].category_name == "None":
             return None
 
-        if len(result.hand_landmarks) == 1:
-
-            landmarks = result.hand_landmarks[0]
-
-            index_tip = landmarks[8]
-            index_base = landmarks[5]
-
-            if index_tip.y < index_base.y:
-                middle_tip = landmarks[12]  # Middle finger tip
-                middle_base = landmarks[9]  # Middle finger base
+        return len(result.hand_landmarks) == 1 and is_pointing_pose(result.hand_landmarks[0])
 
-                ring_tip = landmarks[16]  # Ring finger tip
-                ring_base = landmarks[13]  # Ring finger base
-
-                pinky_tip = landmarks[20]  # Pinky tip
-                pinky_base = landmarks[17]  # Pinky base
-
-                # Check if other fingers are bent (not extended)
-                if (middle_tip.y > middle_base.y and
-                        ring_tip.y > ring_base.y and
-                        pinky_tip.y > pinky_base.y):
-                    return True
-        return False
+    def preload(self):
+        """Load the model and create a warmed-up recognizer ahead of the first capture"""
+        recognizer_cache.preload(self.recognizer_options(), self.setup_recognizer, self.warm_up)
 
     def recognizer_context_manager(self):
-        """Return the recognizer as context manager for use in with statement"""
-        return self.setup_recognizer()
+        """
+        Return a recognizer from the process-wide cache as context manager for use in
+        with statement. Leaving the block keeps the recognizer open for the next run.
+        """
+        live_stream = self.running_mode == "LIVE_STREAM"
+        return recognizer_cache.acquire(self.recognizer_options(), self.setup_recognizer,
+                                        self.set_gesture_result if live_stream else None, self.warm_up)
@@ -0,0 +1,107 @@
+import math
+
+import numpy as np
+
+
+class OneEuroFilter:
+    """
+    One Euro filter (Casiez et al., CHI 2012) of a 2D point stream: a low-pass filter
+    whose cutoff frequency rises with the speed of the point, which removes jitter while
+    the finger rests or moves slowly without adding lag to fast movements.
+    """
+
+    def __init__(self, min_cutoff: float = 1.0, beta: float = 0.02, d_cutoff: float = 1.0):
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.reset()
+
+    def reset(self):
+        self.point = None
+        self.speed = (0.0, 0.0)
+        self.time = None
+
+    @staticmethod
+    def alpha(cutoff, dt):
+        """Smoothing factor of an exponential filter with `cutoff` Hz sampled every `dt` seconds"""
+        tau = 1.0 / (2 * math.pi * cutoff)
+        return 1.0 / (1.0 + tau / dt)
+
+    def __call__(self, x, y, t):
+        """Filter the point (x, y) seen at `t` seconds"""
+        if self.point is None:
+            self.point, self.time = (x, y), t
+            return self.point
+        dt = t - self.time
+        if dt <= 0:
+            return self.point
+
+        px, py = self.point
+        a_d = self.alpha(self.d_cutoff, dt)
+        speed = tuple(a_d * (value - previous) / dt + (1 - a_d) * previous_speed
+                      for value, previous, previous_speed in ((x, px, self.speed[0]), (y, py, self.speed[1])))
+        cutoff = self.min_cutoff + self.beta * math.hypot(*speed)
+        a = self.alpha(cutoff, dt)
+        self.point = (a * x + (1 - a) * px, a * y + (1 - a) * py)
+        self.speed = speed
+        self.time = t
+        return self.point
+
+
+def simplify(points, epsilon):
+    """
+    Ramer–Douglas–Peucker decimation of a polyline: keeps the points farther than
+    `epsilon` pixels from the chord of the points kept around them. Points are (x, y)
+    tuples, values after x and y (such as the stroke width) are carried along.
+    """
+    if len(points) < 3:
+        return list(points)
+    array = np.asarray([point[:2] for point in points], dtype=np.float64)
+    keep = np.zeros(len(points), dtype=bool)
+    keep[0] = keep[-1] = True
+
+    # Iterative, strokes can be long enough to exceed the recursion limit
+    stack = [(0, len(points) - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        start, end = array[first], array[last]
+        chord = end - start
+        length = math.hypot(*chord)
+        inner = array[first + 1:last] - start
+        if length == 0:
+            distances = np.hypot(inner[:, 0], inner[:, 1])
+        else:
+            distances = np.abs(chord[0] * inner[:, 1] - chord[1] * inner[:, 0]) / length
+        index = int(np.argmax(distances))
+        if distances[index] > epsilon:
+            middle = first + 1 + index
+            keep[middle] = True
+            stack.append((first, middle))
+            stack.append((middle, last))
+    return [point for point, kept in zip(points, keep) if kept]
+
+
+class StrokeFilter:
+    """
+    Stroke stage between the fingertip and the drawing board: smooth() filters the
+    fingertip positions of the current stroke for display, decimate() reduces a
+    finished stroke to the points needed to redraw it within `epsilon` pixels.
+    """
+
+    def __init__(self, epsilon: float = 1.0, min_cutoff: float = 1.0, beta: float = 0.02):
+        self.epsilon = epsilon
+        self.filter = OneEuroFilter(min_cutoff, beta)
+
+    def begin(self):
+        """Start a new stroke, forgetting the filter state of the previous one"""
+        self.filter.reset()
+
+    def smooth(self, x, y, t):
+        """Filtered position of the fingertip at (x, y) seen at `t` seconds, in whole pixels"""
+        sx, sy = self.filter(x, y, t)
+        return int(round(sx)), int(round(sy))
+
+    def decimate(self, points):
+        return simplify(points, self.epsilon)
@@ -0,0 +1,49 @@
+import time
+
+from PySide6.QtCore import QThread, Signal
+
+from src.model import signature
+from src.model.recognizer_cache import recognizer_cache
+from src.utils.startup_profiler import startup_profiler
+
+
+class ModelWarmUp(QThread):
+    """
+    Imports mediapipe and creates a warmed-up gesture recognizer in the background,
+    so the window can be shown first and capture starts without loading the model.
+    """
+    Finished = Signal(dict)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.timings = {}
+
+    def run(self):
+        timings = {}
+        sign_model = None
+
+        def load_model():
+            nonlocal sign_model
+            sign_model = signature.SignatureRecognition()
+            recognizer_cache.model_bytes(sign_model.model_path)
+
+        steps = (
+            ("import mediapipe", signature.load_mediapipe),
+            ("load model", load_model),
+            ("create recognizer", lambda: sign_model.preload()),
+        )
+        try:
+            for name, step in steps:
+                start = time.perf_counter()
+                step()
+                end = time.perf_counter()
+                timings[name] = end - start
+                startup_profiler.add(f"model warm-up: {name}", start, end)
+        except Exception as e:
+            # Capture reports the error again when it creates its recognizer
+            print(f"[ERROR] Model warm-up failed: {e}")
+
+        self.timings = timings
+        print("[INFO] Model warm-up: " + ", ".join(f"{name} {seconds * 1000:.0f} ms"
+                                                   for name, seconds in timings.items()))
+        self.Finished.emit(timings)
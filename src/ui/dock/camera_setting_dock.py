@@ -6,15 +6,16 @@ from PySide6.QtWidgets import (
     QDockWidget, QFormLayout, QFrame
 )
 
+from src.capture.camera_enumerator import CameraEnumerator, POLL_INTERVAL_MS
 from src.ui.styles.camera_dock_styles import CameraStyles
 from src.utils.utils import get_assets_path
-from src.video_thread import VideoThread
 
 
 class CameraSettingsDock(QDockWidget):
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, video_thread=None):
         super().__init__("Camera Settings", parent)
-        self.VideoThread = VideoThread().get_instance()
+        # The capture session the dock controls, by default the active one of the main window
+        self.VideoThread = video_thread if video_thread is not None else parent.VideoThread
         self.inner_widget = QWidget()
         self.setWidget(self.inner_widget)
 
@@ -30,10 +31,16 @@ class CameraSettingsDock(QDockWidget):
         self.create_components()
         self.create_layout()
 
-        # Timer to update available cameras
+        # Cameras are listed on a worker thread, one enumeration at a time
+        self.cameraEnumerator = None
+        self.enumerationPending = False
+        # Cameras are listed again when Qt reports a change of the video inputs. Not every
+        # platform reports them, so cameras are polled until the first notification arrives
         self.cameraUpdateTimer = QTimer(self)
         self.cameraUpdateTimer.timeout.connect(self.getAvailableCameras)
-        self.cameraUpdateTimer.start(5000)
+        self.media_devices = QMediaDevices(self)
+        self.media_devices.videoInputsChanged.connect(self.onVideoInputsChanged)
+        self.cameraUpdateTimer.start(POLL_INTERVAL_MS)
 
         # Timer to update FPS counter
         self.fpsUpdateTimer = QTimer(self)
@@ -179,19 +186,38 @@ class CameraSettingsDock(QDockWidget):
             self.fps_counter.setText("0 FPS")
             self.fps_counter.setStyleSheet(CameraStyles.FPS_COUNTER_STYLE)
 
+    def setVideoThread(self, video_thread):
+        """Control another capture session and show its settings"""
+        self.VideoThread = video_thread
+        widgets = (self.fps_combobox, self.resolution_combobox, self.camera_combobox)
+        for widget in widgets:
+            widget.blockSignals(True)
+        self.fps_combobox.setCurrentText(str(video_thread.fps_cap))
+        self.resolution_combobox.setCurrentText("{}x{}".format(*video_thread.resolution))
+        if video_thread.camera_index < self.camera_combobox.count():
+            self.camera_combobox.setCurrentIndex(video_thread.camera_index)
+        for widget in widgets:
+            widget.blockSignals(False)
+
+        self.showCaptureState(video_thread.isRunning())
+        self.updateFpsCounter()
+
+    def showCaptureState(self, running):
+        """Show the capture controls as running or stopped"""
+        self.toggle_btn.setIcon(QIcon(get_assets_path('stop.png' if running else 'start.png')))
+        self.toggle_btn.setToolTip("Stop Capture" if running else "Start Capture")
+        self.advanced_settings_btn.setEnabled(running)
+        if not running:
+            self.fps_counter.setText("0 FPS")
+            self.fps_counter.setStyleSheet(CameraStyles.FPS_COUNTER_STYLE)
+
     def onToggleCapture(self):
         """Handle camera capture toggle"""
         if self.VideoThread.isRunning():
-            self.toggle_btn.setIcon(QIcon(get_assets_path('start.png')))
-            self.toggle_btn.setToolTip("Start Capture")
-            self.advanced_settings_btn.setEnabled(False)
+            self.showCaptureState(False)
             self.VideoThread.stop()
-            self.fps_counter.setText("0 FPS")
-            self.fps_counter.setStyleSheet(CameraStyles.FPS_COUNTER_STYLE)
         else:
-            self.toggle_btn.setIcon(QIcon(get_assets_path('stop.png')))
-            self.toggle_btn.setToolTip("Stop Capture")
-            self.advanced_settings_btn.setEnabled(True)
+            self.showCaptureState(True)
             self.VideoThread.start_th()
 
     def onFPSChanged(self):
@@ -201,9 +227,28 @@ class CameraSettingsDock(QDockWidget):
         self.VideoThread.change_settings(fps_cap=fps)
 
     def getAvailableCameras(self):
-        """Detect available camera devices"""
-        available_cam = QMediaDevices.videoInputs()
-        self.updateCameras(available_cam)
+        """Detect available camera devices on the worker thread, once more if it is already running"""
+        if self.cameraEnumerator is not None:
+            self.enumerationPending = True
+            return
+        # Not parented to the dock, a running thread must not be deleted with it
+        self.cameraEnumerator = CameraEnumerator()
+        self.cameraEnumerator.CamerasFound.connect(self.updateCameras)
+        self.cameraEnumerator.finished.connect(self.onEnumerationFinished)
+        self.cameraEnumerator.start()
+
+    def onEnumerationFinished(self):
+        """Free the finished worker and run the enumeration requested meanwhile"""
+        self.cameraEnumerator.deleteLater()
+        self.cameraEnumerator = None
+        if self.enumerationPending:
+            self.enumerationPending = False
+            self.getAvailableCameras()
+
+    def onVideoInputsChanged(self):
+        """The platform reports device changes, polling is no longer needed"""
+        self.cameraUpdateTimer.stop()
+        self.getAvailableCameras()
 
     def onResolutionChanged(self):
         """Handle resolution selection change"""
@@ -222,6 +267,8 @@ class CameraSettingsDock(QDockWidget):
 
     def updateCameras(self, available_cam):
         """Update camera selection combobox with available cameras"""
+        # Rebuilding the list is not a camera selection, the session keeps its camera
+        self.camera_combobox.blockSignals(True)
         if not available_cam:
             self.camera_combobox.clear()
             self.camera_combobox.setEnabled(False)
@@ -232,3 +279,13 @@ class CameraSettingsDock(QDockWidget):
             if sorted(camera_descriptions) != sorted(current_items):
                 self.camera_combobox.clear()
                 self.camera_combobox.addItems(camera_descriptions)
+                if self.VideoThread.camera_index < self.camera_combobox.count():
+                    self.camera_combobox.setCurrentIndex(self.VideoThread.camera_index)
+            # The cached modes of every camera are shown as its tooltip
+            for cam in available_cam:
+                modes = CameraEnumerator.capabilities.get(bytes(cam.id()), [])
+                index = self.camera_combobox.findText(cam.description())
+                if modes and index != -1:
+                    tooltip = "\n".join(f"{width}x{height} @ {fps} FPS" for width, height, fps in modes)
+                    self.camera_combobox.setItemData(index, tooltip, Qt.ToolTipRole)
+        self.camera_combobox.blockSignals(False)
@@ -0,0 +1,120 @@
+from PySide6.QtCore import QTimer, Qt
+from PySide6.QtWidgets import QDockWidget, QWidget, QVBoxLayout, QLabel
+
+from src.ui.styles.performance_styles import PerformanceStyles
+
+
+class PerformanceDock(QDockWidget):
+    """
+    Developer-mode panel showing smoothed FPS, per-stage timings,
+    inference latency, frame skipping, dropped frames and memory use.
+    """
+
+    def __init__(self, parent=None, video_thread=None):
+        super().__init__("Performance", parent)
+        # The capture session the dock controls, by default the active one of the main window
+        self.VideoThread = video_thread if video_thread is not None else parent.VideoThread
+        self.inner_widget = QWidget()
+        self.setWidget(self.inner_widget)
+
+        self.apply_styles()
+        self.setFeatures(
+            QDockWidget.DockWidgetMovable | QDockWidget.DockWidgetFloatable)
+        self.setAllowedAreas(Qt.LeftDockWidgetArea | Qt.RightDockWidgetArea)
+
+        self.setMinimumWidth(200)
+
+        # Initialize UI components
+        self.create_components()
+        self.create_layout()
+
+        # Timer to refresh the panel a few times per second
+        self.refreshTimer = QTimer(self)
+        self.refreshTimer.timeout.connect(self.refresh)
+
+    def apply_styles(self):
+        """Apply styles from the PerformanceStyles class"""
+        self.setStyleSheet(PerformanceStyles.DOCK_STYLE)
+        self.inner_widget.setStyleSheet(PerformanceStyles.WIDGET_STYLE)
+
+    def create_components(self):
+        """Create and initialize all UI components"""
+        self.fps_label = QLabel("FPS: -")
+        self.inference_label = QLabel("Inference: -")
+        self.skip_label = QLabel("Skip ratio: -")
+        self.dropped_label = QLabel("Dropped frames: -")
+        self.memory_label = QLabel("Memory: -")
+        self.pool_label = QLabel("Inference pool: off")
+
+        for label in [self.fps_label, self.inference_label, self.skip_label,
+                      self.dropped_label, self.memory_label, self.pool_label]:
+            label.setStyleSheet(PerformanceStyles.LABEL_STYLE)
+
+        self.stages_label = QLabel("")
+        self.stages_label.setTextFormat(Qt.PlainText)
+        self.stages_label.setStyleSheet(PerformanceStyles.STAGES_STYLE)
+
+    def create_layout(self):
+        """Create and set up the UI layout"""
+        self.main_layout = QVBoxLayout(self.inner_widget)
+        self.main_layout.setSpacing(PerformanceStyles.SPACING)
+        self.main_layout.setContentsMargins(*PerformanceStyles.MARGINS)
+        self.main_layout.addWidget(self.fps_label)
+        self.main_layout.addWidget(self.inference_label)
+        self.main_layout.addWidget(self.skip_label)
+        self.main_layout.addWidget(self.dropped_label)
+        self.main_layout.addWidget(self.memory_label)
+        self.main_layout.addWidget(self.pool_label)
+        self.main_layout.addWidget(self.stages_label)
+        self.main_layout.addStretch(1)
+
+    def setVideoThread(self, video_thread):
+        """Show the statistics of another capture session"""
+        self.VideoThread = video_thread
+        if self.isVisible():
+            self.refresh()
+
+    def showEvent(self, event):
+        """Start refreshing when the panel becomes visible"""
+        super().showEvent(event)
+        self.refreshTimer.start(PerformanceStyles.REFRESH_INTERVAL_MS)
+
+    def hideEvent(self, event):
+        """Stop refreshing while the panel is hidden"""
+        super().hideEvent(event)
+        self.refreshTimer.stop()
+
+    @staticmethod
+    def format_stages(stages):
+        """Format the stage breakdown as a fixed-width table"""
+        lines = [f"{'stage':<17}{'p50':>6}{'p95':>6}{'p99':>6}"]
+        for name, summary in stages.items():
+            lines.append(f"{name:<17}{summary['p50']:>6.1f}{summary['p95']:>6.1f}{summary['p99']:>6.1f}")
+        return "\n".join(lines)
+
+    def refresh(self):
+        """Update all labels from the current VideoThread statistics"""
+        stats = self.VideoThread.performance_stats()
+        stages = stats["stages"]
+
+        self.fps_label.setText(f"FPS: {stats['fps']:.1f}")
+        callback = stages.get("callback")
+        if callback:
+            self.inference_label.setText(f"Inference: {callback['p50']:.1f} / {callback['p95']:.1f} ms (p50/p95)")
+        else:
+            self.inference_label.setText("Inference: -")
+        self.skip_label.setText(f"Skip ratio: {stats['skip_ratio']:.0%}")
+        self.dropped_label.setText(f"Dropped frames: {stats['dropped_frames']}")
+        memory = stats["memory_mb"]
+        self.memory_label.setText(f"Memory: {memory:.0f} MB" if memory is not None else "Memory: n/a")
+        pool = stats.get("pool")
+        if pool:
+            queue = pool["queue"]
+            self.pool_label.setText(f"Inference pool: {pool['throughput_fps']:.1f} FPS, "
+                                    f"queue {queue['p50']:.1f} / {queue['p95']:.1f} ms (p50/p95)")
+        else:
+            self.pool_label.setText("Inference pool: off")
+        text = self.format_stages(stages)
+        if stats.get("latency"):
+            text += "\n\n" + self.format_stages(stats["latency"])
+        self.stages_label.setText(text + "\n(ms)")
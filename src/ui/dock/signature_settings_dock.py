@@ -2,18 +2,18 @@ from PySide6.QtCore import Qt, QSize
 from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import (
     QDockWidget, QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QSlider, QCheckBox, QFrame, QToolButton
+    QLabel, QSlider, QCheckBox, QFrame, QToolButton, QStyle
 )
 
 from src.ui.styles.signature_styles import SignatureStyles
 from src.utils.utils import get_assets_path
-from src.video_thread import VideoThread
 
 
 class SignatureSettingsDock(QDockWidget):
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, video_thread=None):
         super().__init__("Signature Settings", parent)
-        self.VideoThread = VideoThread().get_instance()
+        # The capture session the dock controls, by default the active one of the main window
+        self.VideoThread = video_thread if video_thread is not None else parent.VideoThread
         self.inner_widget = QWidget()
         self.setWidget(self.inner_widget)
 
@@ -111,6 +111,23 @@ class SignatureSettingsDock(QDockWidget):
         self.clear_button.setStyleSheet(SignatureStyles.BUTTON_STYLE)
         self.clear_button.clicked.connect(self.on_clear_signature)
 
+        # Undo and redo stroke buttons
+        self.undo_button = QToolButton()
+        self.undo_button.setIcon(self.style().standardIcon(QStyle.SP_ArrowBack))
+        self.undo_button.setToolTip("Undo Stroke")
+        self.undo_button.setIconSize(QSize(*SignatureStyles.BUTTON_ICON_SIZE))
+        self.undo_button.setMinimumSize(QSize(*SignatureStyles.BUTTON_SIZE))
+        self.undo_button.setStyleSheet(SignatureStyles.BUTTON_STYLE)
+        self.undo_button.clicked.connect(self.on_undo_stroke)
+
+        self.redo_button = QToolButton()
+        self.redo_button.setIcon(self.style().standardIcon(QStyle.SP_ArrowForward))
+        self.redo_button.setToolTip("Redo Stroke")
+        self.redo_button.setIconSize(QSize(*SignatureStyles.BUTTON_ICON_SIZE))
+        self.redo_button.setMinimumSize(QSize(*SignatureStyles.BUTTON_SIZE))
+        self.redo_button.setStyleSheet(SignatureStyles.BUTTON_STYLE)
+        self.redo_button.clicked.connect(self.on_redo_stroke)
+
         # Reset settings button
         self.reset_button = QToolButton()
         self.reset_button.setIcon(QIcon(get_assets_path("reset.png")))
@@ -184,6 +201,8 @@ class SignatureSettingsDock(QDockWidget):
         button_layout = QHBoxLayout()
         button_layout.addStretch(1)
         button_layout.addWidget(self.save_button)
+        button_layout.addWidget(self.undo_button)
+        button_layout.addWidget(self.redo_button)
         button_layout.addWidget(self.clear_button)
         button_layout.addWidget(self.reset_button)
         button_layout.addStretch(1)
@@ -196,6 +215,26 @@ class SignatureSettingsDock(QDockWidget):
         self.main_layout.addLayout(button_layout)
         self.main_layout.addStretch(1)
 
+    def setVideoThread(self, video_thread):
+        """Control another capture session and show its settings"""
+        self.VideoThread = video_thread
+        widgets = (self.dev_mode_checkbox, self.min_distance_slider, self.max_distance_slider,
+                   self.min_points_slider, self.save_duration_slider)
+        for widget in widgets:
+            widget.blockSignals(True)
+        self.dev_mode_checkbox.setChecked(video_thread.dev_mode)
+        self.min_distance_slider.setValue(video_thread.min_distance)
+        self.max_distance_slider.setValue(int(video_thread.max_distance))
+        self.min_points_slider.setValue(video_thread.min_signature_points)
+        self.save_duration_slider.setValue(int(video_thread.thumb_up_duration))
+        for widget in widgets:
+            widget.blockSignals(False)
+
+        self.min_distance_value.setText(f"{video_thread.min_distance}")
+        self.max_distance_value.setText(f"{video_thread.max_distance}")
+        self.min_points_value.setText(f"{video_thread.min_signature_points}")
+        self.save_duration_value.setText(f"{int(video_thread.thumb_up_duration)}s")
+
     def on_dev_mode_changed(self, state):
         """Handle dev mode checkbox state change"""
         self.VideoThread.dev_mode = self.dev_mode_checkbox.isChecked()
@@ -239,6 +278,16 @@ class SignatureSettingsDock(QDockWidget):
         if self.VideoThread.drawing_board is not None:
             self.VideoThread.clear_drawing_board()
 
+    def on_undo_stroke(self):
+        """Handle undo stroke button click"""
+        if self.VideoThread.drawing_board is not None:
+            self.VideoThread.undo_stroke()
+
+    def on_redo_stroke(self):
+        """Handle redo stroke button click"""
+        if self.VideoThread.drawing_board is not None:
+            self.VideoThread.redo_stroke()
+
     def on_reset_settings(self):
         """Reset all settings to default values"""
         # Default values
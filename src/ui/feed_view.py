@@ -0,0 +1,70 @@
+from PySide6.QtCore import Qt, QSize, Signal
+from PySide6.QtGui import QPixmap, QImage, QMovie
+from PySide6.QtWidgets import QLabel
+
+from src.ui.styles.main_dock_styles import MainWindowStyles
+from src.utils.utils import get_assets_path
+
+
+class FeedView(QLabel):
+    """
+    Shows the frames of one capture session, with the loading animation while the
+    camera starts. Clicking the feed makes its session the one the docks control.
+    """
+    Clicked = Signal()
+
+    def __init__(self, video_thread, parent=None):
+        super().__init__(parent)
+        self.video_thread = video_thread
+        self.setStyleSheet(MainWindowStyles.CAMERA_WINDOW_STYLE)
+        self.setMinimumSize(*MainWindowStyles.CAMERA_MIN_SIZE)
+        self.setAlignment(Qt.AlignCenter)
+
+        # Each feed has its own animation so feeds start and stop loading independently
+        self.loading_movie = QMovie(get_assets_path("loading.gif"))
+        self.loading_movie.setScaledSize(QSize(*MainWindowStyles.LOADING_GIF_SIZE))
+
+    def mousePressEvent(self, event):
+        super().mousePressEvent(event)
+        self.Clicked.emit()
+
+    def setActive(self, active):
+        """Highlight the feed whose session the docks control"""
+        self.setStyleSheet(MainWindowStyles.ACTIVE_CAMERA_WINDOW_STYLE if active
+                           else MainWindowStyles.CAMERA_WINDOW_STYLE)
+
+    def updateImage(self, image: QImage):
+        tracer = self.video_thread.profiler.tracer
+        if tracer is not None:
+            tracer.name_thread("GUI")
+            with tracer.span("paint"):
+                self.showImage(image)
+        else:
+            self.showImage(image)
+        self.video_thread.latency.image_painted(image)
+
+    def showImage(self, image: QImage):
+        if image and not image.isNull():
+            self.stopLoading()
+            self.setPixmap(QPixmap.fromImage(image))
+        else:
+            self.setPixmap(QPixmap())
+            if self.video_thread.is_changing_settings or self.video_thread.isRunning():
+                self.startLoading()
+            else:
+                self.showNoCapture()
+
+    def startLoading(self):
+        self.setText("")
+        self.setMovie(self.loading_movie)
+        if self.loading_movie.state() != QMovie.Running:
+            self.loading_movie.start()
+
+    def stopLoading(self):
+        if self.loading_movie.state() == QMovie.Running:
+            self.loading_movie.stop()
+        self.setMovie(None)
+
+    def showNoCapture(self):
+        self.stopLoading()
+        self.setText("No capture 😠")
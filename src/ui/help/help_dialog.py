@@ -190,6 +190,7 @@ class HelpDialog(QDialog):
                 <li><strong>Point Up:</strong> Point your index finger up (all other fingers down) to start drawing.</li>
                 <li><strong>Move Finger:</strong> Move your pointed finger to draw your signature.</li>
                 <li><strong>Thumbs Down:</strong> Show a thumbs down gesture to clear the canvas and start over.</li>
+                <li><strong>Victory:</strong> Show a victory (V) sign to undo the last stroke, once per gesture.</li>
                 <li><strong>Thumbs Up:</strong> Show a thumbs up gesture and hold it to save the signature to a file.</li>
             </ol>
         </section>
@@ -200,6 +201,7 @@ class HelpDialog(QDialog):
                 <li>Adjust the minimum and maximum distance sliders to set the sensitivity of the signature recognition.</li>
                 <li>Change the minimum points slider to set the minimum number of points required for saving the signature.</li>
                 <li>Adjust the save duration slider to set the time for saving the signature.</li>
+                <li>Use the "Undo" and "Redo" buttons to take back the last stroke or bring it back.</li>
                 <li>Use the "Clear" button to remove the current signature if needed.</li>
                 <li>Click the "Reset" button to restore default settings.</li>
                 <li>Click the "Save" button to save the signature.</li>
@@ -1,55 +1,48 @@
-from PySide6.QtCore import Qt, QSize
-from PySide6.QtGui import QPixmap, QImage, QMovie, QIcon, QAction
-from PySide6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QLabel, QApplication, QMenu
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QIcon, QAction
+from PySide6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QGridLayout, QApplication, QMenu
 
 from src.ui.about.about_dialog import AboutDialog
 from src.ui.dock.camera_setting_dock import CameraSettingsDock
+from src.ui.dock.performance_dock import PerformanceDock
 from src.ui.dock.signature_settings_dock import SignatureSettingsDock
+from src.ui.feed_view import FeedView
 from src.ui.help.help_dialog import HelpDialog
 from src.ui.status.status_bar import StatusBar
 from src.ui.styles.main_dock_styles import MainWindowStyles
+from src.utils.startup_profiler import startup_profiler
 from src.utils.utils import get_assets_path
 from src.video_thread import VideoThread
 
 
 class MainWindow(QMainWindow):
-    def __init__(self):
+    def __init__(self, camera_indices=(0,)):
         super(MainWindow, self).__init__()
-        self.VideoThread = VideoThread()
+        # One capture session per camera; the docks control the active one
+        self.video_threads = [VideoThread(camera_index) for camera_index in camera_indices]
+        self.VideoThread = self.video_threads[0]
         self.initUI()
 
     def closeEvent(self, event):
-        if self.VideoThread.isRunning():
-            self.VideoThread.stop()
-        self.VideoThread.ImageUpdate.disconnect(self.updateImage)
-        self.VideoThread.StatusUpdate.disconnect(self.updateStatusBar)
+        for thread, feed in zip(self.video_threads, self.feeds):
+            if thread.isRunning():
+                thread.stop()
+            thread.ImageUpdate.disconnect(feed.updateImage)
+            thread.StatusUpdate.disconnect(self.updateStatusBar)
         event.accept()
 
-    def updateImage(self, image: QImage):
-        if image and not image.isNull():
-            self.stopLoading()
-            self.camera_window.setPixmap(QPixmap.fromImage(image))
-        else:
-            self.camera_window.setPixmap(QPixmap())
-            self.startLoading() if self.VideoThread.is_changing_settings or self.VideoThread.isRunning() else self.showNoCapture()
-
+    def setActiveFeed(self, index):
+        """Make the session of feed `index` the one shown in the docks and the status bar"""
+        self.VideoThread = self.video_threads[index]
+        self.camera_window = self.feeds[index]
+        if len(self.feeds) > 1:
+            for feed in self.feeds:
+                feed.setActive(feed is self.camera_window)
+        for dock in (self.camera_dock, self.signature_dock, self.performance_dock):
+            dock.setVideoThread(self.VideoThread)
+        self.performance_dock.setVisible(self.signature_dock.dev_mode_checkbox.isChecked())
         self.updateStatusBar()
 
-    def startLoading(self):
-        self.camera_window.setText("")
-        self.camera_window.setMovie(self.loading_movie)
-        if self.loading_movie.state() != QMovie.Running:
-            self.loading_movie.start()
-
-    def stopLoading(self):
-        if self.loading_movie.state() == QMovie.Running:
-            self.loading_movie.stop()
-        self.camera_window.setMovie(None)
-
-    def showNoCapture(self):
-        self.stopLoading()
-        self.camera_window.setText("No capture 😠")
-
     def initMainWindow(self) -> None:
         screen_rect = QApplication.primaryScreen().availableGeometry()
         window_width = screen_rect.width() // 2
@@ -65,10 +58,23 @@ class MainWindow(QMainWindow):
         self.setStyleSheet(MainWindowStyles.WINDOW_STYLE)
 
     def initVideoThread(self) -> None:
-        self.VideoThread.ImageUpdate.connect(self.updateImage)
-        self.VideoThread.StatusUpdate.connect(self.updateStatusBar)
-        self.camera_dock = CameraSettingsDock(self)
-        self.signature_dock = SignatureSettingsDock(self)
+        self.feeds = []
+        for index, thread in enumerate(self.video_threads):
+            feed = FeedView(thread)
+            if len(self.video_threads) > 1:
+                feed.setMinimumSize(*MainWindowStyles.MULTI_FEED_MIN_SIZE)
+            feed.Clicked.connect(lambda index=index: self.setActiveFeed(index))
+            thread.ImageUpdate.connect(feed.updateImage)
+            thread.StatusUpdate.connect(self.updateStatusBar)
+            thread.CaptureFailed.connect(self.onCaptureFailed)
+            self.feeds.append(feed)
+        self.camera_window = self.feeds[0]
+        with startup_profiler.phase("dock: camera settings"):
+            self.camera_dock = CameraSettingsDock(self)
+        with startup_profiler.phase("dock: signature settings"):
+            self.signature_dock = SignatureSettingsDock(self)
+        with startup_profiler.phase("dock: performance"):
+            self.performance_dock = PerformanceDock(self)
 
     def initMenuBar(self) -> None:
         # Create menu bar
@@ -101,6 +107,12 @@ class MainWindow(QMainWindow):
         finger_x, finger_y = self.VideoThread.current_finger_position
         self.statusbar.update_status(points_count, finger_x, finger_y)
 
+    def onCaptureFailed(self, message):
+        """A session stopped capturing on its own: report it and show its controls as stopped"""
+        self.statusbar.showMessage(message, 10000)
+        if self.sender() is self.camera_dock.VideoThread:
+            self.camera_dock.showCaptureState(False)
+
     def showAboutDialog(self) -> None:
         dialog = AboutDialog(self)
         dialog.exec()
@@ -110,30 +122,36 @@ class MainWindow(QMainWindow):
         dialog.exec()
 
     def initUI(self):
-        self.initMainWindow()
-        central_widget = QWidget()
-        central_widget.setStyleSheet(MainWindowStyles.CENTRAL_WIDGET_STYLE)
-        self.setCentralWidget(central_widget)
-        self.setWindowIcon(QIcon(get_assets_path("logo.png")))
-        self.initVideoThread()
-        self.initMenuBar()
-        self.initStatusBar()  # Initialize the status bar
+        with startup_profiler.phase("initUI: main window"):
+            self.initMainWindow()
+            central_widget = QWidget()
+            central_widget.setStyleSheet(MainWindowStyles.CENTRAL_WIDGET_STYLE)
+            self.setCentralWidget(central_widget)
+            self.setWindowIcon(QIcon(get_assets_path("logo.png")))
+        with startup_profiler.phase("initUI: video thread and docks"):
+            self.initVideoThread()
+        with startup_profiler.phase("initUI: menu bar"):
+            self.initMenuBar()
+        with startup_profiler.phase("initUI: status bar"):
+            self.initStatusBar()  # Initialize the status bar
         flags = self.windowFlags()
         flags &= ~Qt.WindowStaysOnTopHint
         self.setWindowFlags(flags)
         self.setWindowFlags(Qt.Window)
 
         self.VBL = QVBoxLayout()
-        self.camera_window = QLabel()
-        self.camera_window.setStyleSheet(MainWindowStyles.CAMERA_WINDOW_STYLE)
-        self.camera_window.setMinimumSize(*MainWindowStyles.CAMERA_MIN_SIZE)
-        self.camera_window.setAlignment(Qt.AlignCenter)
-
-        # Create the loading animation using a GIF
-        self.loading_movie = QMovie(get_assets_path("loading.gif"))
-        self.loading_movie.setScaledSize(QSize(*MainWindowStyles.LOADING_GIF_SIZE))
+        self.feed_grid = QGridLayout()
+        for index, feed in enumerate(self.feeds):
+            self.feed_grid.addWidget(feed, *divmod(index, MainWindowStyles.FEED_COLUMNS))
+        if len(self.feeds) > 1:
+            self.feeds[0].setActive(True)
 
-        self.VBL.addWidget(self.camera_window)
+        self.VBL.addLayout(self.feed_grid)
         self.addDockWidget(Qt.LeftDockWidgetArea, self.camera_dock)
         self.addDockWidget(Qt.RightDockWidgetArea, self.signature_dock)
+        self.addDockWidget(Qt.RightDockWidgetArea, self.performance_dock)
+
+        # The performance panel is only shown in developer mode
+        self.performance_dock.setVisible(self.signature_dock.dev_mode_checkbox.isChecked())
+        self.signature_dock.dev_mode_checkbox.toggled.connect(self.performance_dock.setVisible)
         central_widget.setLayout(self.VBL)
@@ -22,6 +22,17 @@ class MainWindowStyles:
         }
     """
 
+    # Feed whose session the docks control, when several cameras are shown
+    ACTIVE_CAMERA_WINDOW_STYLE = """
+        QLabel {
+            font-size: 20px;
+            background-color: #e2e8f0;
+            border: 2px solid #3b82f6;
+            border-radius: 4px;
+            color: #4a5568;
+        }
+    """
+
     # No capture text styling
     NO_CAPTURE_TEXT_STYLE = """
         font-size: 20px;
@@ -45,4 +56,6 @@ class MainWindowStyles:
     # Layout constants
     LOADING_GIF_SIZE = (128, 128)
     CAMERA_MIN_SIZE = (640, 480)
+    MULTI_FEED_MIN_SIZE = (320, 240)
+    FEED_COLUMNS = 2
     WINDOW_TITLE = "DeepSignus"
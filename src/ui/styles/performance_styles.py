@@ -0,0 +1,55 @@
+class PerformanceStyles:
+    """
+    Centralized styling for the developer performance panel
+    """
+
+    # Main dock widget style
+    DOCK_STYLE = """
+        QDockWidget {
+            color: #1a202c;
+            background-color: #f7fafc;
+            border: 1px solid #e2e8f0;
+            border-radius: 4px;
+            font-family: 'Segoe UI', Arial, sans-serif;
+            font-weight: bold;
+        }
+        QDockWidget::title {
+            background-color: #edf2f7;
+            padding: 6px;
+            text-align: center;
+            border-bottom: 1px solid #e2e8f0;
+        }
+    """
+
+    # Widget container style
+    WIDGET_STYLE = """
+        background-color: #f7fafc;
+        font-family: 'Segoe UI', Arial, sans-serif;
+    """
+
+    # Summary label style
+    LABEL_STYLE = """
+        QLabel {
+            color: #4a5568;
+            font-weight: 500;
+            font-size: 12px;
+        }
+    """
+
+    # Stage breakdown style (monospace so the columns line up)
+    STAGES_STYLE = """
+        QLabel {
+            color: #1a202c;
+            font-family: Consolas, 'Courier New', monospace;
+            font-size: 11px;
+            padding: 4px;
+            background-color: white;
+            border: 1px solid #e2e8f0;
+            border-radius: 4px;
+        }
+    """
+
+    # Layout constants
+    MARGINS = (10, 10, 10, 10)
+    SPACING = 4
+    REFRESH_INTERVAL_MS = 250
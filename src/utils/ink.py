@@ -0,0 +1,137 @@
+import math
+
+import cv2
+import numpy as np
+
+# Fractional bits of the coordinates handed to OpenCV, ink is positioned to 1/16 px
+SHIFT = 4
+ONE = 1 << SHIFT
+
+
+def union_bounds(first, second):
+    """Smallest (x0, y0, x1, y1) box containing two boxes, either of which may be None"""
+    if first is None:
+        return second
+    if second is None:
+        return first
+    return (min(first[0], second[0]), min(first[1], second[1]),
+            max(first[2], second[2]), max(first[3], second[3]))
+
+
+def segment_bounds(start, end, width, shape):
+    """Box of the board covered by a segment drawn `width` px wide, clipped to the board, None if outside"""
+    margin = width / 2 + 2  # Anti-aliased edges spill over by a pixel
+    x0 = max(0, int(min(start[0], end[0]) - margin))
+    y0 = max(0, int(min(start[1], end[1]) - margin))
+    x1 = min(shape[1], int(math.ceil(max(start[0], end[0]) + margin)) + 1)
+    y1 = min(shape[0], int(math.ceil(max(start[1], end[1]) + margin)) + 1)
+    if x0 >= x1 or y0 >= y1:
+        return None
+    return x0, y0, x1, y1
+
+
+def draw_segment(board, start, end, start_width, end_width, color):
+    """
+    Draw one anti-aliased segment whose width changes from `start_width` to `end_width`,
+    with round ends, into the box of the board it covers. Returns that box, or None.
+    """
+    bounds = segment_bounds(start, end, max(start_width, end_width), board.shape)
+    if bounds is None:
+        return None
+    x0, y0, x1, y1 = bounds
+    roi = board[y0:y1, x0:x1]
+    ax, ay = start[0] - x0, start[1] - y0
+    bx, by = end[0] - x0, end[1] - y0
+
+    def fixed(x, y):
+        return int(round(x * ONE)), int(round(y * ONE))
+
+    ra, rb = start_width / 2, end_width / 2
+    cv2.circle(roi, fixed(ax, ay), int(round(ra * ONE)), color, -1, cv2.LINE_AA, SHIFT)
+    cv2.circle(roi, fixed(bx, by), int(round(rb * ONE)), color, -1, cv2.LINE_AA, SHIFT)
+    length = math.hypot(bx - ax, by - ay)
+    if length > 0:
+        # Unit normal of the segment, the body is the quad between the two end circles
+        nx, ny = -(by - ay) / length, (bx - ax) / length
+        quad = np.array([fixed(ax + nx * ra, ay + ny * ra), fixed(bx + nx * rb, by + ny * rb),
+                         fixed(bx - nx * rb, by - ny * rb), fixed(ax - nx * ra, ay - ny * ra)], dtype=np.int32)
+        cv2.fillConvexPoly(roi, quad, color, cv2.LINE_AA, SHIFT)
+    return bounds
+
+
+def draw_stroke(board, stroke, color, origin=(0, 0)):
+    """
+    Draw a stroke of (x, y, width) points. `origin` is the position of board[0, 0] on
+    the drawing board, so a region of the board can be passed as `board`. Returns the
+    box that was drawn, in the coordinates of `board`.
+    """
+    ox, oy = origin
+    bounds = None
+    for (x0, y0, w0), (x1, y1, w1) in zip(stroke, stroke[1:]):
+        bounds = union_bounds(bounds, draw_segment(board, (x0 - ox, y0 - oy), (x1 - ox, y1 - oy), w0, w1, color))
+    return bounds
+
+
+def stroke_bounds(stroke, shape):
+    """Box of a board of `shape` covered by the ink of a stroke, None if it has none"""
+    bounds = None
+    for start, end in zip(stroke, stroke[1:]):
+        bounds = union_bounds(bounds, segment_bounds(start, end, max(start[2], end[2]), shape))
+    return bounds
+
+
+def redraw_region(board, strokes, bounds, color):
+    """Clear a box of the board and draw again the parts of `strokes` crossing it"""
+    x0, y0, x1, y1 = bounds
+    region = board[y0:y1, x0:x1]
+    region[:] = 0
+    for stroke in strokes:
+        draw_stroke(region, stroke, color, origin=(x0, y0))
+
+
+class InkRasterizer:
+    """
+    Incremental stroke renderer: every new fingertip position adds one anti-aliased
+    segment from the previous one, drawn only into the box of the board it covers.
+    The width follows the fingertip speed like a pen, wide when slow and thin when
+    fast, and is smoothed so it does not jump between segments.
+    """
+
+    def __init__(self, min_width: float = 3.0, max_width: float = 7.0, min_width_speed: float = 1200.0,
+                 smoothing: float = 0.5):
+        self.min_width = min_width
+        self.max_width = max_width
+        # Speed in px/s at which the stroke reaches its minimum width
+        self.min_width_speed = min_width_speed
+        self.smoothing = smoothing
+        self.begin()
+
+    def begin(self):
+        """Start a new stroke"""
+        self.point = None
+        self.time = None
+        self.width = None
+
+    def width_at(self, point, t):
+        """Width of the stroke at `point` reached at `t` seconds"""
+        if self.point is None or t <= self.time:
+            target = self.max_width if self.width is None else self.width
+        else:
+            speed = math.hypot(point[0] - self.point[0], point[1] - self.point[1]) / (t - self.time)
+            ratio = min(1.0, speed / self.min_width_speed)
+            target = self.max_width - (self.max_width - self.min_width) * ratio
+        if self.width is None:
+            return target
+        return self.width + self.smoothing * (target - self.width)
+
+    def add(self, board, point, t, color):
+        """
+        Extend the stroke to `point` reached at `t` seconds. Returns the width at the
+        point and the box of the board that was drawn, None for the first point.
+        """
+        width = round(self.width_at(point, t), 1)
+        bounds = None
+        if self.point is not None:
+            bounds = draw_segment(board, self.point, point, self.width, width, color)
+        self.point, self.time, self.width = point, t, width
+        return width, bounds
@@ -0,0 +1,92 @@
+import time
+from collections import OrderedDict
+
+from src.utils.profiler import StageProfiler
+
+
+class LatencyTracker:
+    """
+    Measurement mode for perceived pen lag.
+
+    * glass_to_glass: from the moment a frame was captured to the moment
+      FeedView.updateImage painted it.
+    * fingertip_to_ink: from the capture of the frame the recognizer saw to the
+      cv2.line that drew the fingertip onto the drawing board.
+    * camera_delay: how much later than the best observed frame a frame was read,
+      based on the camera timestamp (CAP_PROP_POS_MSEC) when the backend provides one.
+
+    The capture moment is estimated on the time.perf_counter() clock: the read time
+    minus the camera delay. Distributions cover the whole measurement session.
+    """
+    CAPTURE_TIME_KEY = "capture_time"
+
+    def __init__(self, enabled: bool = False, max_frames: int = 256):
+        self.enabled = enabled
+        self.max_frames = max_frames
+        self.distributions = StageProfiler(enabled=True, window_seconds=float("inf"))
+        self._frames = OrderedDict()
+        self._min_camera_offset = None
+
+    def frame_read(self, camera_msec=0.0):
+        """
+        Return the estimated capture time of the frame that was just read.
+        `camera_msec` is the value of CAP_PROP_POS_MSEC, 0 if unavailable.
+        """
+        read_time = time.perf_counter()
+        if not self.enabled or camera_msec <= 0:
+            return read_time
+
+        # The offset between the two clocks is constant, so any increase over the
+        # smallest offset seen is time the frame spent in the driver and buffers
+        offset = read_time - camera_msec / 1000.0
+        if self._min_camera_offset is None or offset < self._min_camera_offset:
+            self._min_camera_offset = offset
+        delay = offset - self._min_camera_offset
+        self.distributions.record("camera_delay", delay)
+        return read_time - delay
+
+    def frame_submitted(self, timestamp_ms, capture_time):
+        """Remember the capture time of a frame sent to the recognizer"""
+        if not self.enabled:
+            return
+        self._frames[timestamp_ms] = capture_time
+        while len(self._frames) > self.max_frames:
+            self._frames.popitem(last=False)
+
+    def ink_drawn(self, timestamp_ms):
+        """
+        Record fingertip-to-ink latency for the recognizer frame `timestamp_ms`. Frames
+        between two results reuse the last one, only its first ink is a sample.
+        """
+        if not self.enabled:
+            return
+        capture_time = self._frames.pop(timestamp_ms, None)
+        if capture_time is not None:
+            self.distributions.record("fingertip_to_ink", time.perf_counter() - capture_time)
+
+    def tag_image(self, image, capture_time):
+        """Attach the capture time to a QImage so the GUI can measure paint latency"""
+        if self.enabled:
+            image.setText(self.CAPTURE_TIME_KEY, repr(capture_time))
+        return image
+
+    def image_painted(self, image):
+        """Record glass-to-glass latency for a painted QImage"""
+        if not self.enabled:
+            return
+        capture_time = image.text(self.CAPTURE_TIME_KEY)
+        if capture_time:
+            self.distributions.record("glass_to_glass", time.perf_counter() - float(capture_time))
+
+    def report(self):
+        """Return {metric: summary} in milliseconds"""
+        return self.distributions.snapshot()
+
+    def format_report(self):
+        """Return the distributions as a markdown table"""
+        lines = ["| Metric | Count | Mean (ms) | p50 | p95 | p99 | Max |",
+                 "|--------|-------|-----------|-----|-----|-----|-----|"]
+        for name, s in self.report().items():
+            lines.append(f"| {name} | {s['count']} | {s['mean']:.1f} | {s['p50']:.1f} | {s['p95']:.1f} | "
+                         f"{s['p99']:.1f} | {s['max']:.1f} |")
+        return "\n".join(lines)
@@ -0,0 +1,134 @@
+from collections import OrderedDict
+
+import cv2
+import numpy as np
+
+
+class Sprite:
+    """
+    A pre-rendered BGRA overlay element.
+    `offset` is the position of the anchor point inside the sprite, so the sprite
+    can be placed using the same coordinates that cv2.putText/cv2.rectangle take.
+    """
+    __slots__ = ("image", "mask", "offset", "size")
+
+    def __init__(self, image, offset, size):
+        self.image = image
+        self.offset = offset
+        self.size = size
+        # Hershey text and filled rectangles are not anti-aliased, so the alpha channel
+        # is binary and blending becomes a masked copy
+        self.mask = image[:, :, 3] == 255
+
+
+class OverlayCache:
+    """
+    LRU cache of rasterised HUD elements (text messages and progress bars).
+    Every distinct message or progress state is rendered once into a small BGRA sprite
+    and then blended only into its own rectangle of the frame.
+    """
+    FONT = cv2.FONT_HERSHEY_SIMPLEX
+
+    def __init__(self, max_sprites: int = 128):
+        self.max_sprites = max_sprites
+        self._sprites = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._sprites)
+
+    def clear(self):
+        """Drop all cached sprites"""
+        self._sprites.clear()
+
+    def _get(self, key, render):
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            self._sprites.move_to_end(key)
+            self.hits += 1
+            return sprite
+
+        self.misses += 1
+        sprite = render()
+        self._sprites[key] = sprite
+        if len(self._sprites) > self.max_sprites:
+            self._sprites.popitem(last=False)
+        return sprite
+
+    def text_sprite(self, text, scale, color, thickness=2, background=None, padding=0):
+        """Return the sprite for a text message, rendering it on the first request"""
+        key = ("text", text, scale, color, thickness, background, padding)
+        return self._get(key, lambda: self._render_text(text, scale, color, thickness, background, padding))
+
+    def progress_sprite(self, progress, width, height, fill_color, border_color, thickness=2):
+        """Return the sprite for a progress bar filled to `progress` percent"""
+        progress = max(0, min(100, int(progress)))
+        key = ("progress", progress, width, height, fill_color, border_color, thickness)
+        return self._get(key, lambda: self._render_progress(progress, width, height, fill_color,
+                                                            border_color, thickness))
+
+    def text_size(self, text, scale, thickness=2):
+        """Return the (width, height) of a text message without recomputing cv2.getTextSize"""
+        return self.text_sprite(text, scale, (255, 255, 255), thickness).size
+
+    def _render_text(self, text, scale, color, thickness, background, padding):
+        (text_w, text_h), baseline = cv2.getTextSize(text, self.FONT, scale, thickness)
+        margin = thickness + padding
+        height = text_h + baseline + 2 * margin
+        width = text_w + 2 * margin
+        origin = (margin, margin + text_h)
+
+        image = np.zeros((height, width, 4), dtype=np.uint8)
+        if background is not None:
+            # Same rectangle the old code drew: from (x - pad, y - h - pad) to (x + w + pad, y + pad)
+            cv2.rectangle(image, (origin[0] - padding, origin[1] - text_h - padding),
+                          (origin[0] + text_w + padding, origin[1] + padding), (*background, 255), -1)
+        cv2.putText(image, text, origin, self.FONT, scale, (*color, 255), thickness)
+        return Sprite(image, origin, (text_w, text_h))
+
+    @staticmethod
+    def _render_progress(progress, width, height, fill_color, border_color, thickness):
+        margin = thickness
+        image = np.zeros((height + 2 * margin + 1, width + 2 * margin + 1, 4), dtype=np.uint8)
+        origin = (margin, margin)
+
+        cv2.rectangle(image, origin, (margin + width, margin + height), (*border_color, 255), thickness)
+        progress_width = int((progress / 100) * width)
+        cv2.rectangle(image, origin, (margin + progress_width, margin + height), (*fill_color, 255), -1)
+        return Sprite(image, origin, (width, height))
+
+    @staticmethod
+    def blend(frame, sprite, x, y):
+        """Blend a sprite into the frame so that its anchor lands on (x, y)"""
+        frame_h, frame_w = frame.shape[:2]
+        sprite_h, sprite_w = sprite.image.shape[:2]
+        left, top = x - sprite.offset[0], y - sprite.offset[1]
+
+        # Clip the sprite rectangle to the frame
+        x0, y0 = max(left, 0), max(top, 0)
+        x1, y1 = min(left + sprite_w, frame_w), min(top + sprite_h, frame_h)
+        if x0 >= x1 or y0 >= y1:
+            return frame
+
+        sx0, sy0 = x0 - left, y0 - top
+        sx1, sy1 = sx0 + (x1 - x0), sy0 + (y1 - y0)
+        np.copyto(frame[y0:y1, x0:x1], sprite.image[sy0:sy1, sx0:sx1, :3],
+                  where=sprite.mask[sy0:sy1, sx0:sx1, None])
+        return frame
+
+    def draw_text(self, frame, text, position, scale, color, thickness=2, background=None, padding=0):
+        """Draw a cached text sprite with its baseline-left corner at `position`"""
+        sprite = self.text_sprite(text, scale, color, thickness, background, padding)
+        return self.blend(frame, sprite, *position)
+
+    def draw_text_centered(self, frame, text, y, scale, color, thickness=2, background=None, padding=0):
+        """Draw a cached text sprite horizontally centered on the frame"""
+        sprite = self.text_sprite(text, scale, color, thickness, background, padding)
+        x = int((frame.shape[1] - sprite.size[0]) / 2)
+        return self.blend(frame, sprite, x, y)
+
+    def draw_progress_bar(self, frame, position, width, height, progress, fill_color, border_color):
+        """Draw a cached progress bar with its top-left corner at `position`"""
+        sprite = self.progress_sprite(progress, width, height, fill_color, border_color)
+        return self.blend(frame, sprite, *position)
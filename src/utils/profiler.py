@@ -0,0 +1,178 @@
+import threading
+import time
+
+
+class LatencyHistogram:
+    """
+    HDR-style histogram of durations with log-linear buckets.
+    Values are stored in microseconds; every power-of-two range is split into
+    SUB_BUCKETS linear buckets, which keeps the relative error around 3%
+    while recording stays O(1) and memory stays constant.
+    """
+    SUB_BUCKETS = 16
+    SUB_BITS = 4  # log2(SUB_BUCKETS)
+    OCTAVES = 40
+
+    def __init__(self):
+        self.counts = [0] * (self.SUB_BUCKETS * (self.OCTAVES + 1))
+        self.count = 0
+        self.total_us = 0
+        self.max_us = 0
+
+    def _index(self, value_us):
+        if value_us < self.SUB_BUCKETS:
+            return value_us
+        shift = value_us.bit_length() - self.SUB_BITS - 1
+        return min(self.SUB_BUCKETS * shift + (value_us >> shift), len(self.counts) - 1)
+
+    def _value(self, index):
+        if index < self.SUB_BUCKETS:
+            return index
+        shift = index // self.SUB_BUCKETS - 1
+        mantissa = index - self.SUB_BUCKETS * shift
+        # Midpoint of the bucket
+        return (mantissa << shift) + ((1 << shift) >> 1)
+
+    def record(self, seconds):
+        """Add a duration given in seconds"""
+        value_us = max(0, int(seconds * 1_000_000))
+        self.counts[self._index(value_us)] += 1
+        self.count += 1
+        self.total_us += value_us
+        if value_us > self.max_us:
+            self.max_us = value_us
+
+    def merge(self, other):
+        """Add the counts of another histogram to this one"""
+        for i, c in enumerate(other.counts):
+            if c:
+                self.counts[i] += c
+        self.count += other.count
+        self.total_us += other.total_us
+        self.max_us = max(self.max_us, other.max_us)
+
+    def percentile(self, percent):
+        """Return the given percentile in milliseconds"""
+        if self.count == 0:
+            return 0.0
+        target = max(1, int(round(self.count * percent / 100.0)))
+        seen = 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if seen >= target:
+                return min(self._value(i), self.max_us) / 1000.0
+        return self.max_us / 1000.0
+
+    def summary(self):
+        """Return count, mean, p50/p95/p99 and max in milliseconds"""
+        return {
+            "count": self.count,
+            "mean": (self.total_us / self.count / 1000.0) if self.count else 0.0,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": self.max_us / 1000.0,
+        }
+
+
+class _NullTimer:
+    """No-op context manager used when profiling is disabled"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _StageTimer:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.add(self.name, self.start, time.perf_counter())
+        return False
+
+
+class StageProfiler:
+    """
+    Per-stage timing of the video loop.
+    Each stage keeps a rolling histogram made of the current and the previous window,
+    so percentiles describe roughly the last `window_seconds` seconds.
+    When disabled and no tracer is attached, `stage()` returns a shared no-op context manager.
+    An optional ChromeTracer receives every stage as a span, independently of `enabled`.
+    """
+
+    def __init__(self, enabled: bool = False, window_seconds: float = 10.0):
+        self.enabled = enabled
+        self.tracer = None
+        self.window_seconds = window_seconds
+        self._lock = threading.Lock()
+        self._current = {}
+        self._previous = {}
+        self._window_start = time.monotonic()
+
+    def stage(self, name):
+        """Return a context manager timing the enclosed block as stage `name`"""
+        if not self.enabled and self.tracer is None:
+            return _NULL_TIMER
+        return _StageTimer(self, name)
+
+    def add(self, name, start, end):
+        """Record stage `name` from two time.perf_counter() values, also as a trace span"""
+        if self.tracer is not None:
+            self.tracer.add_span(name, start, end)
+        self.record(name, end - start)
+
+    def record(self, name, seconds):
+        """Record a duration (in seconds) for stage `name`"""
+        if not self.enabled:
+            return
+        with self._lock:
+            now = time.monotonic()
+            if now - self._window_start >= self.window_seconds:
+                self._previous = self._current
+                self._current = {}
+                self._window_start = now
+            histogram = self._current.get(name)
+            if histogram is None:
+                histogram = self._current[name] = LatencyHistogram()
+            histogram.record(seconds)
+
+    def histogram(self, name):
+        """Return a merged histogram of the current and previous window for stage `name`"""
+        merged = LatencyHistogram()
+        with self._lock:
+            for window in (self._previous, self._current):
+                if name in window:
+                    merged.merge(window[name])
+        return merged
+
+    def stages(self):
+        """Return the names of all recorded stages in order of first appearance"""
+        with self._lock:
+            names = list(self._previous)
+            names.extend(name for name in self._current if name not in self._previous)
+        return names
+
+    def snapshot(self):
+        """Return {stage: summary} for every recorded stage"""
+        return {name: self.histogram(name).summary() for name in self.stages()}
+
+    def reset(self):
+        """Forget all recorded timings"""
+        with self._lock:
+            self._current = {}
+            self._previous = {}
+            self._window_start = time.monotonic()
@@ -0,0 +1,78 @@
+import importlib
+import time
+from contextlib import contextmanager, nullcontext
+
+
+class StartupProfiler:
+    """
+    Wall time of the application startup phases, enabled by main.py --profile-startup.
+    Phases are timed spans, milestones are moments measured from the start of main.py.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.origin = time.perf_counter()
+        self.phases = []
+        self.milestones = {}
+
+    def phase(self, name):
+        """Context manager timing a phase, a no-op when disabled"""
+        if not self.enabled:
+            return nullcontext()
+        return self._timed(name)
+
+    def once(self, name):
+        """Like phase(), but only the first occurrence is recorded (e.g. the first camera open)"""
+        if not self.enabled or any(phase_name == name for phase_name, _, _ in self.phases):
+            return nullcontext()
+        return self._timed(name)
+
+    @contextmanager
+    def _timed(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, start, time.perf_counter())
+
+    def add(self, name, start, end):
+        """Record a phase measured with time.perf_counter()"""
+        if self.enabled:
+            self.phases.append((name, start, end))
+
+    def mark(self, name):
+        """Record the first time a milestone is reached"""
+        if self.enabled and name not in self.milestones:
+            self.milestones[name] = time.perf_counter()
+
+    def time_imports(self, modules):
+        """Import modules one by one so each is timed without the modules imported before it"""
+        for module in modules:
+            with self.phase(f"import {module}"):
+                importlib.import_module(module)
+
+    def ranked(self):
+        """Phases as (name, duration, start offset) in seconds, slowest first"""
+        return sorted(((name, end - start, start - self.origin) for name, start, end in self.phases),
+                      key=lambda phase: phase[1], reverse=True)
+
+    def format_report(self):
+        """Markdown report of the phases ranked by duration and the milestones in order"""
+        report = "# Startup Profile\n\n"
+        report += "| Rank | Phase | Duration (ms) | Started at (ms) |\n"
+        report += "|------|-------|---------------|-----------------|\n"
+        for rank, (name, duration, start) in enumerate(self.ranked(), 1):
+            report += f"| {rank} | {name} | {duration * 1000:.1f} | {start * 1000:.1f} |\n"
+
+        report += "\n| Milestone | Time since start (ms) |\n"
+        report += "|-----------|-----------------------|\n"
+        for name, moment in sorted(self.milestones.items(), key=lambda item: item[1]):
+            report += f"| {name} | {(moment - self.origin) * 1000:.1f} |\n"
+        return report
+
+    def write(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.format_report())
+
+
+startup_profiler = StartupProfiler()
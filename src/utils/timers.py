@@ -0,0 +1,69 @@
+import time
+
+
+class ManualClock:
+    """Clock that only moves when told to, e.g. to the time of the video frame being processed"""
+
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def set(self, now):
+        self.now = now
+
+
+class Timers:
+    """
+    Named timeouts of a capture session (save cooldown, thumb up hold, on-screen
+    messages) measured on one monotonic clock, so they last the same time at any
+    frame rate. The clock is injectable: offline processing and replays pass a
+    ManualClock following the frame times, which lets them run faster than real time.
+    """
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self.timers = {}
+
+    def now(self):
+        return self.clock()
+
+    def start(self, name, duration):
+        """Start (or restart) timer `name` running for `duration` seconds"""
+        self.timers[name] = (self.clock(), duration)
+
+    def cancel(self, name):
+        self.timers.pop(name, None)
+
+    def reset(self):
+        """Cancel all timers"""
+        self.timers.clear()
+
+    def started(self, name):
+        """True if timer `name` was started and not cancelled, expired or not"""
+        return name in self.timers
+
+    def elapsed(self, name):
+        """Seconds since timer `name` was started, None if it is not started"""
+        if name not in self.timers:
+            return None
+        return self.clock() - self.timers[name][0]
+
+    def active(self, name):
+        """True while timer `name` is running"""
+        elapsed = self.elapsed(name)
+        return elapsed is not None and elapsed < self.timers[name][1]
+
+    def expired(self, name):
+        """True once timer `name` has run for its duration"""
+        elapsed = self.elapsed(name)
+        return elapsed is not None and elapsed >= self.timers[name][1]
+
+    def progress(self, name):
+        """Fraction of timer `name` that has run, 0 if it is not started"""
+        elapsed = self.elapsed(name)
+        if elapsed is None:
+            return 0.0
+        duration = self.timers[name][1]
+        return min(1.0, elapsed / duration) if duration > 0 else 1.0
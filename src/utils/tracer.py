@@ -0,0 +1,119 @@
+import json
+import os
+import threading
+import time
+
+
+class ChromeTracer:
+    """
+    Opt-in recorder of pipeline spans in Chrome trace JSON format.
+    The files can be opened in chrome://tracing or https://ui.perfetto.dev.
+    Events are buffered in memory and written to `trace_<n>.json` files in `directory`
+    by a writer thread, so recording threads (including the GUI) never wait for the
+    disk; a new file is started every `file_duration` seconds and only the newest
+    `max_files` files are kept. close() writes the last interval.
+    """
+
+    def __init__(self, directory: str, file_duration: float = 10.0, max_files: int = 6):
+        self.directory = directory
+        self.file_duration = file_duration
+        self.max_files = max_files
+        self.pid = os.getpid()
+        self._lock = threading.Lock()
+        self._events = []
+        self._thread_names = {}
+        self._file_index = 0
+        self._file_start = time.perf_counter()
+        # Serializes writes of the writer thread and explicit flushes
+        self._write_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        os.makedirs(directory, exist_ok=True)
+        self._writer = threading.Thread(target=self._write_loop, name="ChromeTracer", daemon=True)
+        self._writer.start()
+        print(f"[INFO] Writing pipeline traces to {os.path.abspath(directory)}")
+
+    def name_thread(self, name):
+        """Label the calling thread in the trace viewer"""
+        self._thread_names[threading.get_ident()] = name
+
+    def add_span(self, name, start, end, category="pipeline", args=None):
+        """Record a complete span between two time.perf_counter() values"""
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": start * 1_000_000,
+            "dur": (end - start) * 1_000_000,
+            "pid": self.pid,
+            "tid": threading.get_ident(),
+        }
+        if args:
+            event["args"] = args
+        with self._lock:
+            self._events.append(event)
+            rotate = end - self._file_start >= self.file_duration
+        if rotate:
+            self._wake.set()
+
+    def span(self, name, category="pipeline"):
+        """Return a context manager recording the enclosed block as a span"""
+        return _Span(self, name, category)
+
+    def _metadata_events(self):
+        return [{"name": "thread_name", "ph": "M", "pid": self.pid, "tid": tid, "args": {"name": name}}
+                for tid, name in list(self._thread_names.items())]
+
+    def _write_loop(self):
+        """Writer thread: writes a file whenever a span closes an interval, or at the latest after each interval"""
+        while not self._closed:
+            self._wake.wait(self.file_duration)
+            self._wake.clear()
+            if not self._closed:
+                self.flush()
+
+    def flush(self):
+        """Write buffered events to the current file and start the next one"""
+        with self._write_lock:
+            with self._lock:
+                events, self._events = self._events, []
+                self._file_start = time.perf_counter()
+            if not events:
+                return None
+            # Numbers are only used by written files, so the oldest one is always index - max_files
+            index = self._file_index
+            self._file_index += 1
+
+            path = os.path.join(self.directory, f"trace_{index}.json")
+            with open(path, "w") as f:
+                json.dump({"traceEvents": self._metadata_events() + events, "displayTimeUnit": "ms"}, f)
+
+            # Remove the oldest file once the rotation limit is exceeded
+            stale = os.path.join(self.directory, f"trace_{index - self.max_files}.json")
+            if os.path.exists(stale):
+                os.remove(stale)
+            return path
+
+    def close(self):
+        """Stop the writer thread and write any remaining events"""
+        self._closed = True
+        self._wake.set()
+        self._writer.join()
+        return self.flush()
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "category", "start")
+
+    def __init__(self, tracer, name, category):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.tracer.add_span(self.name, self.start, time.perf_counter(), self.category)
+        return False
@@ -22,3 +22,34 @@ def get_assets_path(icon_name: str) -> str:
 
     icons_dir = os.path.join(base_path, "resources", "icons")
     return os.path.join(icons_dir, icon_name)
+
+
+def get_memory_usage_mb():
+    """
+    Get the resident memory of the current process in megabytes.
+    Uses psutil when it is installed, falls back to /proc on Linux and to the
+    peak resident size reported by the resource module elsewhere.
+
+    Returns:
+        float | None: Memory usage in MB, or None if it cannot be determined.
+    """
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    except ImportError:
+        pass
+
+    try:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS and kilobytes on Linux
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+    except ImportError:
+        return None
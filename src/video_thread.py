@@ -1,5 +1,6 @@
+import json
 import os
-import platform
+import threading
 import time
 
 from datetime import datetime
@@ -9,18 +10,31 @@ import numpy as np
 from PySide6.QtCore import Qt, QThread, Signal
 from PySide6.QtGui import QImage
 
+from src.capture.frame_source import CameraSource, MjpegCameraSource
+from src.model.gesture_state import (GestureStateMachine, observe_gesture, NONE, POINTING_UP, THUMB_UP, THUMB_DOWN,
+                                     VICTORY)
+from src.model.inference_process import InferenceProcessDied
+from src.model.session_log import SessionRecorder
 from src.model.signature import SignatureRecognition
+from src.model.stroke_filter import StrokeFilter
+from src.utils.ink import InkRasterizer, draw_stroke, redraw_region, stroke_bounds, union_bounds
+from src.utils.latency import LatencyTracker
+from src.utils.overlay import OverlayCache
+from src.utils.profiler import StageProfiler
+from src.utils.startup_profiler import startup_profiler
+from src.utils.timers import Timers
+from src.utils.utils import get_memory_usage_mb
 
 
 class VideoThread(QThread):
     """
     VideoThread class for handling video capture and gesture recognition.
-    This class is a singleton and is responsible for initializing the camera,
-    processing frames, and handling gestures.
+    Each instance is the session of one camera: it initializes the camera,
+    processes frames, and handles gestures with its own recognizer and drawing.
     """
     ImageUpdate = Signal(QImage)
     StatusUpdate = Signal()  # New signal for updating status bar
-    _instance = None
+    CaptureFailed = Signal(str)  # Capture stopped because the camera could not be reopened
 
     # Color constants
     BLUE = (255, 0, 0)
@@ -29,140 +43,188 @@ class VideoThread(QThread):
     WHITE = (255, 255, 255)
     YELLOW = (0, 255, 255)
 
-    def __new__(cls, *args, **kwargs):
-        if cls._instance is None:
-            cls._instance = super(VideoThread, cls).__new__(cls, *args, **kwargs)
-        return cls._instance
+    # HUD layout constants
+    PROGRESS_BAR_WIDTH = 300
+    PROGRESS_BAR_HEIGHT = 20
 
-    def __init__(self):
+    def __init__(self, camera_index: int = 0):
+        super().__init__()
         self.fps = 0
-        if not hasattr(self, 'initialized'):
-            super().__init__()
-            self.resolution = (640, 480)
-            self.is_changing_settings = False
-            self.fps_cap = 30
-            self.camera_index = 0
-            self.ThreadActive = False
-            self.cap = None
-            self.initialized = True
-
-            # FPS calculation variables
-            self.prev_frame_time = 0
-            self.curr_frame_time = 0
-            self.dev_mode = False
+        self.resolution = (640, 480)
+        self.is_changing_settings = False
+        # Settings changed while capturing, applied by the run loop
+        self.settings_lock = threading.Lock()
+        self.pending_settings = {}
+        self.fps_cap = 30
+        self.camera_index = camera_index
+        self.ThreadActive = False
+        # Optional FrameSource used instead of the camera (video file, images, synthetic)
+        self.frame_source = None
+        self.source = None
+        # Optional CameraProber, lets the camera use the fastest mode it really delivers
+        self.camera_prober = None
+        # Threads decoding MJPG outside the capture thread (0 = OpenCV decodes in read())
+        # and the 1/n size the JPEG is decoded at
+        self.mjpeg_decode_workers = 0
+        self.decode_reduction = 1
+        # Optional InferencePool shared with the sessions of other cameras, instead of an own recognizer
+        self.inference_pool = None
+        self.pool_session = None
+        # Optional InferenceProcess recognizing the frames outside this process, takes precedence over the pool
+        self.inference_process = None
+
+        # Optional path of a session log recording every frame's gesture result
+        self.record_session_path = None
+        self.session_recorder = None
+
+        # FPS calculation variables
+        self.prev_frame_time = 0
+        self.curr_frame_time = 0
+
+        self.smoothed_fps = 0
+        self.skip_frames = 0
+        self.failed_reads = 0
+
+        # Glass-to-glass and fingertip-to-ink measurement mode
+        self.latency = LatencyTracker(enabled=False)
+
+        # Per-stage timings, collected only in dev mode
+        self.profiler = StageProfiler(enabled=False)
+        self.dev_mode = False
+
+        # Drawing-related variables
+        self.drawing_board = None
+        self.window_height = None
+        self.window_width = None
+        self.previous_x, self.previous_y = None, None
+        self.signature_points = []
+        self.strokes = []
+        # Signature points added by each stroke, and the strokes taken back by undo as (stroke, points)
+        self.stroke_point_counts = []
+        self.undone_strokes = []
+        self.min_signature_points = 200
+        self.is_drawing_active = False
 
-            # Drawing-related variables
-            self.drawing_board = None
-            self.window_height = None
-            self.window_width = None
-            self.previous_x, self.previous_y = None, None
-            self.signature_points = []
-            self.min_signature_points = 200
-            self.is_drawing_active = False
+        # Smooths the fingertip positions that are drawn and decimates finished strokes for storage
+        self.stroke_filter = StrokeFilter()
+        # Draws the ink incrementally, ink_bounds is the box of the board holding ink (None if empty)
+        self.ink = InkRasterizer()
+        self.ink_bounds = None
 
-            # Status bar variables
-            self.current_finger_position = (0, 0)  # Initialize finger position
+        # Status bar variables
+        self.current_finger_position = (0, 0)  # Initialize finger position
 
-            # Variables for tracking Thumb_Up gesture
-            self.thumb_up_start_time = None
-            self.thumb_up_duration = 3.0
-            self.save_cooldown = 0
+        # Gesture and message timeouts on a monotonic clock, replaced by the video time for offline processing
+        self.timers = Timers()
 
-            # Variables for saved message display time
-            self.saved_message_time = None
-            self.saved_message_duration = 2.0
-            self.signature_too_small = False
+        # Stable gesture with hysteresis, updated by handle_gestures on every result
+        self.gesture_state = GestureStateMachine()
 
-            # Distance validation variables
-            self.min_distance = 90  # Closer than this is too close (negative z is closer)
-            self.max_distance = 99.5  # Further than this is too far (positive z is further)
-            self.distance_warning = None
-            self.distance_warning_time = None
-            self.distance_warning_duration = 2.0
+        # Thumb_Up has to be held this long to save, and cannot start again right after a save
+        self.thumb_up_duration = 3.0
+        self.save_cooldown_duration = 1.0
 
-    def get_instance(self):
-        return self._instance
+        # Where signatures are saved, optionally with a JSON file of their strokes
+        self.signatures_dir = "../signatures"
+        self.export_strokes = False
+        self.saved_signatures = []
 
-    def change_settings(self, camera_index: int = None, fps_cap: int = None, resolution: tuple[int, int] = None):
-        # Store the current running state before stopping
-        was_running = self.ThreadActive
-        self.stop()
-        self.is_changing_settings = True
-
-        if camera_index is not None:
-            self.camera_index = camera_index
-        if fps_cap is not None:
-            self.fps_cap = fps_cap
-        if resolution is not None:
-            self.resolution = resolution
-
-        # Only restart if it was running before
-        if was_running:
-            self.start_th()
+        # How long the saved message is shown
+        self.saved_message_duration = 2.0
+        self.signature_too_small = False
 
-        self.is_changing_settings = False
+        # Distance validation variables
+        self.min_distance = 90  # Closer than this is too close (negative z is closer)
+        self.max_distance = 99.5  # Further than this is too far (positive z is further)
+        self.distance_warning = None
+        self.distance_warning_duration = 2.0
 
-    def run_camera_setting(self):
-        self.cap.set(cv2.CAP_PROP_SETTINGS, 1)
+        # Cache of pre-rendered HUD sprites
+        self.overlay = OverlayCache()
 
-    def camera_init(self):
-        """Initialize the camera with the specified settings in a cross-platform way"""
-        try:
-            print(f"[INFO] Initializing camera {self.camera_index}")
+    def set_tracer(self, tracer):
+        """Attach a ChromeTracer that receives every pipeline stage as a span"""
+        self.profiler.tracer = tracer
 
-            # Choose backend depending on OS
-            system_platform = platform.system()
-            if system_platform == "Windows":
-                self.cap = cv2.VideoCapture(self.camera_index, cv2.CAP_DSHOW)
-                print("[INFO] Using backend: CAP_DSHOW (Windows)")
-            else:
-                self.cap = cv2.VideoCapture(self.camera_index)  # Default backend for Linux/macOS
-                print("[INFO] Using default backend (non-Windows)")
+    @property
+    def dev_mode(self):
+        return self._dev_mode
 
-            # Retry logic
-            if not self.cap.isOpened():
-                print(f"[WARNING] Failed to open camera {self.camera_index}. Trying default index 0.")
-                self.cap.release()
-                self.cap = cv2.VideoCapture(0)
+    @dev_mode.setter
+    def dev_mode(self, value):
+        # Stage timing is only collected while dev mode is on
+        self._dev_mode = value
+        self.profiler.enabled = value
+        if not value:
+            self.profiler.reset()
 
-            if not self.cap.isOpened():
-                print("[ERROR] Failed to open any camera")
-                return False
-
-            print("[INFO] Camera opened successfully")
-
-            # Set camera properties
-            self.cap.set(cv2.CAP_PROP_FPS, self.fps_cap)
-            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.resolution[0])
-            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.resolution[1])
-
-            # Check if MJPG is supported
-            print("[INFO] Checking supported codecs...")
+    def change_settings(self, camera_index: int = None, fps_cap: int = None, resolution: tuple[int, int] = None):
+        """
+        Change capture settings. While capturing, the run loop applies them between two frames
+        (see apply_settings) so the recognizer and the drawing are kept.
+        """
+        with self.settings_lock:
+            if camera_index is not None:
+                self.camera_index = camera_index
+            if fps_cap is not None:
+                self.fps_cap = fps_cap
+            if resolution is not None:
+                self.resolution = resolution
+
+            if self.ThreadActive:
+                self.is_changing_settings = True
+                self.pending_settings.update(
+                    {name: value for name, value in
+                     (("camera_index", camera_index), ("fps_cap", fps_cap), ("resolution", resolution))
+                     if value is not None})
+
+    def apply_settings(self):
+        """Apply settings requested with change_settings, called from the run loop"""
+        with self.settings_lock:
+            changed, self.pending_settings = self.pending_settings, {}
+
+        if changed and self.frame_source is None:
+            if "camera_index" in changed or not self.source.configure(self.fps_cap, self.resolution):
+                # Another device has to be opened, the old one is released first
+                self.source.release()
+                self.source = self.create_frame_source()
+                if not self.source.open():
+                    print("[ERROR] Cannot open the camera with the new settings")
+                    self.ThreadActive = False
+                    self.is_changing_settings = False
+                    self.CaptureFailed.emit(f"Cannot open camera {self.camera_index} with the new settings, "
+                                            f"capture stopped")
+                    return False
+            if self.source.frame_size != (self.window_width, self.window_height):
+                self.resize_drawing_board(*self.source.frame_size)
+
+        # Frame skipping follows the FPS setting
+        self.skip_frames = max(0, int(self.fps_cap / 30) - 1)
+        self.is_changing_settings = False
+        print(f"[INFO] Applied settings: {changed}")
+        return True
 
-            available_codecs = self.check_supported_codecs()
+    def run_camera_setting(self):
+        self.source.show_settings()
 
-            if "MJPG" in available_codecs:
-                print("[INFO] MJPG codec is supported, setting MJPG codec.")
-                fourcc = cv2.VideoWriter_fourcc(*"MJPG")
-                self.cap.set(cv2.CAP_PROP_FOURCC, fourcc)
-            else:
-                print("[WARNING] MJPG not supported, trying YUYV codec.")
-                if "YUYV" in available_codecs:
-                    fourcc = cv2.VideoWriter_fourcc(*"YUYV")
-                    self.cap.set(cv2.CAP_PROP_FOURCC, fourcc)
-                else:
-                    print("[ERROR] Neither MJPG nor YUYV codecs are supported. Using default settings.")
+    def create_frame_source(self):
+        """Return the configured frame source, a live camera by default"""
+        if self.frame_source is not None:
+            return self.frame_source
+        if self.mjpeg_decode_workers > 0:
+            return MjpegCameraSource(self.camera_index, self.fps_cap, self.resolution,
+                                     decode_workers=self.mjpeg_decode_workers, reduction=self.decode_reduction)
+        return CameraSource(self.camera_index, self.fps_cap, self.resolution, prober=self.camera_prober)
 
-            # Check if the codec was actually applied
-            actual_fourcc = int(self.cap.get(cv2.CAP_PROP_FOURCC))
-            codec = "".join([chr((actual_fourcc >> 8 * i) & 0xFF) for i in range(4)])
-            print(f"[INFO] Camera FOURCC codec in use: {codec}")
+    def camera_init(self):
+        """Open the frame source and allocate a drawing board of the same size"""
+        try:
+            self.source = self.create_frame_source()
+            if not self.source.open():
+                return False
 
             # Initialize drawing board
-            self.window_width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-            self.window_height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-            self.drawing_board = np.zeros((self.window_height, self.window_width, 3), dtype=np.uint8)
-            print(f"[INFO] Drawing board initialized with size {self.window_width}x{self.window_height}")
+            self.init_drawing_board(*self.source.frame_size)
 
             return True
 
@@ -170,59 +232,105 @@ class VideoThread(QThread):
             print(f"[ERROR] Exception in camera_init: {str(e)}")
             return False
 
-    def check_supported_codecs(self):
-        """
-        Check for the available codecs supported by OpenCV based on the current platform.
-        Returns a list of supported codec names (as strings).
-        """
-        supported_codecs = []
-
-        # Try MJPG, YUYV and others
-        try:
-            mjpg_fourcc = cv2.VideoWriter_fourcc(*"MJPG")
-            if mjpg_fourcc != 0:
-                supported_codecs.append("MJPG")
-        except Exception as e:
-            print(f"[INFO] MJPG codec check failed: {e}")
-
-        try:
-            yuyv_fourcc = cv2.VideoWriter_fourcc(*"YUYV")
-            if yuyv_fourcc != 0:
-                supported_codecs.append("YUYV")
-        except Exception as e:
-            print(f"[INFO] YUYV codec check failed: {e}")
-
-        # Add more codecs to check here if needed
-        # Example for H264
-        try:
-            h264_fourcc = cv2.VideoWriter_fourcc(*"H264")
-            if h264_fourcc != 0:
-                supported_codecs.append("H264")
-        except Exception as e:
-            print(f"[INFO] H264 codec check failed: {e}")
-
-        print(f"[INFO] Available codecs: {supported_codecs}")
-        return supported_codecs
+    def init_drawing_board(self, width, height):
+        """Allocate an empty drawing board matching the frame size"""
+        self.window_width = width
+        self.window_height = height
+        self.drawing_board = np.zeros((self.window_height, self.window_width, 3), dtype=np.uint8)
+        print(f"[INFO] Drawing board initialized with size {self.window_width}x{self.window_height}")
+
+    def resize_drawing_board(self, width, height):
+        """Scale the drawing board and the stroke coordinates to a new frame size"""
+        if self.drawing_board is None:
+            self.init_drawing_board(width, height)
+            return
+        scale_x, scale_y = width / self.window_width, height / self.window_height
+
+        def scale(point):
+            return (int(point[0] * scale_x), int(point[1] * scale_y), *point[2:])
+
+        self.drawing_board = cv2.resize(self.drawing_board, (width, height), interpolation=cv2.INTER_NEAREST)
+        self.signature_points = [scale(point) for point in self.signature_points]
+        self.strokes = [[scale(point) for point in stroke] for stroke in self.strokes]
+        self.undone_strokes = [([scale(point) for point in stroke], [scale(point) for point in points])
+                               for stroke, points in self.undone_strokes]
+        self.stroke_filter.begin()
+        if self.ink.point is not None:
+            self.ink.point = scale(self.ink.point)
+        if self.ink_bounds is not None:
+            self.ink_bounds = (0, 0, width, height)
+        if self.previous_x is not None:
+            self.previous_x, self.previous_y = scale((self.previous_x, self.previous_y))
+        self.window_width, self.window_height = width, height
+        print(f"[INFO] Drawing board resized to {width}x{height}")
 
     def is_signature_valid(self):
         """Check if signature has enough points to be valid"""
         return len(self.signature_points) >= self.min_signature_points
 
     def clear_drawing_board(self):
-        """Clear the drawing board"""
-        if self.drawing_board is not None:
-            self.drawing_board = np.zeros((int(self.window_height), int(self.window_width), 3), dtype=np.uint8)
-            self.previous_x, self.previous_y = None, None
-            self.signature_points = []
-            # Reset finger position when clearing
-            self.current_finger_position = (0, 0)
-            # Emit signal to update status bar
+        """Clear the drawing board in place, only within the box holding ink"""
+        if self.drawing_board is None:
+            return
+        if self.ink_bounds is not None:
+            x0, y0, x1, y1 = self.ink_bounds
+            self.drawing_board[y0:y1, x0:x1] = 0
+        # The status bar only needs an update if there was something to clear
+        changed = bool(self.signature_points or self.strokes) or self.current_finger_position != (0, 0)
+        self.reset_strokes()
+        # Reset finger position when clearing
+        self.current_finger_position = (0, 0)
+        if changed:
             self.StatusUpdate.emit()
 
+    def reset_strokes(self):
+        """Forget the strokes of the current signature, without touching the board"""
+        self.previous_x, self.previous_y = None, None
+        self.signature_points = []
+        self.strokes = []
+        self.stroke_point_counts = []
+        self.undone_strokes = []
+        self.ink_bounds = None
+
+    def undo_stroke(self):
+        """Remove the last stroke, drawing again only the region of the board it covered"""
+        if not self.strokes or self.drawing_board is None:
+            return False
+        # A stroke being drawn ends here, the next fingertip starts a new one
+        self.previous_x, self.previous_y = None, None
+        self.finish_stroke()
+        stroke = self.strokes.pop()
+        count = self.stroke_point_counts.pop()
+        points = self.signature_points[len(self.signature_points) - count:]
+        del self.signature_points[len(self.signature_points) - count:]
+        self.undone_strokes.append((stroke, points))
+
+        bounds = stroke_bounds(stroke, self.drawing_board.shape)
+        if bounds is not None:
+            redraw_region(self.drawing_board, self.strokes, bounds, self.GREEN)
+        if not self.strokes:
+            self.ink_bounds = None
+        self.StatusUpdate.emit()
+        return True
+
+    def redo_stroke(self):
+        """Bring back the last stroke removed by undo_stroke"""
+        if not self.undone_strokes or self.drawing_board is None:
+            return False
+        self.previous_x, self.previous_y = None, None
+        self.finish_stroke()
+        stroke, points = self.undone_strokes.pop()
+        self.strokes.append(stroke)
+        self.stroke_point_counts.append(len(points))
+        self.signature_points.extend(points)
+        self.ink_bounds = union_bounds(self.ink_bounds, draw_stroke(self.drawing_board, stroke, self.GREEN))
+        self.StatusUpdate.emit()
+        return True
+
     def save_signature(self):
         """Save the signature to a file"""
-        if not os.path.exists("../signatures"):
-            os.makedirs("../signatures")
+        if not os.path.exists(self.signatures_dir):
+            os.makedirs(self.signatures_dir)
 
         gray = cv2.cvtColor(self.drawing_board, cv2.COLOR_BGR2GRAY)
         _, mask = cv2.threshold(gray, 10, 255, cv2.THRESH_BINARY)
@@ -232,15 +340,39 @@ class VideoThread(QThread):
         transparent_signature[:, :, 3] = mask
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"../signatures/signature_{timestamp}.png"
+        filename = f"{self.signatures_dir}/signature_{timestamp}.png"
+        # Offline processing can save several signatures within the same second
+        suffix = 1
+        while os.path.exists(filename):
+            filename = f"{self.signatures_dir}/signature_{timestamp}_{suffix}.png"
+            suffix += 1
 
         cv2.imwrite(filename, transparent_signature)
+        if self.export_strokes:
+            self.save_strokes(os.path.splitext(filename)[0] + ".json")
 
         print(f"Signature saved to {filename}")
-        self.saved_message_time = time.time()
+        self.saved_signatures.append(filename)
+        self.timers.start("saved_message", self.saved_message_duration)
         self.clear_drawing_board()
         return filename
 
+    def finish_stroke(self):
+        """Decimate the last stroke once no more points are added to it"""
+        if self.strokes:
+            self.strokes[-1] = self.stroke_filter.decimate(self.strokes[-1])
+
+    def save_strokes(self, filename):
+        """Save the strokes of the current signature as JSON lists of [x, y, width] points"""
+        self.finish_stroke()
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump({
+                "width": self.window_width,
+                "height": self.window_height,
+                "strokes": [[list(point) for point in stroke] for stroke in self.strokes],
+            }, f)
+        return filename
+
     def check_distance(self, hand_landmarks):
         """Check if the hand is at an appropriate distance from the camera"""
         if hand_landmarks:
@@ -248,11 +380,11 @@ class VideoThread(QThread):
             index_finger_z = (1 - np.abs(hand_landmarks[0][8].z)) * 100
             if index_finger_z < self.min_distance:
                 self.distance_warning = "Too close to camera! Please move back."
-                self.distance_warning_time = time.time()
+                self.timers.start("distance_warning", self.distance_warning_duration)
                 return False
             elif index_finger_z > self.max_distance:
                 self.distance_warning = "Too far from camera! Please move closer."
-                self.distance_warning_time = time.time()
+                self.timers.start("distance_warning", self.distance_warning_duration)
                 return False
             else:
                 return True
@@ -285,176 +417,141 @@ class VideoThread(QThread):
 
             # Draw gesture information if gestures are detected
             if gesture_result.gestures:
-                gesture_name = gesture_result.gestures[0][0].category_name
-
-                # Display saving progress bar when Thumb_Up is detected
-                if gesture_name == "Thumb_Up" and self.thumb_up_start_time is not None:
-                    elapsed_time = time.time() - self.thumb_up_start_time
-                    if elapsed_time < self.thumb_up_duration:
-                        # Check if signature has enough points
-                        if self.is_signature_valid():
-                            progress = int((elapsed_time / self.thumb_up_duration) * 100)
-
-                            # Calculate positions for centered progress bar
-                            progress_bar_width = 300
-                            progress_bar_height = 20
-                            start_x = int((self.window_width - progress_bar_width) / 2)
-                            end_x = start_x + progress_bar_width
-                            bottom_y = int(self.window_height - 50)  # 50 pixels from bottom
-
-                            # Draw the progress bar background
-                            cv2.rectangle(frame, (start_x, bottom_y), (end_x, bottom_y + progress_bar_height),
-                                          self.WHITE, 2)
-
-                            # Draw the filled progress
-                            progress_width = int((progress / 100) * progress_bar_width)
-                            cv2.rectangle(frame, (start_x, bottom_y),
-                                          (start_x + progress_width, bottom_y + progress_bar_height),
-                                          self.YELLOW, -1)
-
-                            # Display saving percentage text
-                            text = f"Saving {progress}%"
-                            text_size = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 2)[0]
-                            text_x = int((self.window_width - text_size[0]) / 2)
-                            text_y = bottom_y - 10
-                            cv2.putText(frame, text, (text_x, text_y), cv2.FONT_HERSHEY_SIMPLEX, 0.6, self.WHITE, 2)
-                        else:
-                            # Display not enough points message
-                            text = f"Not enough points! Need {self.min_signature_points - len(self.signature_points)} more"
-                            text_size = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, 0.7, 2)[0]
-                            text_x = int((self.window_width - text_size[0]) / 2)
-                            text_y = int(self.window_height - 80)
-                            cv2.putText(frame, text, (text_x, text_y), cv2.FONT_HERSHEY_SIMPLEX, 0.7, self.YELLOW, 2)
+                # Display saving progress bar while Thumb_Up is held
+                if self.gesture_state.gesture == THUMB_UP and self.timers.active("thumb_up"):
+                    # Check if signature has enough points
+                    if self.is_signature_valid():
+                        progress = int(self.timers.progress("thumb_up") * 100)
+                        bottom_y = self.draw_progress_bar(frame, progress, self.YELLOW)
+
+                        # Display saving percentage text
+                        self.overlay.draw_text_centered(frame, f"Saving {progress}%", bottom_y - 10,
+                                                        0.6, self.WHITE)
+                    else:
+                        # Display not enough points message
+                        text = f"Not enough points! Need {self.min_signature_points - len(self.signature_points)} more"
+                        self.overlay.draw_text_centered(frame, text, int(self.window_height - 80), 0.7, self.YELLOW)
 
         # Display signature progress bar at the bottom center when drawing is active
-        if self.is_drawing_active or (gesture_result and gesture_result.gestures and
-                                      gesture_result.gestures[0][0].category_name == "Pointing_Up"):
+        if self.is_drawing_active or self.gesture_state.gesture == POINTING_UP:
             progress = min(100, int((len(self.signature_points) / self.min_signature_points) * 100))
-            progress_bar_width = 300
-            progress_bar_height = 20
-
-            # Calculate positions for centered progress bar
-            start_x = int((self.window_width - progress_bar_width) / 2)
-            end_x = start_x + progress_bar_width
-            bottom_y = int(self.window_height - 50)  # 50 pixels from bottom
-
-            # Draw the progress bar background
-            cv2.rectangle(frame, (start_x, bottom_y), (end_x, bottom_y + progress_bar_height), self.WHITE, 2)
-
-            # Draw the filled progress
-            progress_width = int((progress / 100) * progress_bar_width)
-            cv2.rectangle(frame, (start_x, bottom_y), (start_x + progress_width, bottom_y + progress_bar_height),
-                          self.GREEN if progress >= 100 else self.BLUE, -1)
+            bottom_y = self.draw_progress_bar(frame, progress, self.GREEN if progress >= 100 else self.BLUE)
 
             # Display percentage text
             text = f"{progress}% / {self.min_signature_points} points"
-            text_size = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 2)[0]
-            text_x = int((self.window_width - text_size[0]) / 2)
-            text_y = bottom_y - 10
-            cv2.putText(frame, text, (text_x, text_y), cv2.FONT_HERSHEY_SIMPLEX, 0.6, self.WHITE, 2)
+            self.overlay.draw_text_centered(frame, text, bottom_y - 10, 0.6, self.WHITE)
 
         # Display "Signature Saved!" message for 2 seconds after saving
-        if self.saved_message_time is not None:
-            elapsed_time = time.time() - self.saved_message_time
-            if elapsed_time < self.saved_message_duration:
-                # Calculate positions for centered message
-                text = "Signature Saved!"
-                text_size = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, 1, 2)[0]
-                text_x = int((self.window_width - text_size[0]) / 2)
-                text_y = int(self.window_height / 2)
-
-                cv2.putText(frame, text, (text_x, text_y), cv2.FONT_HERSHEY_SIMPLEX, 1, self.GREEN, 2)
-            else:
-                self.saved_message_time = None
+        if self.timers.active("saved_message"):
+            self.overlay.draw_text_centered(frame, "Signature Saved!", int(self.window_height / 2), 1, self.GREEN)
 
         # Display distance warning if active
-        if self.distance_warning_time is not None:
-            elapsed_time = time.time() - self.distance_warning_time
-            if elapsed_time < self.distance_warning_duration and self.distance_warning:
-                # Calculate positions for centered message
-                text_size = cv2.getTextSize(self.distance_warning, cv2.FONT_HERSHEY_SIMPLEX, 0.8, 2)[0]
-                text_x = int((self.window_width - text_size[0]) / 2)
-                text_y = int(self.window_height / 4)  # Position in the upper part of the screen
-
-                # Draw background rectangle
-                padding = 10
-                cv2.rectangle(frame,
-                              (text_x - padding, text_y - text_size[1] - padding),
-                              (text_x + text_size[0] + padding, text_y + padding),
-                              (0, 0, 0), -1)
-
-                # Draw text
-                cv2.putText(frame, self.distance_warning, (text_x, text_y),
-                            cv2.FONT_HERSHEY_SIMPLEX, 0.8, self.YELLOW, 2)
-            else:
-                self.distance_warning_time = None
-                self.distance_warning = None
+        if self.timers.active("distance_warning") and self.distance_warning:
+            # Position in the upper part of the screen, on a black background
+            self.overlay.draw_text_centered(frame, self.distance_warning, int(self.window_height / 4), 0.8,
+                                            self.YELLOW, background=(0, 0, 0), padding=10)
 
         return frame
 
+    def draw_progress_bar(self, frame, progress, fill_color):
+        """Draw a centered progress bar near the bottom of the frame and return its top y coordinate"""
+        start_x = int((self.window_width - self.PROGRESS_BAR_WIDTH) / 2)
+        bottom_y = int(self.window_height - 50)  # 50 pixels from bottom
+        self.overlay.draw_progress_bar(frame, (start_x, bottom_y), self.PROGRESS_BAR_WIDTH,
+                                       self.PROGRESS_BAR_HEIGHT, progress, fill_color, self.WHITE)
+        return bottom_y
+
     def handle_gestures(self, frame, gesture_result):
         """Handle different gestures and their drawing functions"""
         self.is_drawing_active = False
+        gesture = self.gesture_state.update(*observe_gesture(gesture_result), self.timers.now())
 
-        if gesture_result and gesture_result.gestures:
-            gesture_name = gesture_result.gestures[0][0].category_name
-
-            # Check if the hand is at a valid distance before processing gestures
-            is_distance_valid = self.check_distance(gesture_result.hand_landmarks)
-            if (gesture_name == "Pointing_Up" or self.sign_model.is_pointing_up()) and is_distance_valid:
-                self.is_drawing_active = True
-                self.thumb_up_start_time = None
-
-                index_finger = gesture_result.hand_landmarks[0][8]
-                x, y = int(index_finger.x * frame.shape[1]), int(index_finger.y * frame.shape[0])
-
-                # Update current finger position for status bar
-                self.current_finger_position = (x, y)
-                # Emit signal to update status bar
-                self.StatusUpdate.emit()
+        if not gesture_result or not gesture_result.hand_landmarks:
+            # A gesture held through frames without a hand keeps its stroke and save timer
+            if gesture == NONE:
+                self.previous_x, self.previous_y = None, None
+                self.timers.cancel("thumb_up")
+            return frame
+
+        # Check if the hand is at a valid distance before processing gestures
+        is_distance_valid = self.check_distance(gesture_result.hand_landmarks)
+        if gesture == POINTING_UP and self.gesture_state.holding:
+            # The stroke continues once the finger is recognized again, this frame adds no ink
+            pass
+        elif gesture == POINTING_UP and is_distance_valid:
+            self.is_drawing_active = True
+            self.timers.cancel("thumb_up")
+
+            index_finger = gesture_result.hand_landmarks[0][8]
+            x, y = int(index_finger.x * frame.shape[1]), int(index_finger.y * frame.shape[0])
+            # The board gets the filtered fingertip, without the jitter of the landmarks
+            now = self.timers.now()
+            if self.previous_x is None:
+                self.stroke_filter.begin()
+                self.ink.begin()
+            x, y = self.stroke_filter.smooth(x, y, now)
+
+            # Update current finger position for status bar
+            self.current_finger_position = (x, y)
+            # Emit signal to update status bar
+            self.StatusUpdate.emit()
 
-                if self.previous_x is not None and self.previous_y is not None:
-                    cv2.line(self.drawing_board, (self.previous_x, self.previous_y), (x, y), self.GREEN, 5)
-                    # Add points for signature size validation
-                    self.signature_points.append((x, y))
+            width, bounds = self.ink.add(self.drawing_board, (x, y), now, self.GREEN)
+            self.ink_bounds = union_bounds(self.ink_bounds, bounds)
+            if self.previous_x is not None and self.previous_y is not None:
+                self.latency.ink_drawn(self.sign_model.result_timestamp_ms)
+                # Add points for signature size validation
+                self.signature_points.append((x, y))
+                self.strokes[-1].append((x, y, width))
+                self.stroke_point_counts[-1] += 1
+            else:
+                # A new stroke starts where the finger is first seen, the previous one is complete
+                self.finish_stroke()
+                self.strokes.append([(x, y, width)])
+                self.stroke_point_counts.append(0)
+                # New ink replaces the strokes that could be redone
+                self.undone_strokes = []
 
-                # Draw the current finger position
-                cv2.circle(frame, (x, y), 5, self.BLUE, -1)
+            # Draw the current finger position
+            cv2.circle(frame, (x, y), 5, self.BLUE, -1)
 
-                # Update previous coordinates
-                self.previous_x, self.previous_y = x, y
+            # Update previous coordinates
+            self.previous_x, self.previous_y = x, y
 
-            elif gesture_name == "Thumb_Up" and is_distance_valid:
-                self.previous_x, self.previous_y = None, None
+        elif gesture == THUMB_UP and is_distance_valid:
+            self.previous_x, self.previous_y = None, None
 
-                if self.thumb_up_start_time is None and self.save_cooldown <= 0:
-                    self.thumb_up_start_time = time.time()
-                elif self.thumb_up_start_time is not None:
-                    elapsed_time = time.time() - self.thumb_up_start_time
-                    if (elapsed_time >= self.thumb_up_duration and not self.saved_message_time
-                            and self.is_signature_valid()):
-                        filename = self.save_signature()
-                        self.thumb_up_start_time = None
-                        self.save_cooldown = 30
-
-            elif gesture_name == "Thumb_Down":
+            if not self.timers.started("thumb_up") and not self.timers.active("save_cooldown"):
+                self.timers.start("thumb_up", self.thumb_up_duration)
+            elif (self.timers.expired("thumb_up") and not self.timers.active("saved_message")
+                  and self.is_signature_valid()):
+                filename = self.save_signature()
+                self.timers.cancel("thumb_up")
+                self.timers.start("save_cooldown", self.save_cooldown_duration)
+
+        elif gesture == THUMB_DOWN:
+            # The board is cleared once per Thumb_Down gesture, however long it is held
+            if self.gesture_state.entered:
                 self.clear_drawing_board()
-                self.thumb_up_start_time = None
+            self.timers.cancel("thumb_up")
+
+        elif gesture == VICTORY:
+            # One stroke is undone per Victory gesture, however long it is held
+            self.previous_x, self.previous_y = None, None
+            self.timers.cancel("thumb_up")
+            if self.gesture_state.entered:
+                self.undo_stroke()
 
-            else:
-                # Stop drawing for other gestures
-                self.previous_x, self.previous_y = None, None
-                self.thumb_up_start_time = None
-
-                # Update finger position if still tracking landmarks
-                if gesture_result.hand_landmarks:
-                    index_finger = gesture_result.hand_landmarks[0][8]
-                    x, y = int(index_finger.x * frame.shape[1]), int(index_finger.y * frame.shape[0])
-                    self.current_finger_position = (x, y)
-                    self.StatusUpdate.emit()
         else:
-            # Reset timer if no gestures are detected
-            self.thumb_up_start_time = None
+            # Stop drawing for other gestures
+            self.previous_x, self.previous_y = None, None
+            self.timers.cancel("thumb_up")
+
+            # Update finger position while still tracking landmarks
+            index_finger = gesture_result.hand_landmarks[0][8]
+            x, y = int(index_finger.x * frame.shape[1]), int(index_finger.y * frame.shape[0])
+            self.current_finger_position = (x, y)
+            self.StatusUpdate.emit()
 
         return frame
 
@@ -463,90 +560,191 @@ class VideoThread(QThread):
         self.curr_frame_time = cv2.getTickCount() / cv2.getTickFrequency()
         self.fps = 1 / (self.curr_frame_time - self.prev_frame_time) if self.prev_frame_time > 0 else 0
         self.prev_frame_time = self.curr_frame_time
-        cv2.putText(frame, f"FPS: {self.fps:.0f}", (10, 30), cv2.FONT_HERSHEY_SIMPLEX,
+        # Exponential moving average smooths out single-frame jitter
+        if self.smoothed_fps == 0:
+            self.smoothed_fps = self.fps
+        else:
+            self.smoothed_fps = 0.9 * self.smoothed_fps + 0.1 * self.fps
+        cv2.putText(frame, f"FPS: {self.smoothed_fps:.0f}", (10, 30), cv2.FONT_HERSHEY_SIMPLEX,
                     1, (0, 255, 0), 2, cv2.LINE_AA)
         return frame
 
-    def run(self):
-        # Initialize the camera
-        self.camera_init()
-
-        # Signature Recognition
-        self.sign_model = SignatureRecognition()
+    def performance_stats(self):
+        """Collect the numbers shown by the dev-mode performance panel"""
+        sign_model = getattr(self, 'sign_model', None)
+        return {
+            "fps": self.smoothed_fps,
+            "stages": self.profiler.snapshot(),
+            "skip_ratio": self.skip_frames / (self.skip_frames + 1),
+            "dropped_frames": self.failed_reads + (sign_model.dropped_frames if sign_model else 0),
+            "memory_mb": get_memory_usage_mb(),
+            "latency": self.latency.report() if self.latency.enabled else {},
+            "pool": self.pool_session.stats() if self.pool_session is not None else {},
+        }
+
+    def prepare_processing(self):
+        """Reset per-run state before frames are fed to process_frame"""
+        self.sign_model.profiler = self.profiler
+        self.gesture_state.reset()
+        self.timers.reset()
 
         # Initialize time for FPS calculation
         if self.dev_mode:
             self.prev_frame_time = 0
+        self.smoothed_fps = 0
+        self.failed_reads = 0
 
         # Initialize timestamp for MediaPipe
         self.timestamp_ms = 0
 
         # Initialize frame counter for frame skipping
-        frame_counter = 0
+        self.frame_counter = 0
 
         # Store the latest gesture result to use between processed frames
-        last_gesture_result = None
+        self.last_gesture_result = None
 
         # Calculate frame skip based on fps_cap
         # If fps_cap is 30, skip_frames will be 0 (process all frames)
         # If fps_cap is 60, skip_frames will be 1 (process every other frame)
-        skip_frames = max(0, int(self.fps_cap / 30) - 1)
-
-        with self.sign_model.recognizer_context_manager() as recognizer:
-            while self.ThreadActive:
-                ret, frame = self.cap.read()
-
-                if ret:
-                    # Flip frame for better user experience
-                    frame = cv2.flip(frame, 1)
-
-                    # Process frame with MediaPipe only if not skipping this frame
-                    process_this_frame = (frame_counter % (skip_frames + 1) == 0)
-
-                    if process_this_frame:
-                        # Process frame with MediaPipe
-                        mp_image = self.sign_model.convert_frame_to_mediapipe_image(frame)
-                        recognizer.recognize_async(mp_image, self.timestamp_ms)
-                        self.timestamp_ms += 1
-
-                        # Get gesture recognition results and update the last result
-                        last_gesture_result = self.sign_model.get_result()
-
-                    # This ensures wireframe isn't flickering between processed frames
-                    gesture_result = last_gesture_result
-
-                    # Handle gesture recognition and drawing for every frame
-                    if gesture_result:
-                        frame = self.show_wireframe(frame, gesture_result)
-                        frame = self.handle_gestures(frame, gesture_result)
+        self.skip_frames = max(0, int(self.fps_cap / 30) - 1)
 
-                    # Show FPS if dev mode is enabled
-                    if self.dev_mode:
-                        frame = self.show_fps(frame)
+    def process_frame(self, frame, recognizer, capture_time):
+        """
+        Run one captured frame through recognition, gestures, drawing and compositing.
+        Returns the QImage to display.
+        """
+        profiler = self.profiler
+        latency = self.latency
+
+        # Flip frame for better user experience
+        with profiler.stage("flip"):
+            frame = cv2.flip(frame, 1)
+
+        # Process frame with MediaPipe only if not skipping this frame
+        process_this_frame = (self.frame_counter % (self.skip_frames + 1) == 0)
+
+        if process_this_frame:
+            # Process frame with MediaPipe
+            with profiler.stage("convert"):
+                # An inference process takes the BGR frame and converts it itself
+                convert = getattr(recognizer, "convert_frame", self.sign_model.convert_frame_to_mediapipe_image)
+                mp_image = convert(frame)
+            with profiler.stage("submit"):
+                self.sign_model.mark_submitted(self.timestamp_ms)
+                latency.frame_submitted(self.timestamp_ms, capture_time)
+                recognizer.recognize_async(mp_image, self.timestamp_ms)
+            self.timestamp_ms += 1
+
+            # Get gesture recognition results and update the last result
+            self.last_gesture_result = self.sign_model.get_result()
+
+        # This ensures wireframe isn't flickering between processed frames
+        gesture_result = self.last_gesture_result
+        if self.session_recorder is not None:
+            self.session_recorder.record(capture_time, gesture_result, self.sign_model.result_timestamp_ms)
+
+        # Handle gesture recognition and drawing for every frame
+        if gesture_result:
+            with profiler.stage("wireframe"):
+                frame = self.show_wireframe(frame, gesture_result)
+            with profiler.stage("gestures"):
+                frame = self.handle_gestures(frame, gesture_result)
 
-                    # Combine drawing board with camera frame
-                    frame = cv2.addWeighted(frame, 1, self.drawing_board, 1, 0)
+        # Show FPS if dev mode is enabled
+        if self.dev_mode:
+            frame = self.show_fps(frame)
+
+        # Combine drawing board with camera frame, only where there is ink
+        with profiler.stage("composite"):
+            if self.ink_bounds is not None:
+                x0, y0, x1, y1 = self.ink_bounds
+                frame[y0:y1, x0:x1] = cv2.add(frame[y0:y1, x0:x1], self.drawing_board[y0:y1, x0:x1])
+
+        # Convert to QImage
+        with profiler.stage("qt_convert"):
+            image = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            qt_image = QImage(image.data, image.shape[1], image.shape[0], QImage.Format_RGB888)
+            pic = latency.tag_image(qt_image.scaled(640, 480, Qt.KeepAspectRatio), capture_time)
+
+        # Increment frame counter
+        self.frame_counter += 1
+
+        if self.frame_counter > 1000000:
+            self.frame_counter = 0
+
+        return pic
+
+    def open_recognizer(self):
+        """Recognizer context of a capture run: the inference process, the shared pool or an own recognizer"""
+        if self.inference_process is not None:
+            try:
+                return self.inference_process.session(self.sign_model.set_gesture_result)
+            except Exception as e:
+                print(f"[ERROR] {e}, recognizing gestures in this process")
+        if self.inference_pool is not None:
+            self.pool_session = self.inference_pool.session(self.sign_model.set_gesture_result,
+                                                            f"camera {self.camera_index}")
+            return self.pool_session
+        return self.sign_model.recognizer_context_manager()
 
-                    # Decrease cooldown counter
-                    if self.save_cooldown > 0:
-                        self.save_cooldown -= 1
+    def run(self):
+        # Initialize the camera
+        if not self.camera_init():
+            if self.source is not None:
+                self.source.release()
+            self.ImageUpdate.emit(QImage())
+            return
 
-                    # Convert to QImage and emit signal
-                    image = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    qt_image = QImage(image.data, image.shape[1], image.shape[0], QImage.Format_RGB888)
-                    pic = qt_image.scaled(640, 480, Qt.KeepAspectRatio)
-                    self.ImageUpdate.emit(pic)
+        # Signature Recognition
+        self.sign_model = SignatureRecognition()
+        self.prepare_processing()
+        if self.record_session_path:
+            self.session_recorder = SessionRecorder(self.record_session_path, self.window_width, self.window_height)
 
-                    # Increment frame counter
-                    frame_counter += 1
+        profiler = self.profiler
+        if profiler.tracer is not None:
+            profiler.tracer.name_thread(f"VideoThread camera {self.camera_index}")
+        latency = self.latency
 
-                    if frame_counter > 1000000:
-                        frame_counter = 0
+        with self.open_recognizer() as recognizer:
+            while self.ThreadActive:
+                if self.pending_settings and not self.apply_settings():
+                    break
+                frame_start = time.perf_counter()
+                with profiler.stage("read"):
+                    ret, frame = self.source.read()
 
-        self.cap.release()
+                if ret:
+                    capture_time = latency.frame_read(self.source.timestamp_msec() if latency.enabled else 0)
+                    try:
+                        pic = self.process_frame(frame, recognizer, capture_time)
+                    except InferenceProcessDied as e:
+                        print(f"[ERROR] {e}")
+                        self.ThreadActive = False
+                        self.CaptureFailed.emit(f"{e}, capture of camera {self.camera_index} stopped")
+                        break
+
+                    # Emit the signal
+                    with profiler.stage("emit"):
+                        self.ImageUpdate.emit(pic)
+                    profiler.add("frame", frame_start, time.perf_counter())
+                    if self.frame_counter == 1:
+                        startup_profiler.mark("first frame emitted")
+                else:
+                    self.failed_reads += 1
+
+        self.source.release()
+        self.pool_session = None
+        if self.session_recorder is not None:
+            self.session_recorder.close()
+            self.session_recorder = None
+        if profiler.tracer is not None:
+            profiler.tracer.flush()
         self.ImageUpdate.emit(QImage())
 
     def start_th(self):
+        # run() opens the source with the current settings
+        self.pending_settings = {}
         self.ThreadActive = True
         self.start()
 
@@ -0,0 +1,11 @@
+import numpy as np
+
+from src.model.landmarks import LandmarkResult
+
+
+def gesture_result(gesture_id, x=0.5, y=0.5):
+    """Build a one-hand result with the index fingertip at (x, y) and a valid distance."""
+    landmarks = np.zeros((21, 3), dtype=np.float32)
+    landmarks[:, 2] = 0.05
+    landmarks[8] = (x, y, 0.05)
+    return LandmarkResult.from_arrays(gesture_id, 0.9, landmarks)
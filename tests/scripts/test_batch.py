@@ -0,0 +1,116 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+import cv2
+import numpy as np
+
+from src.batch import find_videos, process_batch
+from src.model.signature import SignatureRecognition
+from tests.scripts.gesture_results import gesture_result
+
+
+class TestBatch(unittest.TestCase):
+    """Test cases for offline signature extraction."""
+
+    def setUp(self):
+        """Set up tests fixtures before each tests method."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.output = os.path.join(self.directory.name, "out")
+        self.video = os.path.join(self.directory.name, "station1.avi")
+        writer = cv2.VideoWriter(self.video, cv2.VideoWriter_fourcc(*"MJPG"), 30, (64, 48))
+        for _ in range(330):
+            writer.write(np.zeros((48, 64, 3), dtype=np.uint8))
+        writer.release()
+
+        # 220 frames of drawing followed by Thumb_Up held for more than 3 seconds of video time
+        results = [gesture_result(1, 0.2 + i / 400, 0.5) for i in range(220)]
+        results += [gesture_result(2)] * 110
+        self.recognizer = MagicMock()
+        self.recognizer.recognize_for_video.side_effect = results
+
+        stdout = patch('sys.stdout')
+        stdout.start()
+        self.addCleanup(stdout.stop)
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.directory.cleanup()
+
+    def test_find_videos(self):
+        """Test that only video files are picked up."""
+        open(os.path.join(self.directory.name, "notes.txt"), "w").close()
+        self.assertEqual(find_videos(self.directory.name), [self.video])
+
+    @patch.object(SignatureRecognition, 'setup_recognizer')
+    def test_confirmed_signature_is_saved(self, mock_setup):
+        """Test that a signature confirmed with Thumb_Up is saved with its strokes."""
+        mock_setup.return_value = self.recognizer
+
+        results = process_batch([self.video], self.output, workers=1)
+
+        self.assertEqual(results[0]["frames"], 330)
+        self.assertEqual(len(results[0]["signatures"]), 1)
+        filename = results[0]["signatures"][0]
+        self.assertTrue(filename.startswith(os.path.join(self.output, "station1")))
+        self.assertTrue(os.path.exists(filename))
+        with open(os.path.splitext(filename)[0] + ".json") as f:
+            strokes = json.load(f)
+        self.assertEqual((strokes["width"], strokes["height"]), (64, 48))
+        self.assertEqual(len(strokes["strokes"]), 1)
+        # The straight stroke is stored decimated, from its first to its last point, with the ink width
+        stroke = strokes["strokes"][0]
+        self.assertLess(len(stroke), 20)
+        self.assertEqual(stroke[0][:2], [12, 24])
+        self.assertEqual(stroke[-1][1], 24)
+        self.assertTrue(all(3.0 <= width <= 7.0 for _, _, width in stroke))
+
+        # Timestamps handed to VIDEO mode must increase
+        timestamps = [call.args[1] for call in self.recognizer.recognize_for_video.call_args_list]
+        self.assertEqual(timestamps, sorted(set(timestamps)))
+
+    @patch.object(SignatureRecognition, 'setup_recognizer')
+    def test_unconfirmed_signature(self, mock_setup):
+        """Test that a signature without Thumb_Up is only saved on request."""
+        self.recognizer.recognize_for_video.side_effect = [gesture_result(1, 0.2 + i / 400, 0.5)
+                                                           for i in range(330)]
+        mock_setup.return_value = self.recognizer
+
+        results = process_batch([self.video], self.output, export_strokes=False, workers=1)
+        self.assertEqual(results[0]["signatures"], [])
+
+        self.recognizer.recognize_for_video.side_effect = [gesture_result(1, 0.2 + i / 400, 0.5)
+                                                           for i in range(330)]
+        results = process_batch([self.video], self.output, export_strokes=False, save_unconfirmed=True,
+                                workers=1)
+        self.assertEqual(len(results[0]["signatures"]), 1)
+        self.assertFalse(os.path.exists(os.path.splitext(results[0]["signatures"][0])[0] + ".json"))
+
+    @patch.object(SignatureRecognition, 'setup_recognizer')
+    def test_unreadable_video(self, mock_setup):
+        """Test that a video that cannot be opened is reported."""
+        mock_setup.return_value = self.recognizer
+        missing = os.path.join(self.directory.name, "missing.avi")
+
+        results = process_batch([missing], self.output, workers=1)
+        self.assertIn("error", results[0])
+
+    @patch.object(SignatureRecognition, 'setup_recognizer')
+    def test_failing_video(self, mock_setup):
+        """Test that an error while processing a video is reported and the next video is still processed."""
+        self.recognizer.recognize_for_video.side_effect = ([gesture_result(0)] * 4 + [RuntimeError("inference failed")]
+                                                           + list(self.recognizer.recognize_for_video.side_effect))
+        mock_setup.return_value = self.recognizer
+
+        results = process_batch([self.video, self.video], self.output, workers=1)
+
+        self.assertEqual(results[0], {"video": self.video, "frames": 4, "signatures": [],
+                                      "error": "inference failed"})
+        self.assertNotIn("error", results[1])
+        self.assertEqual(len(results[1]["signatures"]), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
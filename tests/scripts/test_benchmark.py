@@ -0,0 +1,70 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.benchmark import BenchmarkRunner, format_markdown, write_results
+from src.capture.frame_source import SyntheticSource
+
+
+class TestBenchmark(unittest.TestCase):
+    """Test suite for the headless benchmark runner."""
+
+    def setUp(self):
+        """Set up each tests with a fresh VideoThread and a mocked recognizer."""
+        self.sign_model_patcher = patch('src.benchmark.SignatureRecognition')
+        self.mock_sign_model_class = self.sign_model_patcher.start()
+        self.mock_sign_model = MagicMock()
+        self.mock_sign_model.get_result.return_value = None
+        self.mock_sign_model.dropped_frames = 0
+        self.mock_sign_model.completed_results = 5
+        self.mock_sign_model.wait_for_result.return_value = True
+        self.mock_sign_model_class.return_value = self.mock_sign_model
+
+    def tearDown(self):
+        """Clean up after each tests."""
+        self.sign_model_patcher.stop()
+
+    def test_run(self):
+        """Test running the benchmark through the processing path."""
+        results = BenchmarkRunner(SyntheticSource(320, 240, 10), "synthetic", fps_cap=60).run()
+
+        self.assertEqual(results["frames"], 10)
+        self.assertEqual(results["resolution"], "320x240")
+        # With fps_cap 60 every other frame is sent to the recognizer
+        recognizer = self.mock_sign_model.recognizer_context_manager.return_value.__enter__.return_value
+        self.assertEqual(recognizer.recognize_async.call_count, 5)
+        for stage in ["read", "flip", "convert", "submit", "composite", "qt_convert", "emit", "frame"]:
+            self.assertIn(stage, results["stages"])
+
+    def test_waits_for_outstanding_results(self):
+        """Test that the clock stops after the result of the last submitted frame and results are counted."""
+        results = BenchmarkRunner(SyntheticSource(320, 240, 10), "synthetic", fps_cap=60).run()
+
+        # Frames 0, 2, ..., 8 were submitted with timestamps 0 to 4
+        self.mock_sign_model.wait_for_result.assert_called_once_with(4, 2.0)
+        self.assertEqual(results["results"], 5)
+        self.assertAlmostEqual(results["results_per_s"], 5 / results["duration_s"])
+
+    def test_max_frames(self):
+        """Test stopping after max_frames."""
+        results = BenchmarkRunner(SyntheticSource(320, 240, 10), "synthetic").run(max_frames=4)
+        self.assertEqual(results["frames"], 4)
+
+    def test_write_results(self):
+        """Test writing JSON and markdown reports."""
+        results = BenchmarkRunner(SyntheticSource(320, 240, 2), "synthetic").run()
+        with tempfile.TemporaryDirectory() as directory:
+            json_path = os.path.join(directory, "results.json")
+            markdown_path = os.path.join(directory, "results.md")
+            write_results(results, json_path, markdown_path)
+
+            with open(json_path) as f:
+                self.assertEqual(json.load(f)["frames"], 2)
+            with open(markdown_path) as f:
+                self.assertEqual(f.read(), format_markdown(results))
+
+
+if __name__ == '__main__':
+    unittest.main()
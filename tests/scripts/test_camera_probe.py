@@ -0,0 +1,162 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import cv2
+import numpy as np
+
+from src.capture.camera_probe import CameraMode, CameraProber, camera_device_id, codec_matches, fourcc_name
+from src.capture.frame_source import CameraSource
+
+
+class FakeCapture:
+    """Camera accepting MJPG up to 1280x720 and YUYV (reported as YUY2) at 640x480 only."""
+    SUPPORTED = {("MJPG", 640, 480), ("MJPG", 1280, 720), ("YUY2", 640, 480)}
+
+    def __init__(self, *args):
+        self.codec, self.width, self.height, self.fps = "YUY2", 640, 480, 30
+        self.reads = 0
+
+    def isOpened(self):
+        return True
+
+    def getBackendName(self):
+        return "FAKE"
+
+    def set(self, prop, value):
+        if prop == cv2.CAP_PROP_FOURCC:
+            codec = "YUY2" if fourcc_name(value) == "YUYV" else fourcc_name(value)
+            if any(mode[0] == codec for mode in self.SUPPORTED):
+                self.codec = codec
+        elif prop == cv2.CAP_PROP_FRAME_WIDTH:
+            self.requested_width = int(value)
+        elif prop == cv2.CAP_PROP_FRAME_HEIGHT:
+            # Drivers fall back to the largest size they support for the format
+            if (self.codec, self.requested_width, int(value)) in self.SUPPORTED:
+                self.width, self.height = self.requested_width, int(value)
+            else:
+                self.width, self.height = 640, 480
+        elif prop == cv2.CAP_PROP_FPS:
+            self.fps = min(int(value), 30)
+        return True
+
+    def get(self, prop):
+        if prop == cv2.CAP_PROP_FOURCC:
+            return cv2.VideoWriter_fourcc(*self.codec)
+        return {cv2.CAP_PROP_FRAME_WIDTH: self.width, cv2.CAP_PROP_FRAME_HEIGHT: self.height,
+                cv2.CAP_PROP_FPS: self.fps}.get(prop, 0)
+
+    def read(self):
+        self.reads += 1
+        return True, np.zeros((self.height, self.width, 3), dtype=np.uint8)
+
+    def release(self):
+        pass
+
+
+class TestCameraProbe(unittest.TestCase):
+    """Test cases for camera mode probing."""
+
+    def setUp(self):
+        """Set up tests fixtures before each tests method."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self.directory.name, "cache", "camera_modes.json")
+        stdout = patch('sys.stdout')
+        stdout.start()
+        self.addCleanup(stdout.stop)
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.directory.cleanup()
+
+    def test_probe_reads_back_modes(self):
+        """Test that only modes the camera really applies are reported."""
+        prober = CameraProber(self.cache_path, sample_frames=2, warmup_frames=1)
+        modes = prober.probe(FakeCapture())
+
+        self.assertEqual({(mode.codec, mode.width, mode.height, mode.fps) for mode in modes},
+                         {("MJPG", 640, 480, 30), ("MJPG", 1280, 720, 30), ("YUYV", 640, 480, 30)})
+        self.assertTrue(all(mode.measured_fps > 0 for mode in modes))
+
+    def test_cache_on_disk(self):
+        """Test that probed modes are cached per device and survive a restart."""
+        prober = CameraProber(self.cache_path, sample_frames=2, warmup_frames=1)
+        cap = FakeCapture()
+        modes = prober.modes(cap, "FAKE:0")
+        reads = cap.reads
+        self.assertEqual(prober.modes(cap, "FAKE:0"), modes)
+        self.assertEqual(cap.reads, reads)
+
+        self.assertEqual(CameraProber(self.cache_path).cache["FAKE:0"], modes)
+
+    def test_damaged_cache(self):
+        """Test that a damaged cache file is ignored."""
+        os.makedirs(os.path.dirname(self.cache_path))
+        with open(self.cache_path, "w") as f:
+            f.write("{not json")
+        self.assertEqual(CameraProber(self.cache_path).cache, {})
+
+    def test_best_mode(self):
+        """Test that the fastest mode with the smallest fitting resolution is chosen."""
+        modes = [CameraMode("YUYV", 1280, 720, 30, 9.5), CameraMode("MJPG", 1280, 720, 30, 29.8),
+                 CameraMode("MJPG", 1920, 1080, 30, 30.0), CameraMode("MJPG", 640, 480, 60, 59.0)]
+        self.assertEqual(CameraProber.best_mode(modes, (1280, 720), 30), modes[1])
+        self.assertEqual(CameraProber.best_mode(modes, (640, 480), 60), modes[3])
+        self.assertIsNone(CameraProber.best_mode(modes, (3840, 2160), 30))
+
+    def test_cached_modes_only(self):
+        """Test that a prober without probing uses cached modes and does not probe unknown cameras."""
+        CameraProber(self.cache_path, sample_frames=2, warmup_frames=1).modes(FakeCapture(), "FAKE:0")
+        prober = CameraProber(self.cache_path, probe_new_devices=False)
+        cap = FakeCapture()
+        self.assertTrue(prober.modes(cap, "FAKE:0"))
+        self.assertEqual(prober.modes(cap, "FAKE:1"), [])
+        self.assertEqual(prober.modes(cap, "FAKE:0", refresh=True), [])
+        self.assertEqual(cap.reads, 0)
+        self.assertNotIn("FAKE:1", prober.cache)
+
+    def test_stable_device_id(self):
+        """Test that a camera is identified by its by-id link and by its index without one."""
+        by_id = os.path.join(self.directory.name, "by-id")
+        os.makedirs(by_id)
+        os.symlink("/dev/video2", os.path.join(by_id, "usb-Vendor_Webcam_SN1234-video-index0"))
+        with patch('src.capture.camera_probe.V4L_BY_ID', by_id), \
+                patch('src.capture.camera_probe.os.path.realpath', side_effect=os.readlink):
+            self.assertEqual(camera_device_id(2), "usb-Vendor_Webcam_SN1234-video-index0")
+            self.assertEqual(camera_device_id(0), "0")
+        with patch('src.capture.camera_probe.V4L_BY_ID', os.path.join(self.directory.name, "missing")):
+            self.assertEqual(camera_device_id(2), "2")
+
+    @patch('src.capture.camera_probe.V4L_BY_ID', os.devnull)
+    @patch('src.capture.frame_source.cv2.VideoCapture', FakeCapture)
+    def test_camera_source_uses_best_mode(self):
+        """Test that the camera source applies the probed mode and checks codecs by read-back."""
+        prober = CameraProber(self.cache_path, sample_frames=2, warmup_frames=1)
+        source = CameraSource(0, fps=30, resolution=(1280, 720), prober=prober)
+        self.assertTrue(source.open())
+        self.assertEqual(fourcc_name(source.cap.get(cv2.CAP_PROP_FOURCC)), "MJPG")
+        self.assertEqual(source.frame_size, (1280, 720))
+        self.assertIn("FAKE:0", prober.cache)
+
+        self.assertEqual(source.check_supported_codecs(), ["MJPG", "YUYV"])
+
+    @patch('src.capture.camera_probe.V4L_BY_ID', os.devnull)
+    @patch('src.capture.frame_source.cv2.VideoCapture', FakeCapture)
+    def test_configure_uses_best_mode(self):
+        """Test that changing the resolution of an open camera picks the mode open() would choose."""
+        prober = CameraProber(self.cache_path)
+        prober.cache["FAKE:0"] = [CameraMode("MJPG", 640, 480, 30, 15.0), CameraMode("YUYV", 640, 480, 30, 29.5),
+                                  CameraMode("MJPG", 1280, 720, 30, 30.0)]
+        source = CameraSource(0, fps=30, resolution=(1280, 720), prober=prober)
+        self.assertTrue(source.open())
+        self.assertEqual(fourcc_name(source.cap.get(cv2.CAP_PROP_FOURCC)), "MJPG")
+
+        self.assertTrue(source.configure(30, (640, 480)))
+        self.assertTrue(codec_matches("YUYV", source.cap.get(cv2.CAP_PROP_FOURCC)))
+        self.assertEqual(source.frame_size, (640, 480))
+        self.assertEqual(source.cap.reads, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
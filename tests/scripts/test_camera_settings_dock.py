@@ -2,9 +2,12 @@ import sys
 import unittest
 from unittest.mock import MagicMock, patch
 
+from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QApplication
 
+from src.capture.camera_enumerator import CameraEnumerator
 from src.ui.dock.camera_setting_dock import CameraSettingsDock
+from src.utils.startup_profiler import StartupProfiler
 
 
 class TestCameraSettingsDock(unittest.TestCase):
@@ -17,21 +20,23 @@ class TestCameraSettingsDock(unittest.TestCase):
 
     def setUp(self):
         """Set up each tests by creating a CameraSettingsDock instance."""
-        # Mock VideoThread
-        self.video_thread_patcher = patch('src.ui.dock.camera_setting_dock.VideoThread')
-        self.mock_video_thread_class = self.video_thread_patcher.start()
+        # Mock the capture session the dock controls
         self.mock_video_thread = MagicMock()
-        self.mock_video_thread_class.return_value = self.mock_video_thread
-        self.mock_video_thread.get_instance.return_value = self.mock_video_thread
         self.mock_video_thread.isRunning.return_value = False
         self.mock_video_thread.fps = 30.0
+        self.mock_video_thread.camera_index = 0
 
         # Mock QMediaDevices
         self.media_devices_patcher = patch('src.ui.dock.camera_setting_dock.QMediaDevices')
         self.mock_media_devices = self.media_devices_patcher.start()
 
+        # Mock the worker thread listing the cameras
+        self.enumerator_patcher = patch('src.ui.dock.camera_setting_dock.CameraEnumerator')
+        self.mock_enumerator = self.enumerator_patcher.start()
+        self.mock_enumerator.capabilities = {}
+
         # Create dock widget
-        self.dock = CameraSettingsDock()
+        self.dock = CameraSettingsDock(video_thread=self.mock_video_thread)
 
         # Stop the timers to prevent unexpected behavior
         self.dock.cameraUpdateTimer.stop()
@@ -39,8 +44,8 @@ class TestCameraSettingsDock(unittest.TestCase):
 
     def tearDown(self):
         """Clean up after each tests."""
-        self.video_thread_patcher.stop()
         self.media_devices_patcher.stop()
+        self.enumerator_patcher.stop()
         self.dock.close()
 
     def test_initial_state(self):
@@ -156,23 +161,75 @@ class TestCameraSettingsDock(unittest.TestCase):
         self.assertFalse(self.dock.camera_combobox.isEnabled())
         self.assertEqual(self.dock.camera_combobox.count(), 0)
 
-    def test_get_available_cameras(self):
-        """Test getting available cameras."""
-        # Create mock camera devices
-        mock_camera = MagicMock()
-        self.mock_media_devices.videoInputs = MagicMock(return_value=[mock_camera])
-
-        # Patch the updateCameras method
-        self.dock.updateCameras = MagicMock()
+    def test_update_cameras_keeps_session_camera(self):
+        """Test that a new camera list does not move the session to another camera."""
+        cameras = []
+        for name in ("Camera 1", "Camera 2", "Camera 3"):
+            camera = MagicMock()
+            camera.description.return_value = name
+            cameras.append(camera)
+        self.mock_video_thread.camera_index = 1
 
-        # Call getAvailableCameras
-        self.dock.getAvailableCameras()
+        self.dock.updateCameras(cameras[:2])
+        self.dock.updateCameras(cameras)
 
-        # Check that videoInputs was called
-        self.mock_media_devices.videoInputs.assert_called_once()
+        self.mock_video_thread.change_settings.assert_not_called()
+        self.assertEqual(self.dock.camera_combobox.currentIndex(), 1)
 
-        # Check that updateCameras was called with the result of videoInputs
-        self.dock.updateCameras.assert_called_once_with([mock_camera])
+    def test_get_available_cameras(self):
+        """Test that cameras are listed on one worker thread at a time."""
+        # The dock lists the cameras when it is created
+        self.mock_enumerator.assert_called_once_with()
+        enumerator = self.mock_enumerator.return_value
+        enumerator.CamerasFound.connect.assert_called_once_with(self.dock.updateCameras)
+        enumerator.finished.connect.assert_called_once_with(self.dock.onEnumerationFinished)
+        enumerator.start.assert_called_once()
+
+        # Requests while the worker runs are merged into one more enumeration
+        self.dock.getAvailableCameras()
+        self.dock.getAvailableCameras()
+        self.assertEqual(self.mock_enumerator.call_count, 1)
+
+        self.dock.onEnumerationFinished()
+        enumerator.deleteLater.assert_called_once()
+        self.assertEqual(self.mock_enumerator.call_count, 2)
+        self.dock.onEnumerationFinished()
+        self.assertIsNone(self.dock.cameraEnumerator)
+
+    def test_camera_change_notifications(self):
+        """Test that cameras are polled until the platform reports a device change."""
+        media_devices = self.mock_media_devices.return_value
+        media_devices.videoInputsChanged.connect.assert_called_once_with(self.dock.onVideoInputsChanged)
+
+        # Recreate the dock to check the timer state before setUp stops it
+        dock = CameraSettingsDock(video_thread=self.mock_video_thread)
+        self.assertTrue(dock.cameraUpdateTimer.isActive())
+        dock.onEnumerationFinished()
+        dock.onVideoInputsChanged()
+        self.assertFalse(dock.cameraUpdateTimer.isActive())
+        self.assertEqual(self.mock_enumerator.call_count, 3)
+        dock.close()
+
+    def test_cached_capabilities_shown(self):
+        """Test that the cached modes of a camera are shown as its tooltip."""
+        camera = MagicMock()
+        camera.description.return_value = "Camera 1"
+        camera.id.return_value = b"usb-1"
+        self.mock_enumerator.capabilities = {b"usb-1": [(1280, 720, 30), (640, 480, 60)]}
+        self.dock.updateCameras([camera])
+        self.assertEqual(self.dock.camera_combobox.itemData(0, Qt.ToolTipRole),
+                         "1280x720 @ 30 FPS\n640x480 @ 60 FPS")
+
+    @patch('src.capture.camera_enumerator.QMediaDevices')
+    def test_first_enumeration_profiled(self, mock_media_devices):
+        """Test that the first device listing of the worker is a startup phase."""
+        mock_media_devices.videoInputs.return_value = []
+        profiler = StartupProfiler()
+        profiler.enabled = True
+        with patch('src.capture.camera_enumerator.startup_profiler', profiler):
+            CameraEnumerator().run()
+            CameraEnumerator().run()
+        self.assertEqual([phase[0] for phase in profiler.phases], ["first QMediaDevices.videoInputs"])
 
 
 if __name__ == '__main__':
@@ -0,0 +1,124 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+import cv2
+import numpy as np
+
+from src.capture.frame_source import CameraSource, ImageSequenceSource, MjpegCameraSource, SyntheticSource, \
+    VideoFileSource
+
+
+class TestFrameSources(unittest.TestCase):
+    """Test cases for the FrameSource implementations."""
+
+    def test_synthetic_source(self):
+        """Test that the synthetic source is deterministic and finite."""
+        source = SyntheticSource(320, 240, count=3, fps=30)
+        self.assertTrue(source.open())
+        self.assertEqual(source.frame_size, (320, 240))
+
+        frames = [source.read() for _ in range(4)]
+        self.assertTrue(all(ret for ret, _ in frames[:3]))
+        self.assertEqual(frames[0][1].shape, (240, 320, 3))
+        self.assertFalse(frames[3][0])
+        self.assertAlmostEqual(source.timestamp_msec(), 100.0)
+
+        # Reopening replays the same frames
+        source.open()
+        np.testing.assert_array_equal(source.read()[1], frames[0][1])
+
+    def test_image_sequence_source(self):
+        """Test reading a directory of images in name order."""
+        with tempfile.TemporaryDirectory() as directory:
+            for i in range(3):
+                cv2.imwrite(os.path.join(directory, f"frame_{i}.png"), np.full((20, 30, 3), i * 50, np.uint8))
+            open(os.path.join(directory, "notes.txt"), "w").close()
+
+            source = ImageSequenceSource(directory)
+            self.assertTrue(source.open())
+            self.assertEqual(source.frame_size, (30, 20))
+            values = [source.read()[1][0, 0, 0] for _ in range(3)]
+            self.assertEqual(values, [0, 50, 100])
+            self.assertFalse(source.read()[0])
+
+    def test_image_sequence_source_empty(self):
+        """Test that an empty directory cannot be opened."""
+        with tempfile.TemporaryDirectory() as directory:
+            with patch('sys.stdout'):
+                self.assertFalse(ImageSequenceSource(directory).open())
+
+    def test_video_file_source(self):
+        """Test reading and looping a video file."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "clip.avi")
+            writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), 30, (64, 48))
+            for _ in range(2):
+                writer.write(np.zeros((48, 64, 3), np.uint8))
+            writer.release()
+
+            source = VideoFileSource(path, loop=True)
+            self.assertTrue(source.open())
+            self.assertEqual(source.frame_size, (64, 48))
+            # Looping keeps delivering frames past the end of the file
+            self.assertTrue(all(source.read()[0] for _ in range(5)))
+            source.release()
+
+    @patch('src.capture.frame_source.cv2.VideoCapture')
+    def test_camera_source(self, mock_capture):
+        """Test that the camera source applies the requested settings."""
+        mock_cap = MagicMock()
+        mock_cap.isOpened.return_value = True
+        mock_cap.get.return_value = 0
+        mock_capture.return_value = mock_cap
+
+        source = CameraSource(1, fps=60, resolution=(1280, 720))
+        self.assertTrue(source.open())
+
+        mock_cap.set.assert_any_call(cv2.CAP_PROP_FPS, 60)
+        mock_cap.set.assert_any_call(cv2.CAP_PROP_FRAME_WIDTH, 1280)
+        mock_cap.set.assert_any_call(cv2.CAP_PROP_FRAME_HEIGHT, 720)
+
+    @patch('src.capture.frame_source.cv2.VideoCapture')
+    def test_mjpeg_camera_source(self, mock_capture):
+        """Test that raw MJPG buffers are decoded in capture order, optionally at reduced size."""
+        frames = [np.full((480, 640, 3), i * 20, np.uint8) for i in range(8)]
+        buffers = [cv2.imencode(".jpg", frame)[1] for frame in frames]
+        mock_cap = MagicMock()
+        mock_cap.isOpened.return_value = True
+        mock_cap.get.side_effect = lambda prop: {cv2.CAP_PROP_FRAME_WIDTH: 640,
+                                                 cv2.CAP_PROP_FRAME_HEIGHT: 480}.get(prop, 0)
+        mock_cap.read.side_effect = [(True, buffer) for buffer in buffers] + [(False, None)] * 4
+        mock_capture.return_value = mock_cap
+
+        with patch('sys.stdout'):
+            source = MjpegCameraSource(0, resolution=(640, 480), decode_workers=3, reduction=2)
+            self.assertTrue(source.open())
+        mock_cap.set.assert_any_call(cv2.CAP_PROP_CONVERT_RGB, 0)
+        self.assertEqual(source.frame_size, (320, 240))
+
+        decoded = []
+        while True:
+            ret, frame = source.read()
+            if not ret:
+                break
+            decoded.append(frame)
+        source.release()
+
+        self.assertEqual(len(decoded), 8)
+        self.assertEqual(decoded[0].shape, (240, 320, 3))
+        # JPEG is lossy, but the order of the frames must be kept
+        np.testing.assert_allclose([frame.mean() for frame in decoded], [i * 20 for i in range(8)], atol=2)
+
+    def test_mjpeg_decoded_fallback(self):
+        """Test that frames already decoded by the backend are passed through or scaled."""
+        source = MjpegCameraSource(reduction=4)
+        frame = np.zeros((480, 640, 3), np.uint8)
+        self.assertEqual(source.decode(frame).shape, (120, 160, 3))
+        with self.assertRaises(ValueError):
+            MjpegCameraSource(reduction=3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import unittest
+
+import numpy as np
+
+from src.model.gesture_state import (GestureStateMachine, observe_gesture, NONE, POINTING_UP, THUMB_UP,
+                                     THUMB_DOWN, VICTORY)
+from src.model.landmarks import GESTURE_IDS, LandmarkResult
+
+
+def hand_result(gesture_name, score=0.9, pointing_pose=False):
+    """Build a result of one hand, optionally holding only the index finger up."""
+    landmarks = np.full((21, 3), 0.5, dtype=np.float32)
+    if pointing_pose:
+        landmarks[8, 1] = 0.2  # Index tip above its base
+        for tip in (12, 16, 20):
+            landmarks[tip, 1] = 0.8  # Other tips below their bases
+    return LandmarkResult.from_arrays(GESTURE_IDS[gesture_name], score, landmarks)
+
+
+class TestGestureStateMachine(unittest.TestCase):
+    """Test cases for the gesture state machine."""
+
+    def setUp(self):
+        """Set up a state machine fed at 30 frames per second."""
+        self.state = GestureStateMachine()
+        self.now = 0.0
+
+    def feed(self, gesture_id, score=0.9, frames=1):
+        """Feed `frames` frames of a gesture and return the stable gesture after the last one"""
+        for _ in range(frames):
+            gesture = self.state.update(gesture_id, score, self.now)
+            self.now += 1 / 30
+        return gesture
+
+    def test_pointing_enters_immediately(self):
+        """Test that drawing starts on the first confident Pointing_Up frame."""
+        self.assertEqual(self.feed(POINTING_UP), POINTING_UP)
+
+    def test_single_misclassified_frame_keeps_gesture(self):
+        """Test that one wrong frame does not end the current gesture."""
+        self.feed(POINTING_UP, frames=5)
+        self.assertEqual(self.feed(NONE), POINTING_UP)
+        self.assertTrue(self.state.holding)
+        self.assertEqual(self.feed(POINTING_UP), POINTING_UP)
+        self.assertFalse(self.state.holding)
+
+    def test_exit_after_exit_time(self):
+        """Test that the gesture ends once frames stop showing it for its exit time."""
+        self.feed(POINTING_UP, frames=5)
+        self.assertEqual(self.feed(NONE, frames=6), NONE)
+
+    def test_hysteresis_thresholds(self):
+        """Test that a score between the exit and enter threshold keeps but does not enter a gesture."""
+        self.assertEqual(self.feed(THUMB_UP, score=0.5, frames=10), NONE)
+        self.feed(THUMB_UP, frames=5)
+        self.assertEqual(self.feed(THUMB_UP, score=0.5, frames=30), THUMB_UP)
+        self.assertFalse(self.state.holding)
+
+    def test_thumb_down_debounced(self):
+        """Test that clearing the board needs Thumb_Down held for its enter time."""
+        self.assertEqual(self.feed(THUMB_DOWN, frames=3), NONE)
+        self.feed(NONE)
+        self.assertEqual(self.feed(THUMB_DOWN, frames=3), NONE)
+        self.assertEqual(self.feed(THUMB_DOWN, frames=5), THUMB_DOWN)
+
+    def test_entered_once_per_gesture(self):
+        """Test that entering a gesture is reported on one update only."""
+        entered = []
+        for _ in range(20):
+            self.feed(VICTORY)
+            entered.append(self.state.entered)
+        self.assertEqual(entered.count(True), 1)
+        # Showing the gesture again after releasing it enters it again
+        self.feed(NONE, frames=5)
+        entered = []
+        for _ in range(20):
+            self.feed(VICTORY)
+            entered.append(self.state.entered)
+        self.assertEqual(entered.count(True), 1)
+
+    def test_switch_between_gestures(self):
+        """Test that a new gesture takes over once the current one has exited."""
+        self.feed(POINTING_UP, frames=5)
+        self.assertEqual(self.feed(THUMB_UP, frames=4), POINTING_UP)
+        self.assertEqual(self.feed(THUMB_UP, frames=2), THUMB_UP)
+
+    def test_unknown_gestures_end_current(self):
+        """Test that gestures without thresholds count as no gesture."""
+        self.feed(THUMB_UP, frames=5)
+        self.assertEqual(self.feed(GESTURE_IDS["Closed_Fist"], frames=15), NONE)
+
+    def test_observe_gesture(self):
+        """Test the gesture id and score read from recognizer results."""
+        self.assertEqual(observe_gesture(None), (NONE, 0.0))
+        self.assertEqual(observe_gesture(LandmarkResult.empty()), (NONE, 0.0))
+        gesture_id, score = observe_gesture(hand_result("Thumb_Up", 0.75))
+        self.assertEqual(gesture_id, THUMB_UP)
+        self.assertAlmostEqual(score, 0.75)
+        # The pointing pose counts as Pointing_Up when the classifier finds no gesture
+        self.assertEqual(observe_gesture(hand_result("None", 0.6, pointing_pose=True)), (POINTING_UP, 1.0))
+        self.assertEqual(observe_gesture(hand_result("None", 0.6))[0], NONE)
+
+
+if __name__ == '__main__':
+    unittest.main()
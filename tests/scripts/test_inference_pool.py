@@ -0,0 +1,152 @@
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.model.inference_pool import InferencePool
+
+
+class FakeRecognizer:
+    """IMAGE mode recognizer returning the image it was given as result."""
+
+    def __init__(self):
+        self.closed = False
+
+    def recognize(self, image):
+        return f"result of {image}"
+
+    def close(self):
+        self.closed = True
+
+
+class TestInferencePool(unittest.TestCase):
+    """Test cases for the inference pool shared by capture sessions."""
+
+    def setUp(self):
+        """Set up a pool creating fake recognizers."""
+        self.recognizers = []
+
+        def factory():
+            recognizer = FakeRecognizer()
+            self.recognizers.append(recognizer)
+            return recognizer
+
+        self.pool = InferencePool(workers=2, recognizer_factory=factory)
+
+    def tearDown(self):
+        """Stop the workers."""
+        with patch('sys.stdout'):
+            self.pool.stop()
+
+    def test_results_routed_to_sessions(self):
+        """Test that every session receives the results of its own frames."""
+        received = {"a": [], "b": []}
+        done = threading.Event()
+
+        def listener(name):
+            def on_result(result, image, timestamp_ms):
+                received[name].append((result, timestamp_ms))
+                if len(received["a"]) + len(received["b"]) == 2:
+                    done.set()
+            return on_result
+
+        with patch('sys.stdout'):
+            session_a = self.pool.session(listener("a"), "a")
+            session_b = self.pool.session(listener("b"), "b")
+        session_a.recognize_async("frame a", 7)
+        session_b.recognize_async("frame b", 3)
+
+        self.assertTrue(done.wait(5))
+        self.assertEqual(received["a"], [("result of frame a", 7)])
+        self.assertEqual(received["b"], [("result of frame b", 3)])
+
+        stats = session_a.stats()
+        self.assertEqual(stats["submitted"], 1)
+        self.assertEqual(stats["processed"], 1)
+        self.assertEqual(stats["queue"]["count"], 1)
+        self.assertIn("a", self.pool.stats())
+
+        session_a.close()
+        self.assertNotIn("a", self.pool.stats())
+
+    def test_sessions_take_turns(self):
+        """Test that workers take frames from the sessions in turn."""
+        pool = InferencePool(workers=1, max_pending=3)
+        with patch.object(pool, 'start'):
+            session_a = pool.session(MagicMock(), "a")
+            session_b = pool.session(MagicMock(), "b")
+        for timestamp_ms in range(3):
+            session_a.recognize_async("a", timestamp_ms)
+        session_b.recognize_async("b", 0)
+
+        order = []
+        while (job := pool._next_frame()) is not None:
+            session, (image, timestamp_ms, _) = job
+            order.append((session.name, timestamp_ms))
+            session.in_flight = False
+        self.assertEqual(order, [("a", 0), ("b", 0), ("a", 1), ("a", 2)])
+
+    def test_one_frame_in_flight_per_session(self):
+        """Test that the next frame of a session waits until its previous frame is recognized."""
+        pool = InferencePool(workers=2, max_pending=3)
+        with patch.object(pool, 'start'):
+            session_a = pool.session(MagicMock(), "a")
+            session_b = pool.session(MagicMock(), "b")
+        for timestamp_ms in range(2):
+            session_a.recognize_async("a", timestamp_ms)
+        session_b.recognize_async("b", 0)
+
+        self.assertEqual(pool._next_frame()[0], session_a)
+        self.assertEqual(pool._next_frame()[0], session_b)
+        self.assertIsNone(pool._next_frame())
+        session_a.in_flight = False
+        self.assertEqual(pool._next_frame()[1][1], 1)
+
+    def test_results_in_frame_order(self):
+        """Test that results of one session arrive in frame order with several workers."""
+        received = []
+        done = threading.Event()
+        gate = threading.Semaphore(0)
+
+        class SlowRecognizer(FakeRecognizer):
+            def recognize(self, image):
+                # The first frame finishes last if another worker could take the second one
+                if image == 0:
+                    gate.acquire(timeout=0.2)
+                return image
+
+        def on_result(result, image, timestamp_ms):
+            received.append(timestamp_ms)
+            if len(received) == 2:
+                done.set()
+
+        pool = InferencePool(workers=2, max_pending=2, recognizer_factory=SlowRecognizer)
+        self.addCleanup(pool.stop)
+        with patch('sys.stdout'):
+            session = pool.session(on_result)
+            session.recognize_async(0, 0)
+            session.recognize_async(1, 1)
+            self.assertTrue(done.wait(5))
+        self.assertEqual(received, [0, 1])
+
+    def test_old_frames_dropped(self):
+        """Test that a session keeps only its newest frames queued."""
+        with patch.object(self.pool, 'start'):
+            session = self.pool.session(MagicMock(), "camera 0")
+        for timestamp_ms in range(3):
+            session.recognize_async("frame", timestamp_ms)
+
+        self.assertEqual([frame[1] for frame in session.pending], [2])
+        self.assertEqual(session.stats()["dropped"], 2)
+
+    def test_stop_closes_recognizers(self):
+        """Test that stopping the pool closes the recognizer of every worker."""
+        with patch('sys.stdout'):
+            self.pool.session(MagicMock())
+            self.pool.stop()
+
+        self.assertEqual(len(self.recognizers), 2)
+        self.assertTrue(all(recognizer.closed for recognizer in self.recognizers))
+
+
+if __name__ == '__main__':
+    unittest.main()
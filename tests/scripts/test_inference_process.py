@@ -0,0 +1,140 @@
+import queue
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from src.model.inference_process import InferenceProcess, InferenceProcessDied, inference_main
+
+
+class FakeRecognizer:
+    """Recognizer reporting a Thumb_Up with every landmark at the mean brightness of the frame."""
+    closed = False
+    instances = []
+
+    def __init__(self):
+        self.timestamps = []
+        FakeRecognizer.instances.append(self)
+
+    def recognize(self, frame, timestamp_ms):
+        self.timestamps.append(timestamp_ms)
+        return 2, 0.9, np.full((21, 3), frame.mean() / 255, dtype=np.float32)
+
+    def close(self):
+        FakeRecognizer.closed = True
+
+
+class TestInferenceProcess(unittest.TestCase):
+    """Test cases for the shared-memory transport of the inference process."""
+
+    def setUp(self):
+        """Set up the frame slots and queues without spawning the process."""
+        FakeRecognizer.instances = []
+        self.process = InferenceProcess(slots=2, max_width=64, max_height=48)
+        self.process.allocate()
+        self.process.requests = queue.Queue()
+        self.process.results = queue.Queue()
+        self.process.process = MagicMock(exitcode=None)
+        self.process.process.is_alive.return_value = True
+
+    def tearDown(self):
+        """Free the shared memory."""
+        self.process.release()
+
+    def run_inference(self):
+        """Run the inference loop on a thread over the queued requests, as the process would"""
+        self.process.requests.put(None)
+        worker = threading.Thread(target=inference_main,
+                                  args=(self.process.memory.name, self.process.slot_shape,
+                                        self.process.requests, self.process.results, FakeRecognizer))
+        worker.start()
+        worker.join(5)
+        self.assertIsNone(self.process.results.get(timeout=1), "ready message")
+
+    def test_frames_through_shared_memory(self):
+        """Test that frames go through the slots and results come back as landmarks."""
+        listener = MagicMock()
+        self.process.sessions[0] = session = MagicMock(session_id=0, listener=listener)
+        self.process.submit(session, np.full((48, 64, 3), 51, dtype=np.uint8), 7)
+        self.process.submit(session, np.full((24, 32, 3), 102, dtype=np.uint8), 8)
+        self.assertEqual(self.process.free_slots, [])
+
+        self.run_inference()
+        self.assertTrue(FakeRecognizer.closed)
+        self.process.results.put(None)
+        self.process._receive()
+
+        self.assertEqual(sorted(self.process.free_slots), [0, 1])
+        (first, _, first_ts), (second, _, second_ts) = [call.args for call in listener.call_args_list]
+        self.assertEqual((first_ts, second_ts), (7, 8))
+        self.assertEqual(first.gestures[0][0].category_name, "Thumb_Up")
+        self.assertAlmostEqual(first.hand_landmarks[0][0].x, 0.2, places=5)
+        self.assertAlmostEqual(second.hand_landmarks[0][20].z, 0.4, places=5)
+
+    def test_frames_dropped_when_slots_busy(self):
+        """Test that frames are dropped instead of waiting for a free slot."""
+        session = MagicMock(session_id=0, submitted=0, dropped=0)
+        frame = np.zeros((48, 64, 3), dtype=np.uint8)
+        for timestamp_ms in range(3):
+            self.process.submit(session, frame, timestamp_ms)
+        self.process.submit(session, np.zeros((96, 128, 3), dtype=np.uint8), 3)
+
+        self.assertEqual(session.submitted, 4)
+        self.assertEqual(session.dropped, 2)
+        self.assertEqual(self.process.requests.qsize(), 2)
+
+    def test_recognizer_per_session(self):
+        """Test that every session gets its own recognizer, fed with the timestamps of its frames."""
+        first = MagicMock(session_id=0, submitted=0, dropped=0)
+        second = MagicMock(session_id=1, submitted=0, dropped=0)
+        self.process.sessions = {0: first, 1: second}
+        frame = np.zeros((48, 64, 3), dtype=np.uint8)
+        # Frames of both cameras interleaved, the slots are freed as the results would free them
+        for session, timestamp_ms in ((first, 0), (second, 500), (first, 33), (second, 533)):
+            self.process.submit(session, frame, timestamp_ms)
+            self.process.free_slots.append(self.process.requests.queue[-1][1])
+        self.process.unregister(first)
+
+        self.run_inference()
+        recognizers = FakeRecognizer.instances
+        self.assertEqual(len(recognizers), 2)
+        self.assertEqual(recognizers[0].timestamps, [1, 33])
+        self.assertEqual(recognizers[1].timestamps, [500, 533])
+        self.assertTrue(FakeRecognizer.closed)
+
+    def test_submit_fails_when_process_died(self):
+        """Test that a dead process is reported once its slots are used up instead of dropping frames forever."""
+        session = MagicMock(session_id=0, submitted=0, dropped=0)
+        frame = np.zeros((48, 64, 3), dtype=np.uint8)
+        self.process.process = MagicMock(exitcode=-9)
+        self.process.process.is_alive.return_value = False
+        self.process.submit(session, frame, 0)
+        self.process.submit(session, frame, 1)
+
+        with self.assertRaises(InferenceProcessDied):
+            self.process.submit(session, frame, 2)
+
+    def test_start_fails_when_process_dies(self):
+        """Test that waiting for the process ends with an error when it exits before it is ready."""
+        self.process.process = MagicMock(exitcode=1)
+        self.process.process.is_alive.return_value = False
+        with self.assertRaises(RuntimeError):
+            self.process.wait_ready(time.perf_counter() + 60)
+
+        self.process.process.is_alive.return_value = True
+        with self.assertRaises(RuntimeError):
+            self.process.wait_ready(time.perf_counter())
+
+    def test_results_of_closed_sessions_ignored(self):
+        """Test that results still arriving for a closed session only free the slot."""
+        self.process.free_slots = []
+        self.process.results.put((5, 1, 0, 0, 0.0, None))
+        self.process.results.put(None)
+        self.process._receive()
+        self.assertEqual(self.process.free_slots, [1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+
+import numpy as np
+
+from src.utils.ink import (InkRasterizer, draw_segment, draw_stroke, redraw_region, segment_bounds, stroke_bounds,
+                           union_bounds)
+
+GREEN = (0, 255, 0)
+
+
+class TestInk(unittest.TestCase):
+    """Test cases for the incremental ink rasterizer."""
+
+    def setUp(self):
+        """Set up an empty board."""
+        self.board = np.zeros((100, 200, 3), dtype=np.uint8)
+
+    def test_segment_drawn_inside_bounds(self):
+        """Test that a segment only touches the box it returns."""
+        bounds = draw_segment(self.board, (20, 30), (80, 40), 5.0, 5.0, GREEN)
+        x0, y0, x1, y1 = bounds
+        self.assertEqual(self.board[35, 50, 1], 255)
+        self.assertEqual(self.board[:, :, [0, 2]].sum(), 0)
+        self.board[y0:y1, x0:x1] = 0
+        self.assertEqual(self.board.sum(), 0)
+
+    def test_anti_aliased_edges(self):
+        """Test that the edges of a diagonal segment blend into the board."""
+        draw_segment(self.board, (10, 10), (90, 60), 5.0, 5.0, GREEN)
+        values = np.unique(self.board[:, :, 1])
+        self.assertTrue(((values > 0) & (values < 255)).any())
+
+    def test_variable_width(self):
+        """Test that the segment widens from its start to its end."""
+        draw_segment(self.board, (20, 50), (180, 50), 2.0, 12.0, GREEN)
+        ink = self.board[:, :, 1] > 127
+        self.assertLess(ink[:, 30].sum(), ink[:, 170].sum())
+
+    def test_bounds_clipped_to_board(self):
+        """Test that segments partly or fully outside the board are clipped."""
+        self.assertEqual(segment_bounds((-10, -10), (5, 5), 4.0, self.board.shape)[:2], (0, 0))
+        self.assertIsNone(segment_bounds((-50, -50), (-20, -20), 4.0, self.board.shape))
+        self.assertIsNone(draw_segment(self.board, (300, 50), (350, 50), 4.0, 4.0, GREEN))
+
+    def test_union_bounds(self):
+        """Test the union of boxes, any of which may be empty."""
+        self.assertIsNone(union_bounds(None, None))
+        self.assertEqual(union_bounds(None, (1, 2, 3, 4)), (1, 2, 3, 4))
+        self.assertEqual(union_bounds((0, 5, 10, 8), (2, 1, 4, 20)), (0, 1, 10, 20))
+
+    def test_redraw_region(self):
+        """Test that redrawing a region gives back the ink of the strokes crossing it, nothing outside."""
+        first = [(20, 20, 5.0), (180, 80, 4.0)]
+        second = [(20, 80, 6.0), (100, 50, 5.0), (180, 20, 3.0)]
+        draw_stroke(self.board, first, GREEN)
+        expected = self.board.copy()
+        draw_stroke(self.board, second, GREEN)
+        outside = self.board.copy()
+
+        bounds = stroke_bounds(second, self.board.shape)
+        redraw_region(self.board, [first], bounds, GREEN)
+        np.testing.assert_array_equal(self.board, expected)
+
+        # Regions only partly crossed by a stroke leave the rest of the board alone
+        x0, y0, x1, y1 = 90, 40, 110, 60
+        redraw_region(outside, [first, second], (x0, y0, x1, y1), GREEN)
+        self.assertGreater(outside[y0:y1, x0:x1, 1].sum(), 0)
+
+    def test_width_follows_speed(self):
+        """Test that slow strokes are wide, fast strokes thin and the first point gets no segment."""
+        ink = InkRasterizer()
+        width, bounds = ink.add(self.board, (10, 50), 0.0, GREEN)
+        self.assertEqual(width, ink.max_width)
+        self.assertIsNone(bounds)
+
+        t = 0.0
+        for x in range(12, 30, 2):
+            t += 1 / 30
+            slow, _ = ink.add(self.board, (x, 50), t, GREEN)
+        for x in range(60, 200, 30):
+            t += 1 / 30
+            fast, _ = ink.add(self.board, (x, 50), t, GREEN)
+        self.assertGreater(slow, 6.0)
+        self.assertLess(fast, 4.5)
+        self.assertGreaterEqual(fast, ink.min_width)
+
+        ink.begin()
+        self.assertIsNone(ink.add(self.board, (10, 10), t + 1, GREEN)[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import sys
+import unittest
+from unittest.mock import patch
+
+from PySide6.QtGui import QImage
+from PySide6.QtWidgets import QApplication
+
+from src.utils.latency import LatencyTracker
+
+
+class TestLatencyTracker(unittest.TestCase):
+    """Test cases for the LatencyTracker class."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up the QApplication once for all tests."""
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def setUp(self):
+        """Set up tests fixtures before each tests method."""
+        self.tracker = LatencyTracker(enabled=True)
+
+    @patch('src.utils.latency.time.perf_counter')
+    def test_glass_to_glass(self, mock_clock):
+        """Test that paint latency is measured through the QImage tag."""
+        mock_clock.return_value = 10.0
+        capture_time = self.tracker.frame_read()
+        image = self.tracker.tag_image(QImage(4, 4, QImage.Format_RGB888), capture_time)
+
+        mock_clock.return_value = 10.05
+        self.tracker.image_painted(image)
+
+        summary = self.tracker.report()["glass_to_glass"]
+        self.assertEqual(summary["count"], 1)
+        self.assertAlmostEqual(summary["p50"], 50, delta=2)
+
+    @patch('src.utils.latency.time.perf_counter')
+    def test_fingertip_to_ink(self, mock_clock):
+        """Test that ink latency is measured from the recognizer frame's capture."""
+        self.tracker.frame_submitted(7, 5.0)
+        mock_clock.return_value = 5.08
+        self.tracker.ink_drawn(7)
+        self.tracker.ink_drawn(8)  # Unknown frame is ignored
+        mock_clock.return_value = 5.12
+        self.tracker.ink_drawn(7)  # Ink drawn again from the same result is not a new sample
+
+        summary = self.tracker.report()["fingertip_to_ink"]
+        self.assertEqual(summary["count"], 1)
+        self.assertAlmostEqual(summary["p50"], 80, delta=3)
+
+    @patch('src.utils.latency.time.perf_counter')
+    def test_camera_delay(self, mock_clock):
+        """Test that frames read later than the best case move the capture estimate back."""
+        mock_clock.return_value = 100.0
+        self.assertEqual(self.tracker.frame_read(camera_msec=1000.0), 100.0)
+
+        # Next frame arrived 33 ms later by the camera clock but was read 43 ms later
+        mock_clock.return_value = 100.043
+        self.assertAlmostEqual(self.tracker.frame_read(camera_msec=1033.0), 100.033)
+
+    def test_disabled(self):
+        """Test that a disabled tracker records nothing and does not tag images."""
+        tracker = LatencyTracker(enabled=False)
+        image = tracker.tag_image(QImage(4, 4, QImage.Format_RGB888), 1.0)
+        tracker.image_painted(image)
+        tracker.frame_submitted(1, 1.0)
+        tracker.ink_drawn(1)
+
+        self.assertEqual(image.text(LatencyTracker.CAPTURE_TIME_KEY), "")
+        self.assertEqual(tracker.report(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
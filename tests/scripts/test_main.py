@@ -42,6 +42,17 @@ class TestMainWindow(unittest.TestCase):
         self.assertIsNotNone(self.window.camera_dock)
         self.assertIsNotNone(self.window.signature_dock)
 
+    def test_capture_failed(self):
+        """Test that a session stopping on an error is reported and shown as stopped in the dock."""
+        dock = self.window.camera_dock
+        dock.showCaptureState(True)
+        with patch.object(self.window, 'sender', return_value=dock.VideoThread):
+            self.window.onCaptureFailed("Cannot open camera 1")
+
+        self.assertEqual(self.window.statusbar.currentMessage(), "Cannot open camera 1")
+        self.assertEqual(dock.toggle_btn.toolTip(), "Start Capture")
+        self.assertFalse(dock.advanced_settings_btn.isEnabled())
+
     def test_show_about_dialog(self):
         """Test that the about dialog is shown when requested."""
         with patch('src.ui.main_window.AboutDialog') as mock_dialog:
@@ -54,27 +65,27 @@ class TestMainWindow(unittest.TestCase):
             mock_dialog_instance.exec.assert_called_once()
 
     def test_update_image(self):
-        """Test the updateImage method."""
+        """Test that a frame of the session is shown by its feed."""
         # Create a mock QImage
         test_image = QImage(100, 100, QImage.Format_RGB888)
         test_image.fill(Qt.red)
 
-        # Call updateImage with the mock image
-        self.window.updateImage(test_image)
+        # Frames go from the session straight to its feed
+        self.window.camera_window.updateImage(test_image)
 
         # Check that the camera window now has a pixmap
         self.assertIsNotNone(self.window.camera_window.pixmap())
 
     def test_update_image_null(self):
-        """Test the updateImage method with a null image."""
+        """Test that a feed shows the loading animation for a null image while settings change."""
         # Create a null QImage
         null_image = QImage()
 
         # Set VideoThread is_changing_settings to True
         self.window.VideoThread.is_changing_settings = True
 
-        # Call updateImage with the null image
-        self.window.updateImage(null_image)
+        # Call updateImage of the feed with the null image
+        self.window.camera_window.updateImage(null_image)
 
         # Check that the camera window has a movie (loading animation)
         self.assertIsNotNone(self.window.camera_window.movie())
@@ -110,6 +121,42 @@ class TestMainWindow(unittest.TestCase):
         # Verify update_status was called with correct parameters
         self.window.statusbar.update_status.assert_called_once_with(3, 50, 60)
 
+    def test_multiple_cameras(self):
+        """Test that every camera gets a feed and clicking a feed rebinds the docks."""
+        def make_thread(camera_index):
+            thread = MagicMock()
+            thread.camera_index = camera_index
+            thread.isRunning.return_value = False
+            thread.signature_points = []
+            thread.current_finger_position = (0, 0)
+            thread.fps_cap = 30
+            thread.resolution = (640, 480)
+            thread.dev_mode = False
+            thread.min_distance = 90
+            thread.max_distance = 99.5
+            thread.min_signature_points = 200
+            thread.thumb_up_duration = 3.0
+            return thread
+
+        with patch('src.ui.main_window.VideoThread', side_effect=make_thread):
+            window = MainWindow(camera_indices=(0, 1))
+
+        self.assertEqual([thread.camera_index for thread in window.video_threads], [0, 1])
+        self.assertEqual(len(window.feeds), 2)
+        self.assertIs(window.VideoThread, window.video_threads[0])
+        window.video_threads[1].ImageUpdate.connect.assert_called_once_with(window.feeds[1].updateImage)
+
+        window.feeds[1].Clicked.emit()
+        self.assertIs(window.VideoThread, window.video_threads[1])
+        self.assertIs(window.camera_window, window.feeds[1])
+        for dock in (window.camera_dock, window.signature_dock, window.performance_dock):
+            self.assertIs(dock.VideoThread, window.video_threads[1])
+
+        window.closeEvent(MagicMock())
+        for thread in window.video_threads:
+            thread.ImageUpdate.disconnect.assert_called_once()
+        window.close()
+
 
 if __name__ == '__main__':
     unittest.main()
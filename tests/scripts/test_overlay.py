@@ -0,0 +1,66 @@
+import unittest
+
+import cv2
+import numpy as np
+
+from src.utils.overlay import OverlayCache
+
+
+class TestOverlayCache(unittest.TestCase):
+    """Test cases for the OverlayCache class."""
+
+    def setUp(self):
+        """Set up tests fixtures before each tests method."""
+        self.cache = OverlayCache(max_sprites=3)
+        self.frame = np.full((480, 640, 3), 40, dtype=np.uint8)
+
+    def test_text_matches_put_text(self):
+        """Test that a cached text sprite draws the same pixels as cv2.putText."""
+        expected = self.frame.copy()
+        cv2.putText(expected, "Saving 42%", (200, 300), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
+
+        self.cache.draw_text(self.frame, "Saving 42%", (200, 300), 0.6, (255, 255, 255))
+
+        np.testing.assert_array_equal(self.frame, expected)
+
+    def test_progress_bar_matches_rectangles(self):
+        """Test that a cached progress bar draws the same pixels as cv2.rectangle."""
+        expected = self.frame.copy()
+        cv2.rectangle(expected, (170, 430), (470, 450), (255, 255, 255), 2)
+        cv2.rectangle(expected, (170, 430), (170 + 150, 450), (255, 0, 0), -1)
+
+        self.cache.draw_progress_bar(self.frame, (170, 430), 300, 20, 50, (255, 0, 0), (255, 255, 255))
+
+        np.testing.assert_array_equal(self.frame, expected)
+
+    def test_sprite_is_reused(self):
+        """Test that the same message is rendered only once."""
+        first = self.cache.text_sprite("Signature Saved!", 1, (0, 255, 0))
+        second = self.cache.text_sprite("Signature Saved!", 1, (0, 255, 0))
+
+        self.assertIs(first, second)
+        self.assertEqual(self.cache.misses, 1)
+        self.assertEqual(self.cache.hits, 1)
+
+    def test_lru_eviction(self):
+        """Test that the least recently used sprite is evicted."""
+        a = self.cache.text_sprite("a", 1, (0, 255, 0))
+        self.cache.text_sprite("b", 1, (0, 255, 0))
+        self.cache.text_sprite("c", 1, (0, 255, 0))
+        self.cache.text_sprite("a", 1, (0, 255, 0))  # Touch "a" so "b" becomes the oldest
+        self.cache.text_sprite("d", 1, (0, 255, 0))
+
+        self.assertEqual(len(self.cache), 3)
+        self.assertIs(self.cache.text_sprite("a", 1, (0, 255, 0)), a)
+        misses = self.cache.misses
+        self.cache.text_sprite("b", 1, (0, 255, 0))
+        self.assertEqual(self.cache.misses, misses + 1)
+
+    def test_blend_is_clipped_to_frame(self):
+        """Test that sprites partially outside the frame are clipped."""
+        self.cache.draw_text(self.frame, "Edge", (630, 5), 1, (0, 0, 255))
+        self.assertEqual(self.frame.shape, (480, 640, 3))
+
+
+if __name__ == '__main__':
+    unittest.main()
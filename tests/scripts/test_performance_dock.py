@@ -0,0 +1,84 @@
+import sys
+import unittest
+from unittest.mock import MagicMock
+
+from PySide6.QtWidgets import QApplication
+
+from src.ui.dock.performance_dock import PerformanceDock
+
+
+class TestPerformanceDock(unittest.TestCase):
+    """Test suite for the PerformanceDock class."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up the QApplication once for all tests."""
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def setUp(self):
+        """Set up each tests by creating a PerformanceDock instance."""
+        # Mock the capture session the dock controls
+        self.mock_video_thread = MagicMock()
+        self.mock_video_thread.performance_stats.return_value = {
+            "fps": 29.64,
+            "stages": {
+                "read": {"count": 10, "mean": 2.0, "p50": 2.0, "p95": 3.5, "p99": 4.0, "max": 4.0},
+                "callback": {"count": 10, "mean": 12.0, "p50": 11.0, "p95": 18.0, "p99": 20.0, "max": 21.0},
+            },
+            "skip_ratio": 0.5,
+            "dropped_frames": 3,
+            "memory_mb": 256.4,
+        }
+
+        # Create dock widget
+        self.dock = PerformanceDock(video_thread=self.mock_video_thread)
+
+    def tearDown(self):
+        """Clean up after each tests."""
+        self.dock.close()
+
+    def test_initial_state(self):
+        """Test the initial state of the dock widget."""
+        self.assertEqual(self.dock.windowTitle(), "Performance")
+        self.assertFalse(self.dock.refreshTimer.isActive())
+
+    def test_refresh(self):
+        """Test that refresh shows the VideoThread statistics."""
+        self.dock.refresh()
+
+        self.assertEqual(self.dock.fps_label.text(), "FPS: 29.6")
+        self.assertEqual(self.dock.inference_label.text(), "Inference: 11.0 / 18.0 ms (p50/p95)")
+        self.assertEqual(self.dock.skip_label.text(), "Skip ratio: 50%")
+        self.assertEqual(self.dock.dropped_label.text(), "Dropped frames: 3")
+        self.assertEqual(self.dock.memory_label.text(), "Memory: 256 MB")
+        self.assertIn("read", self.dock.stages_label.text())
+
+    def test_refresh_pool_stats(self):
+        """Test that the queue latency of a shared inference pool is shown."""
+        stats = self.mock_video_thread.performance_stats.return_value
+        self.dock.refresh()
+        self.assertEqual(self.dock.pool_label.text(), "Inference pool: off")
+
+        stats["pool"] = {"throughput_fps": 14.96, "queue": {"p50": 2.0, "p95": 7.5}}
+        self.dock.refresh()
+        self.assertEqual(self.dock.pool_label.text(), "Inference pool: 15.0 FPS, queue 2.0 / 7.5 ms (p50/p95)")
+
+    def test_refresh_without_memory(self):
+        """Test refresh when memory usage is unavailable."""
+        self.mock_video_thread.performance_stats.return_value["memory_mb"] = None
+        self.mock_video_thread.performance_stats.return_value["stages"] = {}
+        self.dock.refresh()
+
+        self.assertEqual(self.dock.memory_label.text(), "Memory: n/a")
+        self.assertEqual(self.dock.inference_label.text(), "Inference: -")
+
+    def test_timer_follows_visibility(self):
+        """Test that the panel only refreshes while visible."""
+        self.dock.show()
+        self.assertTrue(self.dock.refreshTimer.isActive())
+        self.dock.hide()
+        self.assertFalse(self.dock.refreshTimer.isActive())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+
+from src.utils.profiler import LatencyHistogram, StageProfiler
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    """Test cases for the LatencyHistogram class."""
+
+    def test_empty(self):
+        """Test that an empty histogram reports zeros."""
+        summary = LatencyHistogram().summary()
+        self.assertEqual(summary["count"], 0)
+        self.assertEqual(summary["p99"], 0.0)
+
+    def test_percentiles(self):
+        """Test percentiles against a uniform distribution of 1..100 ms."""
+        histogram = LatencyHistogram()
+        for ms in range(1, 101):
+            histogram.record(ms / 1000.0)
+
+        summary = histogram.summary()
+        self.assertEqual(summary["count"], 100)
+        self.assertAlmostEqual(summary["mean"], 50.5, delta=0.1)
+        # Buckets keep the relative error within a few percent
+        self.assertAlmostEqual(summary["p50"], 50, delta=50 * 0.05)
+        self.assertAlmostEqual(summary["p95"], 95, delta=95 * 0.05)
+        self.assertAlmostEqual(summary["p99"], 99, delta=99 * 0.05)
+        self.assertAlmostEqual(summary["max"], 100, delta=0.01)
+
+    def test_merge(self):
+        """Test merging two histograms."""
+        first, second = LatencyHistogram(), LatencyHistogram()
+        first.record(0.001)
+        second.record(0.002)
+        first.merge(second)
+        self.assertEqual(first.count, 2)
+        self.assertAlmostEqual(first.max_us, 2000)
+
+
+class TestStageProfiler(unittest.TestCase):
+    """Test cases for the StageProfiler class."""
+
+    def test_disabled_records_nothing(self):
+        """Test that a disabled profiler ignores stages."""
+        profiler = StageProfiler(enabled=False)
+        with profiler.stage("read"):
+            pass
+        profiler.record("emit", 0.01)
+        self.assertEqual(profiler.snapshot(), {})
+
+    def test_stage_timing(self):
+        """Test that stages are recorded in order of appearance."""
+        profiler = StageProfiler(enabled=True)
+        with profiler.stage("read"):
+            pass
+        profiler.record("emit", 0.004)
+
+        snapshot = profiler.snapshot()
+        self.assertEqual(list(snapshot), ["read", "emit"])
+        self.assertEqual(snapshot["read"]["count"], 1)
+        self.assertAlmostEqual(snapshot["emit"]["p50"], 4.0, delta=0.2)
+
+    def test_rolling_window(self):
+        """Test that old windows are forgotten."""
+        profiler = StageProfiler(enabled=True, window_seconds=0)
+        profiler.record("read", 0.001)
+        profiler.record("read", 0.001)
+        profiler.record("read", 0.001)
+        # Only the current and the previous window are kept
+        self.assertEqual(profiler.histogram("read").count, 2)
+
+    def test_reset(self):
+        """Test resetting the profiler."""
+        profiler = StageProfiler(enabled=True)
+        profiler.record("read", 0.001)
+        profiler.reset()
+        self.assertEqual(profiler.stages(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
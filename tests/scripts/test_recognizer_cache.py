@@ -0,0 +1,78 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.model.recognizer_cache import RecognizerCache
+
+
+class TestRecognizerCache(unittest.TestCase):
+    """Test cases for the process-wide recognizer cache."""
+
+    def setUp(self):
+        """Set up tests fixtures before each tests method."""
+        self.cache = RecognizerCache()
+        self.factory = MagicMock(side_effect=lambda callback: MagicMock())
+
+    def test_model_bytes_read_once(self):
+        """Test that a model file is read from disk only once."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "model.task")
+            with open(path, "wb") as f:
+                f.write(b"model")
+            self.assertEqual(self.cache.model_bytes(path), b"model")
+            os.remove(path)
+            self.assertEqual(self.cache.model_bytes(path), b"model")
+
+        with patch('sys.stdout'):
+            self.assertIsNone(self.cache.model_bytes(path + ".missing"))
+
+    def test_resource_path_resolved_once(self):
+        """Test that resource paths are resolved once."""
+        resolver = MagicMock(return_value="/models/gesture_recognizer.task")
+        for _ in range(3):
+            self.cache.resource_path("models/gesture_recognizer.task", resolver)
+        resolver.assert_called_once()
+
+    def test_reuse_and_dispatch(self):
+        """Test that a released recognizer is reused and results reach the current listener."""
+        first_listener, second_listener = MagicMock(), MagicMock()
+        warm_up = MagicMock(side_effect=lambda lease: lease.recognize_async("blank", 0))
+
+        with self.cache.acquire("key", self.factory, first_listener, warm_up) as lease:
+            recognizer = lease.recognizer
+            lease.recognize_async("frame", 0)
+            dispatch = self.factory.call_args.args[0]
+            dispatch("result", "image", 1)
+        first_listener.assert_called_once_with("result", "image", 0)
+
+        with self.cache.acquire("key", self.factory, second_listener, warm_up) as lease:
+            self.assertIs(lease.recognizer, recognizer)
+            lease.recognize_async("frame", 0)
+            # A late result of the previous lease is not delivered to the new listener
+            dispatch("late", "image", 1)
+            dispatch("result", "image", 2)
+
+        self.factory.assert_called_once()
+        warm_up.assert_called_once()
+        second_listener.assert_called_once_with("result", "image", 0)
+        self.assertEqual([call.args[1] for call in recognizer.recognize_async.call_args_list], [0, 1, 2])
+
+    def test_concurrent_leases(self):
+        """Test that a recognizer in use is not handed out twice and that options are separate."""
+        first = self.cache.acquire("key", self.factory)
+        second = self.cache.acquire("key", self.factory)
+        other = self.cache.acquire("other", self.factory)
+        self.assertIsNot(first.recognizer, second.recognizer)
+        self.assertEqual(self.factory.call_count, 3)
+
+        recognizers = [lease.recognizer for lease in (first, second, other)]
+        for lease in (first, second, other):
+            lease.release()
+        self.cache.clear()
+        for recognizer in recognizers:
+            recognizer.close.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.model.landmarks import LandmarkResult
+from src.model.session_log import SessionLog, SessionRecorder, replay_session, RECORD, HEADER, LANDMARKS_SIZE
+from src.model.signature import SignatureRecognition
+from src.video_thread import VideoThread
+from tests.scripts.gesture_results import gesture_result
+
+
+class TestSessionLog(unittest.TestCase):
+    """Test cases for session recording and replay."""
+
+    def setUp(self):
+        """Set up tests fixtures before each tests method."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "session.vsl")
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.directory.cleanup()
+
+    def record(self, results):
+        with patch('sys.stdout'):
+            recorder = SessionRecorder(self.path, 320, 240)
+            for i, result in enumerate(results):
+                recorder.record(10.0 + i / 30, result, i)
+            recorder.close()
+
+    def test_round_trip(self):
+        """Test that results are read back as recorded."""
+        first = gesture_result(1, 0.25, 0.5)
+        self.record([None, first, first, LandmarkResult.empty()])
+
+        log = SessionLog(self.path)
+        frames = list(log)
+
+        self.assertEqual((log.width, log.height), (320, 240))
+        self.assertEqual(len(frames), 4)
+        self.assertIsNone(frames[0][1])
+        self.assertAlmostEqual(frames[1][0], 1 / 30)
+        self.assertEqual(frames[1][1].gestures[0][0].category_name, "Pointing_Up")
+        self.assertAlmostEqual(frames[1][1].hand_landmarks[0][8].x, 0.25)
+        # A repeated result is stored without payload and replayed as the same object
+        self.assertIs(frames[2][1], frames[1][1])
+        self.assertEqual(frames[3][1].hand_landmarks, [])
+
+    def test_compact_size(self):
+        """Test that repeated results do not store landmarks again."""
+        result = gesture_result(1, 0.5, 0.5)
+        self.record([result, result, result])
+        self.assertEqual(os.path.getsize(self.path), HEADER.size + 3 * RECORD.size + LANDMARKS_SIZE)
+
+    def test_invalid_file(self):
+        """Test that other files are rejected."""
+        with open(self.path, "wb") as f:
+            f.write(b"not a session log")
+        with self.assertRaises(ValueError):
+            SessionLog(self.path)
+
+    def test_replay_draws(self):
+        """Test that a replayed session draws on the board without MediaPipe."""
+        self.record([gesture_result(1, 0.2 + i * 0.01, 0.5) for i in range(10)])
+
+        thread = VideoThread()
+        with patch('sys.stdout'):
+            thread.sign_model = SignatureRecognition()
+            count = replay_session(SessionLog(self.path), thread)
+
+        self.assertEqual(count, 10)
+        self.assertEqual(len(thread.signature_points), 9)
+        self.assertGreater(thread.drawing_board.sum(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
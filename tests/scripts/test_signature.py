@@ -2,13 +2,18 @@ import unittest
 from unittest.mock import patch, MagicMock, Mock
 import os
 import sys
+import threading
 import cv2
 import numpy as np
 import mediapipe as mp
 from mediapipe.tasks.python.vision import GestureRecognizerResult
 
 # Import the class to tests
+from src.model.gesture_state import GestureStateMachine
+from src.model.landmarks import GESTURE_NAMES
+from src.model.recognizer_cache import recognizer_cache
 from src.model.signature import SignatureRecognition
+from src.utils.profiler import StageProfiler
 
 
 class TestSignatureRecognition(unittest.TestCase):
@@ -18,6 +23,10 @@ class TestSignatureRecognition(unittest.TestCase):
         """Set up tests fixtures before each tests method."""
         self.signature_recognition = SignatureRecognition()
 
+    def tearDown(self):
+        """Forget recognizers cached by the tests."""
+        recognizer_cache.idle.clear()
+
     def test_init(self):
         """Test initialization of SignatureRecognition class."""
         self.assertIsNone(self.signature_recognition.gesture_result)
@@ -56,6 +65,18 @@ class TestSignatureRecognition(unittest.TestCase):
 
         self.assertEqual(self.signature_recognition.gesture_result, mock_result)
 
+    def test_callback_latency(self):
+        """Test that callback latency and dropped frames are tracked by the profiler."""
+        profiler = StageProfiler(enabled=True)
+        self.signature_recognition.profiler = profiler
+
+        self.signature_recognition.mark_submitted(1)
+        self.signature_recognition.mark_submitted(2)
+        self.signature_recognition.set_gesture_result(MagicMock(), MagicMock(), 2)
+
+        self.assertEqual(profiler.histogram("callback").count, 1)
+        self.assertEqual(self.signature_recognition.dropped_frames, 1)
+
     @patch('mediapipe.tasks.python.vision.GestureRecognizer.create_from_options')
     def test_setup_recognizer(self, mock_create):
         """Test setup of gesture recognizer."""
@@ -67,6 +88,27 @@ class TestSignatureRecognition(unittest.TestCase):
         self.assertEqual(result, mock_recognizer)
         mock_create.assert_called_once()
 
+    @patch('mediapipe.tasks.python.vision.GestureRecognizer.create_from_options')
+    def test_allowlist_covers_handled_gestures(self, mock_create):
+        """Test that the recognizer may report every gesture the gesture state machine acts on."""
+        self.signature_recognition.setup_recognizer()
+        options = mock_create.call_args.args[0]
+        allowlist = options.canned_gesture_classifier_options.category_allowlist
+        for gesture_id in GestureStateMachine.ENTER_THRESHOLDS:
+            self.assertIn(GESTURE_NAMES[gesture_id], allowlist)
+        self.assertIn("Victory", self.signature_recognition.recognizer_options()[-1])
+
+    def test_wait_for_result(self):
+        """Test waiting for the result of a submitted frame from the callback thread."""
+        self.assertFalse(self.signature_recognition.wait_for_result(0, 0.01))
+
+        callback = threading.Timer(0.05, self.signature_recognition.set_gesture_result, ("result", None, 3))
+        callback.start()
+        self.assertTrue(self.signature_recognition.wait_for_result(3, 5))
+        callback.join()
+        self.assertEqual(self.signature_recognition.completed_results, 1)
+        self.assertTrue(self.signature_recognition.wait_for_result(2, 0))
+
     def test_convert_frame_to_mediapipe_image(self):
         """Test conversion of OpenCV frame to MediaPipe image."""
         # Create a mock frame (3x3 BGR image)
@@ -191,10 +233,32 @@ class TestSignatureRecognition(unittest.TestCase):
         mock_recognizer = MagicMock()
         mock_create.return_value = mock_recognizer
 
-        result = self.signature_recognition.recognizer_context_manager()
+        with self.signature_recognition.recognizer_context_manager() as lease:
+            self.assertEqual(lease.recognizer, mock_recognizer)
+            lease.recognize_async(MagicMock(), 0)
+
+        # The recognizer stays open and is reused with timestamps after the ones it has seen
+        with SignatureRecognition().recognizer_context_manager() as lease:
+            self.assertEqual(lease.recognizer, mock_recognizer)
+            lease.recognize_async(MagicMock(), 0)
 
-        self.assertEqual(result, mock_recognizer)
         mock_create.assert_called_once()
+        mock_recognizer.close.assert_not_called()
+        timestamps = [call.args[1] for call in mock_recognizer.recognize_async.call_args_list]
+        self.assertEqual(timestamps, [0, 1, 2])
+
+    @patch('mediapipe.tasks.python.vision.GestureRecognizer.create_from_options')
+    def test_image_mode_warm_up(self, mock_create):
+        """Test that a new IMAGE mode recognizer is warmed up through its lease."""
+        mock_recognizer = MagicMock()
+        mock_create.return_value = mock_recognizer
+
+        with SignatureRecognition(running_mode="IMAGE").recognizer_context_manager() as lease:
+            lease.recognize(MagicMock())
+
+        self.assertEqual(mock_recognizer.recognize.call_count, 2)
+        mock_recognizer.recognize_async.assert_not_called()
+        mock_recognizer.recognize_for_video.assert_not_called()
 
 
 if __name__ == '__main__':
@@ -1,6 +1,6 @@
 import sys
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 from PySide6.QtCore import Qt
 from PySide6.QtTest import QTest
@@ -19,12 +19,8 @@ class TestSignatureSettingsDock(unittest.TestCase):
 
     def setUp(self):
         """Set up each tests by creating a SignatureSettingsDock instance."""
-        # Mock VideoThread
-        self.video_thread_patcher = patch('src.ui.dock.signature_settings_dock.VideoThread')
-        self.mock_video_thread_class = self.video_thread_patcher.start()
+        # Mock the capture session the dock controls
         self.mock_video_thread = MagicMock()
-        self.mock_video_thread_class.return_value = self.mock_video_thread
-        self.mock_video_thread.get_instance.return_value = self.mock_video_thread
 
         # Set default values for mock VideoThread
         self.mock_video_thread.dev_mode = False
@@ -35,11 +31,10 @@ class TestSignatureSettingsDock(unittest.TestCase):
         self.mock_video_thread.drawing_board = None
 
         # Create dock widget
-        self.dock = SignatureSettingsDock()
+        self.dock = SignatureSettingsDock(video_thread=self.mock_video_thread)
 
     def tearDown(self):
         """Clean up after each tests."""
-        self.video_thread_patcher.stop()
         self.dock.close()
 
     def test_initial_state(self):
@@ -183,6 +178,19 @@ class TestSignatureSettingsDock(unittest.TestCase):
         # Check that clear_drawing_board was not called
         self.mock_video_thread.clear_drawing_board.assert_not_called()
 
+    def test_undo_redo_stroke(self):
+        """Test the undo and redo stroke buttons."""
+        self.mock_video_thread.drawing_board = MagicMock()
+        self.dock.undo_button.click()
+        self.mock_video_thread.undo_stroke.assert_called_once()
+        self.dock.redo_button.click()
+        self.mock_video_thread.redo_stroke.assert_called_once()
+
+        # Nothing to undo without a drawing board
+        self.mock_video_thread.drawing_board = None
+        self.dock.on_undo_stroke()
+        self.mock_video_thread.undo_stroke.assert_called_once()
+
     def test_reset_settings(self):
         """Test resetting all settings to default values."""
         # Change all settings from default
@@ -248,6 +256,26 @@ class TestSignatureSettingsDock(unittest.TestCase):
         self.assertEqual(self.dock.save_duration_slider.minimum(), 1)
         self.assertEqual(self.dock.save_duration_slider.maximum(), 10)
 
+    def test_set_video_thread(self):
+        """Test that switching sessions shows the settings of the new one."""
+        other = MagicMock()
+        other.dev_mode = True
+        other.min_distance = 80
+        other.max_distance = 99.0
+        other.min_signature_points = 300
+        other.thumb_up_duration = 5.0
+
+        self.dock.setVideoThread(other)
+
+        self.assertIs(self.dock.VideoThread, other)
+        self.assertTrue(self.dock.dev_mode_checkbox.isChecked())
+        self.assertEqual(self.dock.min_distance_slider.value(), 80)
+        self.assertEqual(self.dock.min_points_slider.value(), 300)
+        self.assertEqual(self.dock.save_duration_value.text(), "5s")
+        # Syncing the widgets does not write back to either session
+        self.assertEqual(self.mock_video_thread.min_distance, 90)
+        self.assertEqual(other.max_distance, 99.0)
+
 
 if __name__ == '__main__':
     unittest.main()
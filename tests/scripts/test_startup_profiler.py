@@ -0,0 +1,57 @@
+import os
+import tempfile
+import unittest
+
+from src.utils.startup_profiler import StartupProfiler
+
+
+class TestStartupProfiler(unittest.TestCase):
+    """Test cases for the startup profiler."""
+
+    def setUp(self):
+        """Set up tests fixtures before each tests method."""
+        self.profiler = StartupProfiler()
+
+    def test_disabled(self):
+        """Test that nothing is recorded unless enabled."""
+        with self.profiler.phase("QApplication"):
+            pass
+        self.profiler.mark("window shown")
+        self.assertEqual(self.profiler.phases, [])
+        self.assertEqual(self.profiler.milestones, {})
+
+    def test_ranked_report(self):
+        """Test that phases are ranked by duration and milestones are listed."""
+        self.profiler.enabled = True
+        origin = self.profiler.origin
+        self.profiler.add("QApplication", origin, origin + 0.05)
+        self.profiler.add("import cv2", origin + 0.05, origin + 0.25)
+        self.profiler.mark("window shown")
+
+        ranked = self.profiler.ranked()
+        self.assertEqual([name for name, _, _ in ranked], ["import cv2", "QApplication"])
+        self.assertAlmostEqual(ranked[0][1], 0.2)
+
+        report = self.profiler.format_report()
+        self.assertIn("| 1 | import cv2 | 200.0 | 50.0 |", report)
+        self.assertIn("| window shown |", report)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "startup.md")
+            self.profiler.write(path)
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(f.read(), report)
+
+    def test_once_and_imports(self):
+        """Test that once() records only the first occurrence and imports are timed per module."""
+        self.profiler.enabled = True
+        for _ in range(2):
+            with self.profiler.once("camera open"):
+                pass
+        self.profiler.time_imports(["json", "csv"])
+        self.assertEqual([name for name, _, _ in self.profiler.phases],
+                         ["camera open", "import json", "import csv"])
+
+
+if __name__ == '__main__':
+    unittest.main()
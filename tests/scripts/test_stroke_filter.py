@@ -0,0 +1,95 @@
+import unittest
+
+import numpy as np
+
+from src.model.stroke_filter import OneEuroFilter, StrokeFilter, simplify
+
+
+class TestOneEuroFilter(unittest.TestCase):
+    """Test cases for the One Euro filter."""
+
+    def test_first_point_unchanged(self):
+        """Test that a stroke starts exactly where the finger is."""
+        self.assertEqual(OneEuroFilter()(10, 20, 0.0), (10, 20))
+
+    def test_jitter_reduced(self):
+        """Test that jitter around a resting fingertip is smoothed out."""
+        rng = np.random.default_rng(0)
+        jitter = rng.normal(0, 3, size=(90, 2))
+        one_euro = OneEuroFilter()
+        filtered = np.array([one_euro(100 + dx, 100 + dy, i / 30) for i, (dx, dy) in enumerate(jitter)])
+        self.assertLess(filtered[30:].std(axis=0).max(), jitter[30:].std(axis=0).min() / 2)
+
+    def test_fast_movement_followed(self):
+        """Test that the lag stays small while the finger moves fast."""
+        one_euro = OneEuroFilter()
+        for i in range(30):
+            x, _ = one_euro(i * 20, 0, i / 30)
+        self.assertGreater(x, 29 * 20 - 40)
+
+    def test_repeated_timestamp(self):
+        """Test that a point with the timestamp of the previous one leaves the filter unchanged."""
+        one_euro = OneEuroFilter()
+        one_euro(0, 0, 1.0)
+        self.assertEqual(one_euro(50, 50, 1.0), (0, 0))
+
+    def test_reset(self):
+        """Test that a reset filter starts over at the next point."""
+        one_euro = OneEuroFilter()
+        one_euro(0, 0, 0.0)
+        one_euro.reset()
+        self.assertEqual(one_euro(50, 50, 0.1), (50, 50))
+
+
+class TestSimplify(unittest.TestCase):
+    """Test cases for Ramer-Douglas-Peucker decimation."""
+
+    def test_straight_line(self):
+        """Test that a straight line keeps only its end points."""
+        points = [(x, 10) for x in range(100)]
+        self.assertEqual(simplify(points, 1.0), [(0, 10), (99, 10)])
+
+    def test_corner_kept(self):
+        """Test that corners farther than epsilon from the chord are kept."""
+        points = [(x, 0) for x in range(50)] + [(49, y) for y in range(1, 50)]
+        self.assertEqual(simplify(points, 1.0), [(0, 0), (49, 0), (49, 49)])
+
+    def test_within_epsilon(self):
+        """Test that every dropped point lies within epsilon of the decimated polyline."""
+        t = np.linspace(0, 2 * np.pi, 300)
+        points = [(int(100 + 80 * np.cos(a)), int(100 + 50 * np.sin(2 * a))) for a in t]
+        kept = simplify(points, 1.5)
+        self.assertLess(len(kept), len(points) / 4)
+        for x, y in points:
+            distances = []
+            for (x0, y0), (x1, y1) in zip(kept, kept[1:]):
+                segment = np.array([x1 - x0, y1 - y0], dtype=float)
+                offset = np.array([x - x0, y - y0], dtype=float)
+                t = np.clip(offset @ segment / max(segment @ segment, 1e-9), 0, 1)
+                distances.append(np.hypot(*(offset - t * segment)))
+            self.assertLessEqual(min(distances), 1.5 + 1e-9)
+
+    def test_short_and_closed_strokes(self):
+        """Test strokes too short to decimate and strokes ending where they start."""
+        self.assertEqual(simplify([(1, 1)], 1.0), [(1, 1)])
+        self.assertEqual(simplify([(1, 1), (2, 2)], 1.0), [(1, 1), (2, 2)])
+        loop = [(0, 0), (10, 0), (10, 10), (0, 0)]
+        self.assertEqual(simplify(loop, 1.0), loop)
+
+
+class TestStrokeFilter(unittest.TestCase):
+    """Test cases for the stroke stage of the drawing board."""
+
+    def test_smooth_returns_pixels(self):
+        """Test that smoothed positions are whole pixels and restart with each stroke."""
+        stroke_filter = StrokeFilter()
+        stroke_filter.smooth(0, 0, 0.0)
+        x, y = stroke_filter.smooth(10, 10, 1 / 30)
+        self.assertIsInstance(x, int)
+        self.assertLess(x, 10)
+        stroke_filter.begin()
+        self.assertEqual(stroke_filter.smooth(40, 40, 2 / 30), (40, 40))
+
+
+if __name__ == '__main__':
+    unittest.main()
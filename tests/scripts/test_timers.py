@@ -0,0 +1,56 @@
+import unittest
+
+from src.utils.timers import ManualClock, Timers
+
+
+class TestTimers(unittest.TestCase):
+    """Test cases for the timeouts of a capture session."""
+
+    def setUp(self):
+        """Set up timers on a clock moved by the tests."""
+        self.clock = ManualClock(100.0)
+        self.timers = Timers(self.clock)
+
+    def test_timer_lifecycle(self):
+        """Test that a timer is active for its duration and expired afterwards."""
+        self.assertFalse(self.timers.started("message"))
+        self.assertFalse(self.timers.active("message"))
+        self.assertIsNone(self.timers.elapsed("message"))
+
+        self.timers.start("message", 2.0)
+        self.clock.set(101.5)
+        self.assertTrue(self.timers.active("message"))
+        self.assertFalse(self.timers.expired("message"))
+        self.assertEqual(self.timers.elapsed("message"), 1.5)
+        self.assertEqual(self.timers.progress("message"), 0.75)
+
+        self.clock.set(102.0)
+        self.assertFalse(self.timers.active("message"))
+        self.assertTrue(self.timers.expired("message"))
+        self.assertTrue(self.timers.started("message"))
+        self.assertEqual(self.timers.progress("message"), 1.0)
+
+    def test_cancel_and_reset(self):
+        """Test that cancelled timers are neither active nor expired."""
+        self.timers.start("thumb_up", 3.0)
+        self.timers.start("cooldown", 1.0)
+        self.timers.cancel("thumb_up")
+        self.timers.cancel("unknown")
+        self.assertFalse(self.timers.started("thumb_up"))
+        self.assertTrue(self.timers.active("cooldown"))
+
+        self.timers.reset()
+        self.assertFalse(self.timers.started("cooldown"))
+        self.assertEqual(self.timers.progress("cooldown"), 0.0)
+
+    def test_restart(self):
+        """Test that starting a running timer starts it again."""
+        self.timers.start("warning", 2.0)
+        self.clock.set(101.9)
+        self.timers.start("warning", 2.0)
+        self.clock.set(103.0)
+        self.assertTrue(self.timers.active("warning"))
+
+
+if __name__ == '__main__':
+    unittest.main()
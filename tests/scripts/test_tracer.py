@@ -0,0 +1,98 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from src.utils.profiler import StageProfiler
+from src.utils.tracer import ChromeTracer
+
+
+class TestChromeTracer(unittest.TestCase):
+    """Test cases for the ChromeTracer class."""
+
+    def setUp(self):
+        """Set up tests fixtures before each tests method."""
+        self.directory = tempfile.mkdtemp()
+        self.tracer = ChromeTracer(self.directory, file_duration=3600, max_files=2)
+
+    def tearDown(self):
+        """Stop the writer and remove the trace directory."""
+        self.tracer.close()
+        shutil.rmtree(self.directory)
+
+    def load(self, path):
+        with open(path) as f:
+            return json.load(f)["traceEvents"]
+
+    def test_span_written_as_complete_event(self):
+        """Test that spans are written in Chrome trace format with thread names."""
+        self.tracer.name_thread("VideoThread")
+        with self.tracer.span("read"):
+            pass
+
+        events = self.load(self.tracer.flush())
+        metadata = [e for e in events if e["ph"] == "M"]
+        spans = [e for e in events if e["ph"] == "X"]
+
+        self.assertEqual(metadata[0]["args"]["name"], "VideoThread")
+        self.assertEqual(spans[0]["name"], "read")
+        self.assertEqual(spans[0]["tid"], threading.get_ident())
+        self.assertGreaterEqual(spans[0]["dur"], 0)
+
+    def test_rotation(self):
+        """Test that only the newest files are kept."""
+        for i in range(4):
+            self.tracer.add_span("frame", i, i + 0.01)
+            self.tracer.flush()
+
+        self.assertEqual(sorted(os.listdir(self.directory)), ["trace_2.json", "trace_3.json"])
+
+    def test_rotation_with_empty_intervals(self):
+        """Test that intervals without events neither use a file number nor keep old files."""
+        for i in range(4):
+            self.tracer.add_span("frame", i, i + 0.01)
+            self.tracer.flush()
+            self.assertIsNone(self.tracer.flush())
+
+        self.assertEqual(sorted(os.listdir(self.directory)), ["trace_2.json", "trace_3.json"])
+
+    def test_written_by_writer_thread(self):
+        """Test that a span closing an interval is written by the writer thread, and close writes the rest."""
+        written = threading.Event()
+        flush = self.tracer.flush
+
+        def record_flush():
+            path = flush()
+            if path is not None and threading.current_thread().name == "ChromeTracer":
+                written.set()
+            return path
+
+        self.tracer.flush = record_flush
+        self.tracer.add_span("paint", 0, self.tracer._file_start + 3601)
+        self.assertTrue(written.wait(5))
+        self.assertEqual(os.listdir(self.directory), ["trace_0.json"])
+
+        self.tracer.add_span("paint", 0, 0.01)
+        self.tracer.close()
+        self.assertEqual(sorted(os.listdir(self.directory)), ["trace_0.json", "trace_1.json"])
+
+    def test_empty_flush(self):
+        """Test that nothing is written without events."""
+        self.assertIsNone(self.tracer.flush())
+
+    def test_profiler_forwards_stages(self):
+        """Test that a disabled profiler still forwards stages to an attached tracer."""
+        profiler = StageProfiler(enabled=False)
+        profiler.tracer = self.tracer
+        with profiler.stage("emit"):
+            pass
+
+        spans = [e for e in self.load(self.tracer.flush()) if e["ph"] == "X"]
+        self.assertEqual([e["name"] for e in spans], ["emit"])
+        self.assertEqual(profiler.snapshot(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,7 +5,10 @@ from unittest.mock import MagicMock, patch
 import numpy as np
 from PySide6.QtWidgets import QApplication
 
+from src.model.inference_process import InferenceProcessDied
+from src.utils.timers import ManualClock
 from src.video_thread import VideoThread
+from tests.scripts.gesture_results import gesture_result
 
 
 class TestVideoThread(unittest.TestCase):
@@ -18,9 +21,6 @@ class TestVideoThread(unittest.TestCase):
 
     def setUp(self):
         """Set up each tests by creating a VideoThread instance."""
-        # Since VideoThread is a singleton, we need to reset it
-        VideoThread._instance = None
-
         # Mock cv2.VideoCapture to avoid actual camera access
         self.patcher = patch('src.video_thread.cv2.VideoCapture')
         self.mock_capture = self.patcher.start()
@@ -47,10 +47,15 @@ class TestVideoThread(unittest.TestCase):
         if self.video_thread.isRunning():
             self.video_thread.stop()
 
-    def test_singleton(self):
-        """Test that VideoThread is a singleton."""
-        video_thread_2 = VideoThread()
-        self.assertIs(self.video_thread, video_thread_2)
+    def test_independent_sessions(self):
+        """Test that each VideoThread is a separate camera session."""
+        video_thread_2 = VideoThread(camera_index=1)
+        self.assertIsNot(self.video_thread, video_thread_2)
+        self.assertEqual(video_thread_2.camera_index, 1)
+        self.assertEqual(self.video_thread.camera_index, 0)
+
+        video_thread_2.signature_points.append((1, 1))
+        self.assertEqual(self.video_thread.signature_points, [])
 
     def test_change_settings(self):
         """Test changing settings in the VideoThread."""
@@ -75,6 +80,92 @@ class TestVideoThread(unittest.TestCase):
         self.assertEqual(self.video_thread.fps_cap, new_fps_cap)
         self.assertEqual(self.video_thread.resolution, new_resolution)
 
+    def test_change_settings_while_capturing(self):
+        """Test that settings changed while capturing are applied to the open source."""
+        source = MagicMock()
+        source.configure.return_value = True
+        source.frame_size = (1280, 720)
+        self.video_thread.source = source
+        self.video_thread.init_drawing_board(640, 480)
+        self.video_thread.signature_points = [(320, 240)]
+        self.video_thread.ThreadActive = True
+
+        self.video_thread.change_settings(fps_cap=60, resolution=(1280, 720))
+        self.assertTrue(self.video_thread.is_changing_settings)
+        self.assertTrue(self.video_thread.apply_settings())
+
+        # The camera is re-parameterised in place and the drawing is scaled to the new size
+        source.configure.assert_called_once_with(60, (1280, 720))
+        source.release.assert_not_called()
+        self.assertEqual(self.video_thread.drawing_board.shape, (720, 1280, 3))
+        self.assertEqual(self.video_thread.signature_points, [(640, 360)])
+        self.assertEqual(self.video_thread.skip_frames, 1)
+        self.assertFalse(self.video_thread.is_changing_settings)
+        self.assertEqual(self.video_thread.pending_settings, {})
+        self.video_thread.ThreadActive = False
+
+    @patch('src.video_thread.CameraSource')
+    def test_change_camera_while_capturing(self, mock_camera_source):
+        """Test that a camera change reopens the source."""
+        old_source = MagicMock()
+        self.video_thread.source = old_source
+        self.video_thread.init_drawing_board(640, 480)
+        new_source = mock_camera_source.return_value
+        new_source.open.return_value = True
+        new_source.frame_size = (640, 480)
+        self.video_thread.ThreadActive = True
+
+        self.video_thread.change_settings(camera_index=1)
+        self.assertTrue(self.video_thread.apply_settings())
+
+        old_source.release.assert_called_once()
+        mock_camera_source.assert_called_once_with(1, self.video_thread.fps_cap, self.video_thread.resolution,
+                                                   prober=None)
+        self.assertIs(self.video_thread.source, new_source)
+        self.video_thread.ThreadActive = False
+
+    @patch('src.video_thread.CameraSource')
+    def test_change_camera_fails(self, mock_camera_source):
+        """Test that capture stops and reports it when the new camera cannot be opened."""
+        self.video_thread.source = MagicMock()
+        mock_camera_source.return_value.open.return_value = False
+        failed = MagicMock()
+        self.video_thread.CaptureFailed.connect(failed)
+        self.video_thread.ThreadActive = True
+
+        self.video_thread.change_settings(camera_index=1)
+        self.assertFalse(self.video_thread.apply_settings())
+
+        self.assertFalse(self.video_thread.ThreadActive)
+        self.assertFalse(self.video_thread.is_changing_settings)
+        failed.assert_called_once()
+        self.assertIn("camera 1", failed.call_args.args[0])
+
+    def test_inference_process_died(self):
+        """Test that capture stops and reports it when the inference process has died."""
+        source = MagicMock()
+        source.read.return_value = (True, np.zeros((48, 64, 3), dtype=np.uint8))
+        self.video_thread.source = source
+
+        def camera_init():
+            self.video_thread.init_drawing_board(64, 48)
+            return True
+
+        recognizer = MagicMock()
+        recognizer.recognize_async.side_effect = InferenceProcessDied("Inference process exited with code -9")
+        failed = MagicMock()
+        self.video_thread.CaptureFailed.connect(failed)
+        self.video_thread.ThreadActive = True
+        with patch.object(self.video_thread, 'camera_init', side_effect=camera_init), \
+                patch.object(self.video_thread, 'open_recognizer') as open_recognizer:
+            open_recognizer.return_value.__enter__.return_value = recognizer
+            self.video_thread.run()
+
+        self.assertFalse(self.video_thread.ThreadActive)
+        source.release.assert_called_once()
+        failed.assert_called_once()
+        self.assertIn("exited with code -9", failed.call_args.args[0])
+
     def test_camera_init(self):
         """Test camera initialization."""
         # Call camera_init
@@ -93,9 +184,11 @@ class TestVideoThread(unittest.TestCase):
         self.video_thread.window_width = 640
         self.video_thread.window_height = 480
         self.video_thread.drawing_board = np.ones((480, 640, 3), dtype=np.uint8)
+        self.video_thread.ink_bounds = (0, 0, 640, 480)
         self.video_thread.previous_x = 100
         self.video_thread.previous_y = 100
         self.video_thread.signature_points = [(10, 10), (20, 20)]
+        board = self.video_thread.drawing_board
 
         # Set up a mock for StatusUpdate.emit
         self.video_thread.StatusUpdate = MagicMock()
@@ -103,16 +196,29 @@ class TestVideoThread(unittest.TestCase):
         # Clear drawing board
         self.video_thread.clear_drawing_board()
 
-        # Check that drawing board was cleared
+        # Check that drawing board was cleared in place
+        self.assertIs(self.video_thread.drawing_board, board)
         self.assertTrue(np.all(self.video_thread.drawing_board == 0))
+        self.assertIsNone(self.video_thread.ink_bounds)
         self.assertIsNone(self.video_thread.previous_x)
         self.assertIsNone(self.video_thread.previous_y)
         self.assertEqual(self.video_thread.signature_points, [])
         self.assertEqual(self.video_thread.current_finger_position, (0, 0))
 
-        # Check that StatusUpdate was emitted
+        # Check that StatusUpdate was emitted, and not again when there is nothing to clear
+        self.video_thread.StatusUpdate.emit.assert_called_once()
+        self.video_thread.clear_drawing_board()
         self.video_thread.StatusUpdate.emit.assert_called_once()
 
+    def test_clear_only_dirty_region(self):
+        """Test that clearing leaves the board outside the ink box untouched."""
+        self.video_thread.init_drawing_board(100, 100)
+        self.video_thread.drawing_board[:] = 1
+        self.video_thread.ink_bounds = (10, 20, 30, 40)
+        self.video_thread.clear_drawing_board()
+        self.assertEqual(self.video_thread.drawing_board[20:40, 10:30].sum(), 0)
+        self.assertEqual(self.video_thread.drawing_board.sum(), 100 * 100 * 3 - 20 * 20 * 3)
+
     def test_is_signature_valid(self):
         """Test signature validation."""
         # Set minimum signature points
@@ -195,6 +301,41 @@ class TestVideoThread(unittest.TestCase):
         hand_landmarks = [[MockLandmark(0.07) for _ in range(21)]]
         self.assertTrue(self.video_thread.check_distance(hand_landmarks))
 
+    def test_performance_stats(self):
+        """Test the statistics exposed to the performance panel."""
+        self.video_thread.dev_mode = True
+        self.video_thread.skip_frames = 1
+        self.video_thread.failed_reads = 2
+        self.video_thread.profiler.record("read", 0.002)
+
+        stats = self.video_thread.performance_stats()
+
+        self.assertEqual(stats["skip_ratio"], 0.5)
+        self.assertGreaterEqual(stats["dropped_frames"], 2)
+        self.assertIn("read", stats["stages"])
+
+        # Leaving dev mode disables and clears the profiler
+        self.video_thread.dev_mode = False
+        self.assertFalse(self.video_thread.profiler.enabled)
+        self.assertEqual(self.video_thread.performance_stats()["stages"], {})
+
+        # Sessions sharing an inference pool also report its queue statistics
+        self.assertEqual(stats["pool"], {})
+        self.video_thread.pool_session = MagicMock()
+        self.video_thread.pool_session.stats.return_value = {"throughput_fps": 15.0}
+        self.assertEqual(self.video_thread.performance_stats()["pool"], {"throughput_fps": 15.0})
+
+    def test_open_recognizer(self):
+        """Test that the inference process is preferred and a failing one falls back to an own recognizer."""
+        self.video_thread.sign_model = MagicMock()
+        self.video_thread.inference_process = MagicMock()
+        self.assertIs(self.video_thread.open_recognizer(), self.video_thread.inference_process.session.return_value)
+
+        self.video_thread.inference_process.session.side_effect = RuntimeError("no model")
+        with patch('sys.stdout'):
+            recognizer = self.video_thread.open_recognizer()
+        self.assertIs(recognizer, self.video_thread.sign_model.recognizer_context_manager.return_value)
+
     @patch('src.video_thread.time.time')
     def test_thread_active_state(self, mock_time):
         """Test starting and stopping the thread."""
@@ -209,5 +350,111 @@ class TestVideoThread(unittest.TestCase):
         self.assertFalse(self.video_thread.ThreadActive)
 
 
+class TestVideoThreadGestures(unittest.TestCase):
+    """Test cases for the gesture rules of VideoThread, driven by recognizer results on a manual clock."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up the QApplication once for all tests."""
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def setUp(self):
+        """Set up a session with a 100x100 board whose timers run on a manual clock."""
+        self.video_thread = VideoThread()
+        self.clock = ManualClock()
+        self.video_thread.timers.clock = self.clock
+        self.video_thread.sign_model = MagicMock()
+        self.video_thread.init_drawing_board(100, 100)
+        self.frame = np.zeros((100, 100, 3), dtype=np.uint8)
+
+    def handle(self, result, frames=1, interval=1 / 30):
+        """Handle `result` on `frames` frames, `interval` seconds apart"""
+        for _ in range(frames):
+            self.video_thread.handle_gestures(self.frame, result)
+            self.clock.set(self.clock() + interval)
+
+    @patch('src.video_thread.VideoThread.clear_drawing_board')
+    def test_thumb_down_clears_once(self, mock_clear):
+        """Test that Thumb_Down held for many frames clears the board once."""
+        self.handle(gesture_result(3), frames=60)
+        mock_clear.assert_called_once()
+
+    def test_misclassified_frame_keeps_stroke(self):
+        """Test that a single frame recognized as another gesture does not break the stroke."""
+        # Pointing_Up, one Closed_Fist frame, Pointing_Up again
+        for gesture_id, x in ((1, 0.2), (1, 0.3), (4, 0.35), (1, 0.4), (1, 0.5)):
+            self.handle(gesture_result(gesture_id, x))
+
+        self.assertEqual(len(self.video_thread.strokes), 1)
+        self.assertEqual(len(self.video_thread.strokes[0]), 4)
+
+    def test_ink_drawn_into_bounds(self):
+        """Test that ink is only drawn and composited inside the box of the board holding it."""
+        for x in (0.2, 0.3, 0.4):
+            self.handle(gesture_result(1, x))
+
+        x0, y0, x1, y1 = self.video_thread.ink_bounds
+        board = self.video_thread.drawing_board
+        self.assertGreater(board[y0:y1, x0:x1].sum(), 0)
+        board[y0:y1, x0:x1] = 0
+        self.assertEqual(board.sum(), 0)
+        self.assertTrue(all(len(point) == 3 for point in self.video_thread.strokes[0]))
+
+        self.video_thread.clear_drawing_board()
+        self.assertIsNone(self.video_thread.ink_bounds)
+
+    def test_undo_redo_stroke(self):
+        """Test that undo removes the last stroke from the board and the points, and redo brings it back."""
+        def draw(y):
+            for x in (0.2, 0.4, 0.6, 0.8):
+                self.handle(gesture_result(1, x, y))
+            # Fist ends the stroke
+            self.handle(gesture_result(4), frames=10)
+
+        draw(0.2)
+        first_board = self.video_thread.drawing_board.copy()
+        draw(0.7)
+        both_board = self.video_thread.drawing_board.copy()
+        self.assertEqual(len(self.video_thread.signature_points), 6)
+
+        # Victory held for many frames undoes a single stroke
+        self.handle(gesture_result(6), frames=20)
+        self.assertEqual(len(self.video_thread.strokes), 1)
+        self.assertEqual(len(self.video_thread.signature_points), 3)
+        np.testing.assert_array_equal(self.video_thread.drawing_board, first_board)
+
+        self.assertTrue(self.video_thread.redo_stroke())
+        self.assertEqual(len(self.video_thread.signature_points), 6)
+        # Redo draws the stored, decimated stroke, which only differs at the anti-aliased edges
+        difference = np.abs(self.video_thread.drawing_board.astype(int) - both_board)
+        self.assertLess(difference.max(), 128)
+        self.assertFalse(self.video_thread.redo_stroke())
+
+        self.assertTrue(self.video_thread.undo_stroke())
+        self.assertTrue(self.video_thread.undo_stroke())
+        self.assertIsNone(self.video_thread.ink_bounds)
+        self.assertEqual(self.video_thread.drawing_board.sum(), 0)
+        self.assertFalse(self.video_thread.undo_stroke())
+
+    @patch('src.video_thread.VideoThread.save_signature')
+    def test_save_cooldown_is_time_based(self, mock_save):
+        """Test that the save cooldown lasts the same time at any frame rate."""
+        thumb_up = gesture_result(2)
+        self.video_thread.signature_points = [(0, 0)] * self.video_thread.min_signature_points
+
+        # Thumb_Up held at 10 FPS saves once the hold duration has passed
+        while not mock_save.called:
+            self.handle(thumb_up, interval=0.1)
+        self.assertFalse(self.video_thread.timers.started("thumb_up"))
+
+        # Many frames within the cooldown do not start another hold
+        self.handle(thumb_up, frames=50, interval=0.01)
+        self.assertFalse(self.video_thread.timers.started("thumb_up"))
+
+        self.clock.set(self.clock() + self.video_thread.save_cooldown_duration)
+        self.video_thread.handle_gestures(self.frame, thumb_up)
+        self.assertTrue(self.video_thread.timers.active("thumb_up"))
+
+
 if __name__ == '__main__':
     unittest.main()
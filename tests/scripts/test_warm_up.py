@@ -0,0 +1,47 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.model.recognizer_cache import recognizer_cache
+from src.model.signature import SignatureRecognition
+from src.model.warm_up import ModelWarmUp
+
+
+class TestModelWarmUp(unittest.TestCase):
+    """Test cases for the background model warm-up."""
+
+    def tearDown(self):
+        """Forget recognizers cached by the tests."""
+        recognizer_cache.idle.clear()
+
+    @patch.object(SignatureRecognition, 'setup_recognizer')
+    def test_warm_up_preloads_recognizer(self, mock_setup):
+        """Test that the warm-up leaves a warmed-up recognizer for the first capture."""
+        recognizer = MagicMock()
+        mock_setup.return_value = recognizer
+        warm_up = ModelWarmUp()
+        finished = MagicMock()
+        warm_up.Finished.connect(finished)
+
+        with patch('sys.stdout'):
+            warm_up.run()
+
+        self.assertEqual(list(warm_up.timings), ["import mediapipe", "load model", "create recognizer"])
+        finished.assert_called_once_with(warm_up.timings)
+        recognizer.recognize_async.assert_called_once()
+
+        # Capture picks up the preloaded recognizer
+        with SignatureRecognition().recognizer_context_manager() as lease:
+            self.assertIs(lease.recognizer, recognizer)
+        mock_setup.assert_called_once()
+
+    @patch.object(SignatureRecognition, 'setup_recognizer', side_effect=RuntimeError("no model"))
+    def test_warm_up_failure(self, mock_setup):
+        """Test that a failing warm-up is reported without raising."""
+        warm_up = ModelWarmUp()
+        with patch('sys.stdout'):
+            warm_up.run()
+        self.assertNotIn("create recognizer", warm_up.timings)
+
+
+if __name__ == '__main__':
+    unittest.main()